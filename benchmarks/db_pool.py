@@ -0,0 +1,150 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from benchmarks.http_load import NAME_QUERIES, Dataset, git_revision
+from secunda.application.dto import PageDTO
+from secunda.infra.cache import BuildingIndexCache
+from secunda.infra.config import PostgresSettings
+from secunda.infra.database.session import new_engine
+from secunda.infra.repositories import OrganizationRepository
+
+DEFAULT_CONFIGS = [
+    "pool_size=5,max_overflow=0",
+    "pool_size=15,max_overflow=15",
+    "pool_size=30,max_overflow=0",
+    "pool_size=15,max_overflow=15,statement_cache_size=0",
+]
+
+Query = Callable[[OrganizationRepository], Awaitable[Any]]
+
+
+def parse_config(value: str) -> dict[str, str]:
+    overrides = {}
+    for part in filter(None, value.split(",")):
+        name, _, setting = part.partition("=")
+        overrides[name.strip()] = setting.strip()
+    return overrides
+
+
+def queries(dataset: Dataset, rng: random.Random) -> list[Query]:
+    page = PageDTO()
+
+    def by_building(repository: OrganizationRepository) -> Awaitable[Any]:
+        return repository.get_by_building_id(rng.randint(1, dataset.buildings), page)
+
+    def by_activity(repository: OrganizationRepository) -> Awaitable[Any]:
+        return repository.get_by_activity_subtree(rng.randint(1, dataset.activities), page)
+
+    def by_name(repository: OrganizationRepository) -> Awaitable[Any]:
+        return repository.search_by_name(rng.choice(NAME_QUERIES), page)
+
+    def by_ids(repository: OrganizationRepository) -> Awaitable[Any]:
+        return repository.get_by_ids([rng.randint(1, dataset.organizations) for _ in range(20)])
+
+    return [by_building, by_activity, by_name, by_ids]
+
+
+async def run_config(
+    psql_config: PostgresSettings, dataset: Dataset, requests: int, concurrency: int, warmup: int, seed: int
+) -> dict[str, Any]:
+    engine = new_engine(psql_config.async_url(), psql_config)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    index_cache = BuildingIndexCache(ttl_seconds=300.0)
+    rng = random.Random(seed)
+    workload = queries(dataset, rng)
+    latencies: list[float] = []
+    waits: list[float] = []
+    errors = 0
+    remaining = warmup + requests
+
+    async def worker() -> None:
+        nonlocal errors, remaining
+        while remaining > 0:
+            remaining -= 1
+            measured = remaining < requests
+            query = rng.choice(workload)
+            started = time.perf_counter()
+            try:
+                async with session_maker() as session:
+                    await session.connection()
+                    checked_out = time.perf_counter()
+                    await query(OrganizationRepository(session, index_cache, 0.05))
+            except Exception:
+                errors += measured
+                continue
+            if measured:
+                waits.append(checked_out - started)
+                latencies.append(time.perf_counter() - started)
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall_time = time.perf_counter() - started
+    finally:
+        await engine.dispose()
+
+    timings_ms = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(timings_ms, [50, 95, 99])
+    pool_size, max_overflow = psql_config.pool_limits()
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "statement_cache_size": psql_config.statement_cache_size,
+        "requests": requests,
+        "errors": errors,
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "checkout_wait_mean_ms": round(float(np.mean(waits)) * 1000, 3),
+        "throughput_rps": round((warmup + requests) / wall_time, 1),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Repository throughput under different pool settings")
+    parser.add_argument("--dataset", type=Path, help="dataset.json written by scripts.generate_dataset")
+    parser.add_argument(
+        "--configs", nargs="+", default=DEFAULT_CONFIGS,
+        help="PostgresSettings overrides per run, e.g. pool_size=5,max_overflow=0,statement_cache_size=0",
+    )
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=Path("db-pool-results.json"))
+    args = parser.parse_args()
+
+    dataset = Dataset.load(args.dataset)
+    report: dict[str, Any] = {
+        "revision": git_revision(),
+        "started_at": datetime.now(UTC).isoformat(),
+        "concurrency": args.concurrency,
+        "configs": {},
+    }
+    for config in args.configs:
+        result = await run_config(
+            PostgresSettings(**parse_config(config)), dataset, args.requests, args.concurrency, args.warmup, args.seed
+        )
+        report["configs"][config] = result
+        print(
+            f"{config:<55} p50 {result['p50_ms']:>8.2f} ms  p95 {result['p95_ms']:>8.2f} ms  "
+            f"checkout {result['checkout_wait_mean_ms']:>8.2f} ms  {result['throughput_rps']:>8.1f} rps  "
+            f"errors {result['errors']}"
+        )
+
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
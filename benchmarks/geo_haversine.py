@@ -0,0 +1,60 @@
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from secunda.application.services import GeoService
+
+CENTER_LAT = 55.7558
+CENTER_LON = 37.6173
+RADIUS_KM = 5.0
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def run(size: int, repeat: int, rng: np.random.Generator) -> None:
+    lats = rng.uniform(CENTER_LAT - 0.5, CENTER_LAT + 0.5, size)
+    lons = rng.uniform(CENTER_LON - 0.5, CENTER_LON + 0.5, size)
+    points = list(zip(lats.tolist(), lons.tolist()))
+
+    def scalar() -> list[bool]:
+        return [
+            GeoService.is_within_radius(CENTER_LAT, CENTER_LON, lat, lon, RADIUS_KM)
+            for lat, lon in points
+        ]
+
+    def vectorized() -> np.ndarray:
+        return GeoService.within_radius_mask(CENTER_LAT, CENTER_LON, lats, lons, RADIUS_KM)
+
+    assert np.array_equal(np.array(scalar()), vectorized())
+
+    scalar_time = best_of(repeat, scalar)
+    vectorized_time = best_of(repeat, vectorized)
+    print(
+        f"{size:>10,} points  scalar {scalar_time * 1000:>10.2f} ms  "
+        f"numpy {vectorized_time * 1000:>8.2f} ms  x{scalar_time / vectorized_time:,.0f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scalar vs NumPy haversine radius filtering")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    for size in args.sizes:
+        run(size, args.repeat, rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+import numpy as np
+
+from secunda.presentation.routers import api_router
+
+NAME_QUERIES = ("молочник", "пекарь", "мастер", "сервис", "склад", "маркет", "логист", "ремонт")
+
+
+@dataclass
+class Dataset:
+    buildings: int = 5
+    organizations: int = 7
+    activities: int = 12
+    center_lat: float = 55.7558
+    center_lon: float = 37.6173
+    spread_km: float = 15.0
+
+    @classmethod
+    def load(cls, path: Path | None) -> "Dataset":
+        if path is None:
+            return cls()
+        params = json.loads(path.read_text(encoding="utf-8"))
+        return cls(**{name: params[name] for name in cls.__dataclass_fields__ if name in params})
+
+
+@dataclass
+class RequestSpec:
+    method: str
+    url: str
+    params: dict[str, Any] | None = None
+    json: dict[str, Any] | None = None
+
+
+@dataclass
+class Scenario:
+    method: str
+    path: str
+    build: Callable[[random.Random], RequestSpec]
+    writes: bool = False
+
+    @property
+    def route(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+def scenarios(dataset: Dataset) -> list[Scenario]:
+    prefix = api_router.prefix
+    spread_deg = dataset.spread_km / 111.0
+
+    def building_id(rng: random.Random) -> int:
+        return rng.randint(1, dataset.buildings)
+
+    def organization_id(rng: random.Random) -> int:
+        return rng.randint(1, dataset.organizations)
+
+    def activity_id(rng: random.Random) -> int:
+        return rng.randint(1, dataset.activities)
+
+    def point(rng: random.Random) -> tuple[float, float]:
+        return (
+            rng.gauss(dataset.center_lat, spread_deg / 2),
+            rng.gauss(dataset.center_lon, spread_deg / 2),
+        )
+
+    def radius(rng: random.Random) -> RequestSpec:
+        lat, lon = point(rng)
+        body = {"latitude": lat, "longitude": lon, "radius_km": rng.uniform(0.5, 3.0)}
+        return RequestSpec("POST", f"{prefix}/organizations/search/radius", json=body)
+
+    def rectangle(rng: random.Random) -> RequestSpec:
+        lat, lon = point(rng)
+        half = rng.uniform(0.005, 0.03)
+        body = {"min_lat": lat - half, "max_lat": lat + half, "min_lon": lon - half, "max_lon": lon + half}
+        return RequestSpec("POST", f"{prefix}/organizations/search/rectangle", json=body)
+
+    def nearest(rng: random.Random) -> RequestSpec:
+        lat, lon = point(rng)
+        params: dict[str, Any] = {"lat": lat, "lon": lon, "k": 10}
+        if rng.random() < 0.5:
+            params["activity_id"] = activity_id(rng)
+        return RequestSpec("GET", f"{prefix}/organizations/search/nearest", params=params)
+
+    def search(rng: random.Random) -> RequestSpec:
+        lat, lon = point(rng)
+        params: dict[str, Any] = {"activity_id": activity_id(rng), "lat": lat, "lon": lon, "radius_km": 3}
+        if rng.random() < 0.5:
+            params["name"] = rng.choice(NAME_QUERIES)
+        return RequestSpec("GET", f"{prefix}/organizations/search", params=params)
+
+    def facets(rng: random.Random) -> RequestSpec:
+        lat, lon = point(rng)
+        half = rng.uniform(0.005, 0.03)
+        params = {"min_lat": lat - half, "max_lat": lat + half, "min_lon": lon - half, "max_lon": lon + half}
+        return RequestSpec("GET", f"{prefix}/organizations/search/facets", params=params)
+
+    def create_building(rng: random.Random) -> RequestSpec:
+        lat, lon = point(rng)
+        body = {"address": f"Нагрузочный тест {rng.randint(1, 10**9)}", "latitude": lat, "longitude": lon}
+        return RequestSpec("POST", f"{prefix}/buildings", json=body)
+
+    def create_activity(rng: random.Random) -> RequestSpec:
+        return RequestSpec("POST", f"{prefix}/activities", json={"name": f"Нагрузочный тест {rng.randint(1, 10**9)}"})
+
+    def create_organization(rng: random.Random) -> RequestSpec:
+        body = {
+            "name": f'ООО "Нагрузочный тест {rng.randint(1, 10**9)}"',
+            "phones": ["8-800-000-00-00"],
+            "building_id": building_id(rng),
+            "activity_ids": [activity_id(rng)],
+        }
+        return RequestSpec("POST", f"{prefix}/organizations", json=body)
+
+    def ids(rng: random.Random, total: int) -> str:
+        return ",".join(str(rng.randint(1, total)) for _ in range(20))
+
+    return [
+        Scenario("GET", "/buildings", lambda rng: RequestSpec("GET", f"{prefix}/buildings")),
+        Scenario(
+            "GET", "/buildings/{building_id}",
+            lambda rng: RequestSpec("GET", f"{prefix}/buildings/{building_id(rng)}"),
+        ),
+        Scenario("GET", "/activities", lambda rng: RequestSpec("GET", f"{prefix}/activities")),
+        Scenario(
+            "GET", "/activities/{activity_id}",
+            lambda rng: RequestSpec("GET", f"{prefix}/activities/{activity_id(rng)}"),
+        ),
+        Scenario(
+            "GET", "/organizations",
+            lambda rng: RequestSpec(
+                "GET", f"{prefix}/organizations", params={"ids": ids(rng, dataset.organizations)}
+            ),
+        ),
+        Scenario(
+            "GET", "/organizations/{organization_id}",
+            lambda rng: RequestSpec("GET", f"{prefix}/organizations/{organization_id(rng)}"),
+        ),
+        Scenario(
+            "GET", "/organizations/building/{building_id}",
+            lambda rng: RequestSpec("GET", f"{prefix}/organizations/building/{building_id(rng)}"),
+        ),
+        Scenario(
+            "GET", "/organizations/activity/{activity_id}",
+            lambda rng: RequestSpec("GET", f"{prefix}/organizations/activity/{activity_id(rng)}"),
+        ),
+        Scenario(
+            "GET", "/organizations/search/name",
+            lambda rng: RequestSpec(
+                "GET", f"{prefix}/organizations/search/name", params={"name": rng.choice(NAME_QUERIES)}
+            ),
+        ),
+        Scenario("GET", "/organizations/search", search),
+        Scenario("GET", "/organizations/search/facets", facets),
+        Scenario("GET", "/organizations/search/nearest", nearest),
+        Scenario("POST", "/organizations/search/radius", radius),
+        Scenario("POST", "/organizations/search/rectangle", rectangle),
+        Scenario("POST", "/buildings", create_building, writes=True),
+        Scenario("POST", "/activities", create_activity, writes=True),
+        Scenario("POST", "/organizations", create_organization, writes=True),
+    ]
+
+
+def uncovered_routes(covered: list[Scenario]) -> list[str]:
+    prefix = api_router.prefix
+    known = {(scenario.method, prefix + scenario.path) for scenario in covered}
+    missing = []
+    for route in api_router.routes:
+        for method in sorted(getattr(route, "methods", ())):
+            if (method, route.path) not in known:
+                missing.append(f"{method} {route.path}")
+    return missing
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    seed: int,
+    conditional: bool = False,
+) -> dict[str, Any]:
+    rng = random.Random(f"{seed}:{scenario.route}")
+    specs = [scenario.build(rng) for _ in range(warmup + requests)]
+    latencies: list[float] = []
+    errors = 0
+    not_modified = 0
+    # Polling clients: replay the last ETag seen for the same request as If-None-Match.
+    etags: dict[str, str] = {}
+    queue: asyncio.Queue[tuple[int, RequestSpec]] = asyncio.Queue()
+    for position, spec in enumerate(specs):
+        queue.put_nowait((position, spec))
+
+    async def worker() -> None:
+        nonlocal errors, not_modified
+        while not queue.empty():
+            position, spec = queue.get_nowait()
+            key = f"{spec.url}?{spec.params}"
+            headers = {"If-None-Match": etags[key]} if conditional and key in etags else None
+            started = time.perf_counter()
+            try:
+                response = await client.request(
+                    spec.method, spec.url, params=spec.params, json=spec.json, headers=headers
+                )
+                failed = response.status_code >= 500
+            except httpx.HTTPError:
+                response = None
+                failed = True
+            elapsed = time.perf_counter() - started
+            if response is not None and "etag" in response.headers:
+                etags[key] = response.headers["etag"]
+            if position < warmup:
+                continue
+            latencies.append(elapsed)
+            errors += failed
+            not_modified += response is not None and response.status_code == 304
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall_time = time.perf_counter() - started
+
+    timings_ms = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(timings_ms, [50, 95, 99])
+    return {
+        "requests": requests,
+        "errors": errors,
+        "not_modified": not_modified,
+        "mean_ms": round(float(timings_ms.mean()), 3),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        # Includes the warmup window, so this slightly understates steady-state throughput.
+        "throughput_rps": round((warmup + requests) / wall_time, 1),
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_comparison(report: dict[str, Any], baseline: dict[str, Any]) -> None:
+    for route, result in report["routes"].items():
+        previous = baseline.get("routes", {}).get(route)
+        if not previous:
+            continue
+        p95_delta = (result["p95_ms"] / previous["p95_ms"] - 1) * 100 if previous["p95_ms"] else 0.0
+        rps_delta = (result["throughput_rps"] / previous["throughput_rps"] - 1) * 100
+        print(f"{route:<50} p95 {p95_delta:>+7.1f}%  throughput {rps_delta:>+7.1f}%")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="HTTP load benchmark over every API route")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--dataset", type=Path, help="dataset.json written by scripts.generate_dataset")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000, help="measured requests per route")
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--include-writes", action="store_true", help="also benchmark POST create routes")
+    parser.add_argument("--routes", nargs="*", help="substrings selecting a subset of routes")
+    parser.add_argument("--conditional", action="store_true", help="send If-None-Match with the last seen ETag")
+    parser.add_argument("--output", type=Path, default=Path("benchmark-results.json"))
+    parser.add_argument("--compare", type=Path, help="previous results to print deltas against")
+    args = parser.parse_args()
+
+    all_scenarios = scenarios(Dataset.load(args.dataset))
+    for route in uncovered_routes(all_scenarios):
+        print(f"warning: no scenario for {route}")
+
+    selected = [
+        scenario for scenario in all_scenarios
+        if (args.include_writes or not scenario.writes)
+        and (not args.routes or any(part in scenario.route for part in args.routes))
+    ]
+    report: dict[str, Any] = {
+        "revision": git_revision(),
+        "started_at": datetime.now(UTC).isoformat(),
+        "base_url": args.base_url,
+        "concurrency": args.concurrency,
+        "conditional": args.conditional,
+        "routes": {},
+    }
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30.0) as client:
+        for scenario in selected:
+            result = await run_scenario(
+                client, scenario, args.requests, args.concurrency, args.warmup, args.seed, args.conditional
+            )
+            report["routes"][scenario.route] = result
+            print(
+                f"{scenario.route:<50} p50 {result['p50_ms']:>8.2f} ms  p95 {result['p95_ms']:>8.2f} ms  "
+                f"p99 {result['p99_ms']:>8.2f} ms  {result['throughput_rps']:>8.1f} rps  errors {result['errors']}  "
+                f"304 {result['not_modified']}"
+            )
+
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"Results written to {args.output}")
+    if args.compare:
+        print_comparison(report, json.loads(args.compare.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
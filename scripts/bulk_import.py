@@ -0,0 +1,42 @@
+import argparse
+import asyncio
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from secunda.infra.bulk import BulkImportSources, BulkLoader
+from secunda.infra.bulk.loader import DEFAULT_BATCH_SIZE
+from secunda.infra.config import PostgresSettings
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Bulk import of the catalog via COPY (CSV or NDJSON files)")
+    parser.add_argument("--buildings", type=Path)
+    parser.add_argument("--activities", type=Path)
+    parser.add_argument("--organizations", type=Path)
+    parser.add_argument("--organization-activities", type=Path)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--truncate", action="store_true", help="clear all catalog tables before loading")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    sources = BulkImportSources(
+        buildings=args.buildings,
+        activities=args.activities,
+        organizations=args.organizations,
+        organization_activities=args.organization_activities,
+    )
+    engine = create_async_engine(PostgresSettings().async_url())
+    try:
+        stats = await BulkLoader(engine, batch_size=args.batch_size).load(sources, truncate=args.truncate)
+    finally:
+        await engine.dispose()
+
+    for table, rows in stats.rows.items():
+        print(f"{table}: {rows}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,150 @@
+import argparse
+import asyncio
+import csv
+import json
+import math
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from secunda.application.constants import MAX_ACTIVITY_NESTING_LEVEL
+from secunda.application.services import GeoService
+from secunda.infra.bulk import BulkImportSources, BulkLoader
+from secunda.infra.config import PostgresSettings
+
+LEGAL_FORMS = ("ООО", "АО", "ПАО", "ИП", "ЗАО")
+ADJECTIVES = ("Северный", "Южный", "Быстрый", "Надежный", "Городской", "Первый", "Новый", "Большой")
+NOUNS = ("Молочник", "Пекарь", "Мастер", "Сервис", "Склад", "Маркет", "Логист", "Ремонт")
+STREETS = ("ул. Ленина", "пр. Мира", "ул. Садовая", "Невский пр.", "ул. Блюхера", "ул. Гагарина")
+ACTIVITY_NAMES = ("Еда", "Автомобили", "Услуги", "Товары", "Строительство", "Медицина", "Образование")
+
+
+@dataclass
+class DatasetParams:
+    seed: int = 0
+    buildings: int = 10_000
+    organizations: int = 100_000
+    activities: int = 200
+    fan_out: int = 5
+    activities_per_organization: int = 3
+    center_lat: float = 55.7558
+    center_lon: float = 37.6173
+    spread_km: float = 15.0
+
+
+def activity_parents(params: DatasetParams) -> list[int | None]:
+    # Breadth-first: roots first, then fan_out children per node until the count is reached.
+    per_root = sum(params.fan_out**level for level in range(MAX_ACTIVITY_NESTING_LEVEL))
+    roots = max(1, math.ceil(params.activities / per_root))
+    parents: list[int | None] = [None] * min(roots, params.activities)
+    next_parent = 1
+    while len(parents) < params.activities:
+        parents.extend([next_parent] * min(params.fan_out, params.activities - len(parents)))
+        next_parent += 1
+    return parents
+
+
+def generate(params: DatasetParams, output: Path) -> BulkImportSources:
+    rng = np.random.default_rng(params.seed)
+    output.mkdir(parents=True, exist_ok=True)
+    sources = BulkImportSources(
+        buildings=output / "buildings.csv",
+        activities=output / "activities.csv",
+        organizations=output / "organizations.csv",
+        organization_activities=output / "organization_activity.csv",
+    )
+
+    spread_lat = math.degrees(params.spread_km / GeoService.EARTH_RADIUS_KM)
+    spread_lon = spread_lat / math.cos(math.radians(params.center_lat))
+    lats = rng.normal(params.center_lat, spread_lat, params.buildings).clip(-90, 90)
+    lons = rng.normal(params.center_lon, spread_lon, params.buildings).clip(-180, 180)
+    streets = rng.integers(0, len(STREETS), params.buildings)
+    with sources.buildings.open("w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(("id", "address", "latitude", "longitude"))
+        for index in range(params.buildings):
+            address = f"{STREETS[streets[index]]} {index % 200 + 1}, стр. {index // 200 + 1}"
+            writer.writerow((index + 1, address, round(lats[index], 6), round(lons[index], 6)))
+
+    parents = activity_parents(params)
+    with sources.activities.open("w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(("id", "name", "parent_id"))
+        for index, parent_id in enumerate(parents):
+            name = f"{ACTIVITY_NAMES[index % len(ACTIVITY_NAMES)]} {index + 1}"
+            writer.writerow((index + 1, name, parent_id or ""))
+
+    building_ids = rng.integers(1, params.buildings + 1, params.organizations)
+    activity_counts = rng.integers(1, params.activities_per_organization + 1, params.organizations)
+    name_parts = rng.integers(0, len(LEGAL_FORMS) * len(ADJECTIVES) * len(NOUNS), params.organizations)
+    phones = rng.integers(1_000_000, 9_999_999, (params.organizations, 2))
+    with (
+        sources.organizations.open("w", encoding="utf-8", newline="") as organizations_file,
+        sources.organization_activities.open("w", encoding="utf-8", newline="") as links_file,
+    ):
+        organizations = csv.writer(organizations_file)
+        organizations.writerow(("id", "name", "phones", "building_id"))
+        links = csv.writer(links_file)
+        links.writerow(("organization_id", "activity_id"))
+        for index in range(params.organizations):
+            form, rest = divmod(int(name_parts[index]), len(ADJECTIVES) * len(NOUNS))
+            adjective, noun = divmod(rest, len(NOUNS))
+            name = f'{LEGAL_FORMS[form]} "{ADJECTIVES[adjective]} {NOUNS[noun]} {index + 1}"'
+            organization_phones = ";".join(f"8-495-{phone}" for phone in phones[index][: index % 2 + 1])
+            organizations.writerow((index + 1, name, organization_phones, int(building_ids[index])))
+            activity_ids = rng.choice(params.activities, int(activity_counts[index]), replace=False) + 1
+            for activity_id in sorted(activity_ids.tolist()):
+                links.writerow((index + 1, activity_id))
+
+    (output / "dataset.json").write_text(json.dumps(asdict(params), indent=2), encoding="utf-8")
+    return sources
+
+
+def parse_args() -> argparse.Namespace:
+    defaults = DatasetParams()
+    parser = argparse.ArgumentParser(description="Deterministic synthetic dataset for load testing")
+    parser.add_argument("--output", type=Path, default=Path("dataset"))
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--buildings", type=int, default=defaults.buildings)
+    parser.add_argument("--organizations", type=int, default=defaults.organizations)
+    parser.add_argument("--activities", type=int, default=defaults.activities)
+    parser.add_argument("--fan-out", type=int, default=defaults.fan_out)
+    parser.add_argument("--activities-per-organization", type=int, default=defaults.activities_per_organization)
+    parser.add_argument("--center-lat", type=float, default=defaults.center_lat)
+    parser.add_argument("--center-lon", type=float, default=defaults.center_lon)
+    parser.add_argument("--spread-km", type=float, default=defaults.spread_km)
+    parser.add_argument("--load", action="store_true", help="replace the database contents with the dataset")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    params = DatasetParams(
+        seed=args.seed,
+        buildings=args.buildings,
+        organizations=args.organizations,
+        activities=args.activities,
+        fan_out=args.fan_out,
+        activities_per_organization=min(args.activities_per_organization, args.activities),
+        center_lat=args.center_lat,
+        center_lon=args.center_lon,
+        spread_km=args.spread_km,
+    )
+    sources = generate(params, args.output)
+    print(f"Dataset written to {args.output}")
+    if not args.load:
+        return
+
+    engine = create_async_engine(PostgresSettings().async_url())
+    try:
+        stats = await BulkLoader(engine).load(sources, truncate=True)
+    finally:
+        await engine.dispose()
+    for table, rows in stats.rows.items():
+        print(f"{table}: {rows}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
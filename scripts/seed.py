@@ -5,6 +5,23 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 
 from secunda.infra.config import PostgresSettings
 from secunda.infra.database.models import ActivityModel, BuildingModel, OrganizationModel
+from secunda.infra.repositories.activity import build_activity_path
+
+
+async def add_activity(
+    session: AsyncSession, name: str, parent: ActivityModel | None = None
+) -> ActivityModel:
+    parent_path = parent.path if parent else ""
+    activity = ActivityModel(
+        name=name,
+        parent_id=parent.id if parent else None,
+        level=parent.level + 1 if parent else 1,
+        path=parent_path,
+    )
+    session.add(activity)
+    await session.flush()
+    activity.path = build_activity_path(activity.id, parent_path)
+    return activity
 
 
 async def seed_data(session: AsyncSession) -> None:
@@ -20,34 +37,19 @@ async def seed_data(session: AsyncSession) -> None:
     session.add_all(buildings)
     await session.flush()
 
-    food = ActivityModel(name="Еда", level=1)
-    session.add(food)
-    await session.flush()
-
-    meat = ActivityModel(name="Мясная продукция", parent_id=food.id, level=2)
-    dairy = ActivityModel(name="Молочная продукция", parent_id=food.id, level=2)
-    session.add_all([meat, dairy])
-    await session.flush()
-
-    beef = ActivityModel(name="Говядина", parent_id=meat.id, level=3)
-    pork = ActivityModel(name="Свинина", parent_id=meat.id, level=3)
-    milk = ActivityModel(name="Молоко", parent_id=dairy.id, level=3)
-    cheese = ActivityModel(name="Сыры", parent_id=dairy.id, level=3)
-    session.add_all([beef, pork, milk, cheese])
-    await session.flush()
-
-    auto = ActivityModel(name="Автомобили", level=1)
-    session.add(auto)
-    await session.flush()
-
-    trucks = ActivityModel(name="Грузовые", parent_id=auto.id, level=2)
-    cars = ActivityModel(name="Легковые", parent_id=auto.id, level=2)
-    parts = ActivityModel(name="Запчасти", parent_id=auto.id, level=2)
-    session.add_all([trucks, cars, parts])
-    await session.flush()
-
-    accessories = ActivityModel(name="Аксессуары", parent_id=parts.id, level=3)
-    session.add(accessories)
+    food = await add_activity(session, "Еда")
+    meat = await add_activity(session, "Мясная продукция", food)
+    dairy = await add_activity(session, "Молочная продукция", food)
+    beef = await add_activity(session, "Говядина", meat)
+    pork = await add_activity(session, "Свинина", meat)
+    milk = await add_activity(session, "Молоко", dairy)
+    cheese = await add_activity(session, "Сыры", dairy)
+
+    auto = await add_activity(session, "Автомобили")
+    trucks = await add_activity(session, "Грузовые", auto)
+    cars = await add_activity(session, "Легковые", auto)
+    parts = await add_activity(session, "Запчасти", auto)
+    accessories = await add_activity(session, "Аксессуары", parts)
     await session.flush()
 
     org1 = OrganizationModel(
@@ -1 +1,13 @@
 MAX_ACTIVITY_NESTING_LEVEL = 3
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Nearest search never looks farther than this.
+NEAREST_MAX_DISTANCE_KM = 100.0
+
+# Response cache key groups, invalidated by the create interactors of the same table.
+# Their generations also version the GET responses of that table for ETags.
+BUILDINGS_CACHE_GROUP = "buildings"
+ACTIVITIES_CACHE_GROUP = "activities"
+ORGANIZATIONS_CACHE_GROUP = "organizations"
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from secunda.application.constants import DEFAULT_PAGE_SIZE, NEAREST_MAX_DISTANCE_KM
+
 
 @dataclass
 class CreateBuildingDTO:
@@ -31,3 +33,32 @@ class GeoSearchDTO:
     max_lat: float | None = None
     min_lon: float | None = None
     max_lon: float | None = None
+
+
+@dataclass
+class OrganizationSearchDTO:
+    # Filters are combined with AND; at least one is required.
+    activity_id: int | None = None
+    name: str | None = None
+    area: GeoSearchDTO | None = None
+
+
+@dataclass
+class NearestSearchDTO:
+    latitude: float
+    longitude: float
+    limit: int
+    activity_id: int | None = None
+    max_distance_km: float = NEAREST_MAX_DISTANCE_KM
+
+
+@dataclass
+class PageDTO:
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class OrganizationLoadProfileDTO:
+    building: bool = True
+    activities: bool = True
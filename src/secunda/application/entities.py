@@ -1,8 +1,11 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Generic, TypeVar
 
+T = TypeVar("T")
 
-@dataclass
+
+@dataclass(slots=True)
 class BuildingEntity:
     id: int
     address: str
@@ -11,7 +14,7 @@ class BuildingEntity:
     created_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivityEntity:
     id: int
     name: str
@@ -21,7 +24,7 @@ class ActivityEntity:
     children: list["ActivityEntity"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrganizationEntity:
     id: int
     name: str
@@ -30,3 +33,24 @@ class OrganizationEntity:
     building: BuildingEntity | None = None
     activities: list[ActivityEntity] = field(default_factory=list)
     created_at: datetime | None = None
+
+
+@dataclass(slots=True)
+class NearbyOrganizationEntity(OrganizationEntity):
+    distance_km: float = 0.0
+
+
+@dataclass(slots=True)
+class ActivityFacetEntity:
+    # Organizations counted once per activity, including those filed under its descendants.
+    id: int
+    name: str
+    level: int
+    parent_id: int | None
+    organizations_count: int
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
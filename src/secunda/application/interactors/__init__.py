@@ -1,31 +1,49 @@
-from .building import GetBuildingsInteractor, GetBuildingByIdInteractor, CreateBuildingInteractor
+from .building import (
+    GetBuildingsInteractor,
+    GetBuildingByIdInteractor,
+    GetBuildingsByIdsInteractor,
+    CreateBuildingInteractor,
+)
 from .activity import (
     GetActivitiesInteractor,
     GetActivityByIdInteractor,
+    GetActivitiesByIdsInteractor,
     CreateActivityInteractor,
     GetActivityWithChildrenInteractor,
 )
 from .organization import (
     GetOrganizationByIdInteractor,
+    GetOrganizationsByIdsInteractor,
     GetOrganizationsByBuildingInteractor,
     GetOrganizationsByActivityInteractor,
     GetOrganizationsInGeoAreaInteractor,
+    GetOrganizationsInRadiusInteractor,
+    GetNearestOrganizationsInteractor,
     SearchOrganizationsByNameInteractor,
+    SearchOrganizationsInteractor,
+    GetActivityFacetsInteractor,
     CreateOrganizationInteractor,
 )
 
 __all__ = [
     "GetBuildingsInteractor",
     "GetBuildingByIdInteractor",
+    "GetBuildingsByIdsInteractor",
     "CreateBuildingInteractor",
     "GetActivitiesInteractor",
     "GetActivityByIdInteractor",
+    "GetActivitiesByIdsInteractor",
     "CreateActivityInteractor",
     "GetActivityWithChildrenInteractor",
     "GetOrganizationByIdInteractor",
+    "GetOrganizationsByIdsInteractor",
     "GetOrganizationsByBuildingInteractor",
     "GetOrganizationsByActivityInteractor",
     "GetOrganizationsInGeoAreaInteractor",
+    "GetOrganizationsInRadiusInteractor",
+    "GetNearestOrganizationsInteractor",
     "SearchOrganizationsByNameInteractor",
+    "SearchOrganizationsInteractor",
+    "GetActivityFacetsInteractor",
     "CreateOrganizationInteractor",
 ]
@@ -1,40 +1,88 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from secunda.application.constants import ACTIVITIES_CACHE_GROUP
 from secunda.application.dto import CreateActivityDTO
 from secunda.application.entities import ActivityEntity
-from secunda.application.interfaces import ActivityRepositoryProtocol
+from secunda.application.interfaces import (
+    ActivityRepositoryProtocol,
+    ActivityTreeCacheProtocol,
+    ResponseCacheProtocol,
+)
+from secunda.application.services import CacheKeyBuilder
 
 
 class GetActivitiesInteractor:
-    def __init__(self, repository: ActivityRepositoryProtocol) -> None:
+    def __init__(self, repository: ActivityRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
         self._repository = repository
+        self._cache = cache
 
     async def __call__(self) -> list[ActivityEntity]:
-        return await self._repository.get_all()
+        return await self._cache.get_or_load(
+            ACTIVITIES_CACHE_GROUP,
+            CacheKeyBuilder.build(self),
+            list[ActivityEntity],
+            self._repository.get_all,
+        )
 
 
 class GetActivityByIdInteractor:
-    def __init__(self, repository: ActivityRepositoryProtocol) -> None:
+    def __init__(self, repository: ActivityRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
         self._repository = repository
+        self._cache = cache
 
     async def __call__(self, activity_id: int) -> ActivityEntity | None:
-        return await self._repository.get_by_id(activity_id)
+        return await self._cache.get_or_load(
+            ACTIVITIES_CACHE_GROUP,
+            CacheKeyBuilder.build(self, activity_id),
+            ActivityEntity | None,
+            lambda: self._repository.get_by_id(activity_id),
+        )
+
+
+class GetActivitiesByIdsInteractor:
+    def __init__(self, repository: ActivityRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
+        self._repository = repository
+        self._cache = cache
+
+    async def __call__(self, activity_ids: list[int]) -> list[ActivityEntity]:
+        return await self._cache.get_or_load(
+            ACTIVITIES_CACHE_GROUP,
+            CacheKeyBuilder.build(self, activity_ids),
+            list[ActivityEntity],
+            lambda: self._repository.get_by_ids(activity_ids),
+        )
 
 
 class CreateActivityInteractor:
-    def __init__(self, repository: ActivityRepositoryProtocol, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        repository: ActivityRepositoryProtocol,
+        session: AsyncSession,
+        tree_cache: ActivityTreeCacheProtocol,
+        cache: ResponseCacheProtocol,
+    ) -> None:
         self._repository = repository
         self._session = session
+        self._tree_cache = tree_cache
+        self._cache = cache
 
     async def __call__(self, dto: CreateActivityDTO) -> ActivityEntity:
         result = await self._repository.create(dto)
         await self._session.commit()
+        self._tree_cache.invalidate()
+        await self._cache.invalidate(ACTIVITIES_CACHE_GROUP)
         return result
 
 
 class GetActivityWithChildrenInteractor:
-    def __init__(self, repository: ActivityRepositoryProtocol) -> None:
+    def __init__(self, repository: ActivityRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
         self._repository = repository
+        self._cache = cache
 
     async def __call__(self, activity_id: int) -> list[int]:
-        return await self._repository.get_with_children_recursive(activity_id)
+        return await self._cache.get_or_load(
+            ACTIVITIES_CACHE_GROUP,
+            CacheKeyBuilder.build(self, activity_id),
+            list[int],
+            lambda: self._repository.get_with_children_recursive(activity_id),
+        )
@@ -1,32 +1,86 @@
+from collections.abc import AsyncIterator
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from secunda.application.dto import CreateBuildingDTO
-from secunda.application.entities import BuildingEntity
-from secunda.application.interfaces import BuildingRepositoryProtocol
+from secunda.application.constants import BUILDINGS_CACHE_GROUP
+from secunda.application.dto import CreateBuildingDTO, PageDTO
+from secunda.application.entities import BuildingEntity, Page
+from secunda.application.interfaces import (
+    BatchLoaderProtocol,
+    BuildingIndexCacheProtocol,
+    BuildingRepositoryProtocol,
+    ResponseCacheProtocol,
+)
+from secunda.application.services import CacheKeyBuilder
 
 
 class GetBuildingsInteractor:
-    def __init__(self, repository: BuildingRepositoryProtocol) -> None:
+    def __init__(self, repository: BuildingRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
         self._repository = repository
+        self._cache = cache
+
+    async def __call__(self, page: PageDTO) -> Page[BuildingEntity]:
+        return await self._cache.get_or_load(
+            BUILDINGS_CACHE_GROUP,
+            CacheKeyBuilder.build(self, page),
+            Page[BuildingEntity],
+            lambda: self._repository.get_all(page),
+        )
 
-    async def __call__(self) -> list[BuildingEntity]:
-        return await self._repository.get_all()
+    def stream(self) -> AsyncIterator[BuildingEntity]:
+        return self._repository.stream_all()
 
 
 class GetBuildingByIdInteractor:
-    def __init__(self, repository: BuildingRepositoryProtocol) -> None:
-        self._repository = repository
+    def __init__(
+        self, loader: BatchLoaderProtocol[int, BuildingEntity], cache: ResponseCacheProtocol
+    ) -> None:
+        self._loader = loader
+        self._cache = cache
 
     async def __call__(self, building_id: int) -> BuildingEntity | None:
-        return await self._repository.get_by_id(building_id)
+        return await self._cache.get_or_load(
+            BUILDINGS_CACHE_GROUP,
+            CacheKeyBuilder.build(self, building_id),
+            BuildingEntity | None,
+            lambda: self._loader.load(building_id),
+        )
+
+
+class GetBuildingsByIdsInteractor:
+    def __init__(self, repository: BuildingRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
+        self._repository = repository
+        self._cache = cache
+
+    async def __call__(self, building_ids: list[int]) -> list[BuildingEntity]:
+        return await self._cache.get_or_load(
+            BUILDINGS_CACHE_GROUP,
+            CacheKeyBuilder.build(self, building_ids),
+            list[BuildingEntity],
+            lambda: self._load(building_ids),
+        )
+
+    async def _load(self, building_ids: list[int]) -> list[BuildingEntity]:
+        by_id = {building.id: building for building in await self._repository.get_by_ids(building_ids)}
+        return [by_id[building_id] for building_id in building_ids if building_id in by_id]
 
 
 class CreateBuildingInteractor:
-    def __init__(self, repository: BuildingRepositoryProtocol, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        repository: BuildingRepositoryProtocol,
+        session: AsyncSession,
+        index_cache: BuildingIndexCacheProtocol,
+        cache: ResponseCacheProtocol,
+    ) -> None:
         self._repository = repository
         self._session = session
+        self._index_cache = index_cache
+        self._cache = cache
 
     async def __call__(self, dto: CreateBuildingDTO) -> BuildingEntity:
         result = await self._repository.create(dto)
         await self._session.commit()
+        self._index_cache.add(result)
+        await self._cache.invalidate(BUILDINGS_CACHE_GROUP)
         return result
@@ -1,66 +1,260 @@
+from collections.abc import AsyncIterator
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from secunda.application.dto import CreateOrganizationDTO, GeoSearchDTO
-from secunda.application.entities import OrganizationEntity
-from secunda.application.interfaces import ActivityRepositoryProtocol, OrganizationRepositoryProtocol
+from secunda.application.constants import ORGANIZATIONS_CACHE_GROUP
+from secunda.application.dto import (
+    CreateOrganizationDTO,
+    GeoSearchDTO,
+    NearestSearchDTO,
+    OrganizationLoadProfileDTO,
+    OrganizationSearchDTO,
+    PageDTO,
+)
+from secunda.application.entities import (
+    ActivityFacetEntity,
+    NearbyOrganizationEntity,
+    OrganizationEntity,
+    Page,
+)
+from secunda.application.interfaces import (
+    BatchLoaderProtocol,
+    OrganizationRepositoryProtocol,
+    ResponseCacheProtocol,
+)
+from secunda.application.services import CacheKeyBuilder
+
+FULL_PROFILE = OrganizationLoadProfileDTO()
 
 
 class GetOrganizationByIdInteractor:
-    def __init__(self, repository: OrganizationRepositoryProtocol) -> None:
+    def __init__(
+        self,
+        loader: BatchLoaderProtocol[tuple[int, OrganizationLoadProfileDTO], OrganizationEntity],
+        cache: ResponseCacheProtocol,
+    ) -> None:
+        self._loader = loader
+        self._cache = cache
+
+    async def __call__(
+        self, organization_id: int, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> OrganizationEntity | None:
+        return await self._cache.get_or_load(
+            ORGANIZATIONS_CACHE_GROUP,
+            CacheKeyBuilder.build(self, organization_id, profile),
+            OrganizationEntity | None,
+            lambda: self._loader.load((organization_id, profile)),
+        )
+
+
+class GetOrganizationsByIdsInteractor:
+    def __init__(self, repository: OrganizationRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
         self._repository = repository
+        self._cache = cache
 
-    async def __call__(self, organization_id: int) -> OrganizationEntity | None:
-        return await self._repository.get_by_id(organization_id)
+    async def __call__(
+        self, organization_ids: list[int], profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> list[OrganizationEntity]:
+        return await self._cache.get_or_load(
+            ORGANIZATIONS_CACHE_GROUP,
+            CacheKeyBuilder.build(self, organization_ids, profile),
+            list[OrganizationEntity],
+            lambda: self._load(organization_ids, profile),
+        )
+
+    async def _load(
+        self, organization_ids: list[int], profile: OrganizationLoadProfileDTO
+    ) -> list[OrganizationEntity]:
+        organizations = await self._repository.get_by_ids(organization_ids, profile)
+        by_id = {organization.id: organization for organization in organizations}
+        return [by_id[organization_id] for organization_id in organization_ids if organization_id in by_id]
 
 
 class GetOrganizationsByBuildingInteractor:
-    def __init__(self, repository: OrganizationRepositoryProtocol) -> None:
+    def __init__(self, repository: OrganizationRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
         self._repository = repository
+        self._cache = cache
 
-    async def __call__(self, building_id: int) -> list[OrganizationEntity]:
-        return await self._repository.get_by_building_id(building_id)
+    async def __call__(
+        self, building_id: int, page: PageDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> Page[OrganizationEntity]:
+        return await self._cache.get_or_load(
+            ORGANIZATIONS_CACHE_GROUP,
+            CacheKeyBuilder.build(self, building_id, page, profile),
+            Page[OrganizationEntity],
+            lambda: self._repository.get_by_building_id(building_id, page, profile),
+        )
+
+    def stream(
+        self, building_id: int, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> AsyncIterator[OrganizationEntity]:
+        return self._repository.stream_by_building_id(building_id, profile)
 
 
 class GetOrganizationsByActivityInteractor:
-    def __init__(
-        self,
-        organization_repo: OrganizationRepositoryProtocol,
-        activity_repo: ActivityRepositoryProtocol,
-    ) -> None:
-        self._organization_repo = organization_repo
-        self._activity_repo = activity_repo
+    def __init__(self, repository: OrganizationRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
+        self._repository = repository
+        self._cache = cache
 
     async def __call__(
-        self, activity_id: int, include_children: bool = True
-    ) -> list[OrganizationEntity]:
+        self,
+        activity_id: int,
+        page: PageDTO,
+        include_children: bool = True,
+        profile: OrganizationLoadProfileDTO = FULL_PROFILE,
+    ) -> Page[OrganizationEntity]:
+        return await self._cache.get_or_load(
+            ORGANIZATIONS_CACHE_GROUP,
+            CacheKeyBuilder.build(self, activity_id, page, include_children, profile),
+            Page[OrganizationEntity],
+            lambda: self._load(activity_id, page, include_children, profile),
+        )
+
+    async def _load(
+        self, activity_id: int, page: PageDTO, include_children: bool, profile: OrganizationLoadProfileDTO
+    ) -> Page[OrganizationEntity]:
+        if include_children:
+            return await self._repository.get_by_activity_subtree(activity_id, page, profile)
+        return await self._repository.get_by_activity_id(activity_id, page, profile)
+
+    def stream(
+        self,
+        activity_id: int,
+        include_children: bool = True,
+        profile: OrganizationLoadProfileDTO = FULL_PROFILE,
+    ) -> AsyncIterator[OrganizationEntity]:
         if include_children:
-            activity_ids = await self._activity_repo.get_with_children_recursive(activity_id)
-            return await self._organization_repo.get_by_activity_ids(activity_ids)
-        return await self._organization_repo.get_by_activity_id(activity_id)
+            return self._repository.stream_by_activity_subtree(activity_id, profile)
+        return self._repository.stream_by_activity_id(activity_id, profile)
 
 
 class GetOrganizationsInGeoAreaInteractor:
-    def __init__(self, repository: OrganizationRepositoryProtocol) -> None:
+    def __init__(self, repository: OrganizationRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
         self._repository = repository
+        self._cache = cache
+
+    async def __call__(
+        self, dto: GeoSearchDTO, page: PageDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> Page[OrganizationEntity]:
+        return await self._cache.get_or_load(
+            ORGANIZATIONS_CACHE_GROUP,
+            CacheKeyBuilder.build(self, dto, page, profile),
+            Page[OrganizationEntity],
+            lambda: self._repository.get_in_geo_area(dto, page, profile),
+        )
 
-    async def __call__(self, dto: GeoSearchDTO) -> list[OrganizationEntity]:
-        return await self._repository.get_in_geo_area(dto)
+    def stream(
+        self, dto: GeoSearchDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> AsyncIterator[OrganizationEntity]:
+        return self._repository.stream_in_geo_area(dto, profile)
+
+
+class GetOrganizationsInRadiusInteractor:
+    def __init__(self, repository: OrganizationRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
+        self._repository = repository
+        self._cache = cache
+
+    async def __call__(
+        self, dto: GeoSearchDTO, page: PageDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> Page[NearbyOrganizationEntity]:
+        return await self._cache.get_or_load(
+            ORGANIZATIONS_CACHE_GROUP,
+            CacheKeyBuilder.build(self, dto, page, profile),
+            Page[NearbyOrganizationEntity],
+            lambda: self._repository.get_in_radius(dto, page, profile),
+        )
+
+    def stream(
+        self, dto: GeoSearchDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> AsyncIterator[NearbyOrganizationEntity]:
+        return self._repository.stream_in_radius(dto, profile)
+
+
+class GetNearestOrganizationsInteractor:
+    def __init__(self, repository: OrganizationRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
+        self._repository = repository
+        self._cache = cache
+
+    async def __call__(
+        self, dto: NearestSearchDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> list[NearbyOrganizationEntity]:
+        return await self._cache.get_or_load(
+            ORGANIZATIONS_CACHE_GROUP,
+            CacheKeyBuilder.build(self, dto, profile),
+            list[NearbyOrganizationEntity],
+            lambda: self._repository.get_nearest(dto, profile),
+        )
 
 
 class SearchOrganizationsByNameInteractor:
-    def __init__(self, repository: OrganizationRepositoryProtocol) -> None:
+    def __init__(self, repository: OrganizationRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
+        self._repository = repository
+        self._cache = cache
+
+    async def __call__(
+        self, name: str, page: PageDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> Page[OrganizationEntity]:
+        return await self._cache.get_or_load(
+            ORGANIZATIONS_CACHE_GROUP,
+            CacheKeyBuilder.build(self, name, page, profile),
+            Page[OrganizationEntity],
+            lambda: self._repository.search_by_name(name, page, profile),
+        )
+
+    def stream(
+        self, name: str, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> AsyncIterator[OrganizationEntity]:
+        return self._repository.stream_by_name(name, profile)
+
+
+class SearchOrganizationsInteractor:
+    def __init__(self, repository: OrganizationRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
         self._repository = repository
+        self._cache = cache
 
-    async def __call__(self, name: str) -> list[OrganizationEntity]:
-        return await self._repository.search_by_name(name)
+    async def __call__(
+        self, dto: OrganizationSearchDTO, page: PageDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> Page[OrganizationEntity]:
+        return await self._cache.get_or_load(
+            ORGANIZATIONS_CACHE_GROUP,
+            CacheKeyBuilder.build(self, dto, page, profile),
+            Page[OrganizationEntity],
+            lambda: self._repository.search(dto, page, profile),
+        )
+
+    def stream(
+        self, dto: OrganizationSearchDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> AsyncIterator[OrganizationEntity]:
+        return self._repository.stream_search(dto, profile)
+
+
+class GetActivityFacetsInteractor:
+    def __init__(self, repository: OrganizationRepositoryProtocol, cache: ResponseCacheProtocol) -> None:
+        self._repository = repository
+        self._cache = cache
+
+    async def __call__(self, dto: OrganizationSearchDTO) -> list[ActivityFacetEntity]:
+        return await self._cache.get_or_load(
+            ORGANIZATIONS_CACHE_GROUP,
+            CacheKeyBuilder.build(self, dto),
+            list[ActivityFacetEntity],
+            lambda: self._repository.count_by_activity(dto),
+        )
 
 
 class CreateOrganizationInteractor:
-    def __init__(self, repository: OrganizationRepositoryProtocol, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        repository: OrganizationRepositoryProtocol,
+        session: AsyncSession,
+        cache: ResponseCacheProtocol,
+    ) -> None:
         self._repository = repository
         self._session = session
+        self._cache = cache
 
     async def __call__(self, dto: CreateOrganizationDTO) -> OrganizationEntity:
         result = await self._repository.create(dto)
         await self._session.commit()
+        await self._cache.invalidate(ORGANIZATIONS_CACHE_GROUP)
         return result
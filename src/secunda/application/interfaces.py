@@ -1,7 +1,28 @@
-from typing import Protocol, runtime_checkable
-
-from secunda.application.dto import CreateActivityDTO, CreateBuildingDTO, CreateOrganizationDTO, GeoSearchDTO
-from secunda.application.entities import ActivityEntity, BuildingEntity, OrganizationEntity
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, Protocol, TypeVar, runtime_checkable
+
+from secunda.application.dto import (
+    CreateActivityDTO,
+    CreateBuildingDTO,
+    CreateOrganizationDTO,
+    GeoSearchDTO,
+    NearestSearchDTO,
+    OrganizationLoadProfileDTO,
+    OrganizationSearchDTO,
+    PageDTO,
+)
+from secunda.application.entities import (
+    ActivityEntity,
+    ActivityFacetEntity,
+    BuildingEntity,
+    NearbyOrganizationEntity,
+    OrganizationEntity,
+    Page,
+)
+
+T = TypeVar("T")
+K = TypeVar("K", contravariant=True)
+V = TypeVar("V", covariant=True)
 
 
 @runtime_checkable
@@ -12,7 +33,13 @@ class BuildingRepositoryProtocol(Protocol):
     async def get_by_id(self, building_id: int) -> BuildingEntity | None:
         ...
 
-    async def get_all(self) -> list[BuildingEntity]:
+    async def get_by_ids(self, building_ids: list[int]) -> list[BuildingEntity]:
+        ...
+
+    async def get_all(self, page: PageDTO) -> Page[BuildingEntity]:
+        ...
+
+    def stream_all(self) -> AsyncIterator[BuildingEntity]:
         ...
 
     async def get_in_radius(self, lat: float, lon: float, radius_km: float) -> list[BuildingEntity]:
@@ -32,6 +59,9 @@ class ActivityRepositoryProtocol(Protocol):
     async def get_by_id(self, activity_id: int) -> ActivityEntity | None:
         ...
 
+    async def get_by_ids(self, activity_ids: list[int]) -> list[ActivityEntity]:
+        ...
+
     async def get_all(self) -> list[ActivityEntity]:
         ...
 
@@ -39,25 +69,128 @@ class ActivityRepositoryProtocol(Protocol):
         ...
 
 
+@runtime_checkable
+class ActivityTreeCacheProtocol(Protocol):
+    def invalidate(self) -> None:
+        ...
+
+
+@runtime_checkable
+class BuildingIndexCacheProtocol(Protocol):
+    def add(self, building: BuildingEntity) -> None:
+        ...
+
+
+@runtime_checkable
+class BatchLoaderProtocol(Protocol[K, V]):
+    async def load(self, key: K) -> V | None:
+        ...
+
+
+@runtime_checkable
+class ResponseCacheProtocol(Protocol):
+    async def get_or_load(self, group: str, key: str, result_type: Any, loader: Callable[[], Awaitable[T]]) -> T:
+        ...
+
+    async def invalidate(self, *groups: str) -> None:
+        ...
+
+
+@runtime_checkable
+class TableVersionsProtocol(Protocol):
+    async def current(self, *groups: str) -> str | None:
+        ...
+
+
 @runtime_checkable
 class OrganizationRepositoryProtocol(Protocol):
     async def create(self, dto: CreateOrganizationDTO) -> OrganizationEntity:
         ...
 
-    async def get_by_id(self, organization_id: int) -> OrganizationEntity | None:
+    async def get_by_id(
+        self, organization_id: int, profile: OrganizationLoadProfileDTO = ...
+    ) -> OrganizationEntity | None:
+        ...
+
+    async def get_by_ids(
+        self, organization_ids: list[int], profile: OrganizationLoadProfileDTO = ...
+    ) -> list[OrganizationEntity]:
+        ...
+
+    async def get_by_building_id(
+        self, building_id: int, page: PageDTO, profile: OrganizationLoadProfileDTO = ...
+    ) -> Page[OrganizationEntity]:
+        ...
+
+    def stream_by_building_id(
+        self, building_id: int, profile: OrganizationLoadProfileDTO = ...
+    ) -> AsyncIterator[OrganizationEntity]:
+        ...
+
+    async def get_by_activity_id(
+        self, activity_id: int, page: PageDTO, profile: OrganizationLoadProfileDTO = ...
+    ) -> Page[OrganizationEntity]:
+        ...
+
+    def stream_by_activity_id(
+        self, activity_id: int, profile: OrganizationLoadProfileDTO = ...
+    ) -> AsyncIterator[OrganizationEntity]:
+        ...
+
+    async def get_by_activity_subtree(
+        self, activity_id: int, page: PageDTO, profile: OrganizationLoadProfileDTO = ...
+    ) -> Page[OrganizationEntity]:
+        ...
+
+    def stream_by_activity_subtree(
+        self, activity_id: int, profile: OrganizationLoadProfileDTO = ...
+    ) -> AsyncIterator[OrganizationEntity]:
+        ...
+
+    async def search_by_name(
+        self, name: str, page: PageDTO, profile: OrganizationLoadProfileDTO = ...
+    ) -> Page[OrganizationEntity]:
+        ...
+
+    def stream_by_name(
+        self, name: str, profile: OrganizationLoadProfileDTO = ...
+    ) -> AsyncIterator[OrganizationEntity]:
+        ...
+
+    async def get_in_geo_area(
+        self, dto: GeoSearchDTO, page: PageDTO, profile: OrganizationLoadProfileDTO = ...
+    ) -> Page[OrganizationEntity]:
+        ...
+
+    def stream_in_geo_area(
+        self, dto: GeoSearchDTO, profile: OrganizationLoadProfileDTO = ...
+    ) -> AsyncIterator[OrganizationEntity]:
+        ...
+
+    async def get_in_radius(
+        self, dto: GeoSearchDTO, page: PageDTO, profile: OrganizationLoadProfileDTO = ...
+    ) -> Page[NearbyOrganizationEntity]:
         ...
 
-    async def get_by_building_id(self, building_id: int) -> list[OrganizationEntity]:
+    def stream_in_radius(
+        self, dto: GeoSearchDTO, profile: OrganizationLoadProfileDTO = ...
+    ) -> AsyncIterator[NearbyOrganizationEntity]:
         ...
 
-    async def get_by_activity_id(self, activity_id: int) -> list[OrganizationEntity]:
+    async def search(
+        self, dto: OrganizationSearchDTO, page: PageDTO, profile: OrganizationLoadProfileDTO = ...
+    ) -> Page[OrganizationEntity]:
         ...
 
-    async def get_by_activity_ids(self, activity_ids: list[int]) -> list[OrganizationEntity]:
+    def stream_search(
+        self, dto: OrganizationSearchDTO, profile: OrganizationLoadProfileDTO = ...
+    ) -> AsyncIterator[OrganizationEntity]:
         ...
 
-    async def search_by_name(self, name: str) -> list[OrganizationEntity]:
+    async def count_by_activity(self, dto: OrganizationSearchDTO) -> list[ActivityFacetEntity]:
         ...
 
-    async def get_in_geo_area(self, dto: GeoSearchDTO) -> list[OrganizationEntity]:
+    async def get_nearest(
+        self, dto: NearestSearchDTO, profile: OrganizationLoadProfileDTO = ...
+    ) -> list[NearbyOrganizationEntity]:
         ...
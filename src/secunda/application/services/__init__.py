@@ -1,3 +1,18 @@
-from .geo import GeoService
+from .activity_tree import ActivityTree
+from .cache_key import CacheKeyBuilder
+from .cursor import CursorCodec
+from .geo import BoundingBox, GeoService
+from .morton import MortonCode
+from .name_normalizer import OrganizationNameNormalizer
+from .spatial_index import GridSpatialIndex
 
-__all__ = ["GeoService"]
+__all__ = [
+    "ActivityTree",
+    "BoundingBox",
+    "CacheKeyBuilder",
+    "CursorCodec",
+    "GeoService",
+    "GridSpatialIndex",
+    "MortonCode",
+    "OrganizationNameNormalizer",
+]
@@ -0,0 +1,43 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import replace
+
+from secunda.application.entities import ActivityEntity
+
+
+class ActivityTree:
+    def __init__(self, activities: Iterable[ActivityEntity]) -> None:
+        self._nodes: dict[int, ActivityEntity] = {
+            activity.id: replace(activity, children=[]) for activity in activities
+        }
+        self._children: dict[int | None, list[int]] = defaultdict(list)
+        for activity_id in sorted(self._nodes):
+            node = self._nodes[activity_id]
+            parent_id = node.parent_id if node.parent_id in self._nodes else None
+            self._children[parent_id].append(activity_id)
+            if parent_id is not None:
+                self._nodes[parent_id].children.append(node)
+
+        self._roots = [self._nodes[activity_id] for activity_id in self._children[None]]
+        self._descendants: dict[int, tuple[int, ...]] = {}
+        for root in self._roots:
+            self._collect_descendants(root.id)
+
+    def _collect_descendants(self, activity_id: int) -> tuple[int, ...]:
+        ids = [activity_id]
+        for child_id in self._children.get(activity_id, []):
+            ids.extend(self._collect_descendants(child_id))
+        self._descendants[activity_id] = tuple(ids)
+        return self._descendants[activity_id]
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def get(self, activity_id: int) -> ActivityEntity | None:
+        return self._nodes.get(activity_id)
+
+    def roots(self) -> list[ActivityEntity]:
+        return list(self._roots)
+
+    def descendant_ids(self, activity_id: int) -> list[int]:
+        return list(self._descendants.get(activity_id, ()))
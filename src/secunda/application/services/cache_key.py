@@ -0,0 +1,10 @@
+import hashlib
+from typing import Any
+
+
+class CacheKeyBuilder:
+    # Arguments are dataclass DTOs and scalars, whose repr is stable and covers every field.
+    @classmethod
+    def build(cls, owner: object, *args: Any) -> str:
+        digest = hashlib.blake2b(repr(args).encode(), digest_size=16).hexdigest()
+        return f"{type(owner).__name__}:{digest}"
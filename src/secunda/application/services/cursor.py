@@ -0,0 +1,22 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+
+class CursorCodec:
+    @classmethod
+    def encode(cls, *values: Any) -> str:
+        payload = json.dumps(values, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str, size: int) -> list[Any]:
+        try:
+            payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(payload)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValueError("Некорректный курсор") from None
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError("Некорректный курсор")
+        return values
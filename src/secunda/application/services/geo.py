@@ -1,6 +1,12 @@
 import math
 from dataclasses import dataclass
 
+import numpy as np
+import numpy.typing as npt
+
+FloatArray = npt.NDArray[np.float64]
+BoolArray = npt.NDArray[np.bool_]
+
 
 @dataclass
 class BoundingBox:
@@ -26,6 +32,27 @@ class GeoService:
             max_lon=lon + lon_delta,
         )
 
+    @classmethod
+    def cap_boxes(cls, lat: float, lon: float, radius_km: float) -> list[BoundingBox]:
+        # Boxes covering the spherical cap of the circle: every longitude once the cap holds a pole,
+        # and past the antimeridian it continues from the other edge, as at most two disjoint boxes.
+        lat_delta = radius_km / cls.DEGREES_PER_KM
+        min_lat, max_lat = max(-90.0, lat - lat_delta), min(90.0, lat + lat_delta)
+        if min_lat <= -90.0 or max_lat >= 90.0:
+            return [BoundingBox(min_lat, max_lat, -180.0, 180.0)]
+        angle = math.radians(lat_delta)
+        lon_delta = math.degrees(math.asin(min(1.0, math.sin(angle) / math.cos(math.radians(lat)))))
+        min_lon, max_lon = lon - lon_delta, lon + lon_delta
+        if max_lon - min_lon >= 360.0:
+            spans = [(-180.0, 180.0)]
+        elif min_lon < -180.0:
+            spans = [(-180.0, max_lon), (min_lon + 360.0, 180.0)]
+        elif max_lon > 180.0:
+            spans = [(min_lon, 180.0), (-180.0, max_lon - 360.0)]
+        else:
+            spans = [(min_lon, max_lon)]
+        return [BoundingBox(min_lat, max_lat, low, high) for low, high in spans]
+
     @classmethod
     def haversine_distance(cls, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         phi1 = math.radians(lat1)
@@ -43,3 +70,21 @@ class GeoService:
     def is_within_radius(cls, center_lat: float, center_lon: float, point_lat: float, point_lon: float, radius_km: float) -> bool:
         distance = cls.haversine_distance(center_lat, center_lon, point_lat, point_lon)
         return distance <= radius_km
+
+    @classmethod
+    def haversine_distances(
+        cls, lat: float, lon: float, lats: FloatArray, lons: FloatArray
+    ) -> FloatArray:
+        phi1 = math.radians(lat)
+        phi2 = np.radians(lats)
+        delta_phi = phi2 - phi1
+        delta_lambda = np.radians(lons) - math.radians(lon)
+
+        a = np.sin(delta_phi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2) ** 2
+        return 2 * cls.EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+    @classmethod
+    def within_radius_mask(
+        cls, center_lat: float, center_lon: float, lats: FloatArray, lons: FloatArray, radius_km: float
+    ) -> BoolArray:
+        return cls.haversine_distances(center_lat, center_lon, lats, lons) <= radius_km
@@ -0,0 +1,72 @@
+import math
+
+from secunda.application.services.geo import BoundingBox
+
+
+class MortonCode:
+    # Z-order key of a point: latitude and longitude quantized to BITS bits each and interleaved,
+    # latitude bits at even positions. Points in one quadtree cell share a key prefix, so a cell is
+    # one contiguous key range and a B-tree index answers area queries with a few range scans.
+    BITS = 31
+    SCALE = 1 << BITS
+    # Ranges per area query; more ranges cover the area more tightly but cost more index probes.
+    MAX_RANGES = 16
+    # Cells enumerated at one level while looking for the tightest cover.
+    MAX_CELLS = 64
+
+    @classmethod
+    def _quantize(cls, value: float, offset: float, span: float) -> int:
+        # Mirrored by building_geo_key() from migration 006.
+        return min(cls.SCALE - 1, max(0, math.floor((value + offset) / span * cls.SCALE)))
+
+    @classmethod
+    def _spread(cls, value: int) -> int:
+        value = (value | (value << 16)) & 0x0000FFFF0000FFFF
+        value = (value | (value << 8)) & 0x00FF00FF00FF00FF
+        value = (value | (value << 4)) & 0x0F0F0F0F0F0F0F0F
+        value = (value | (value << 2)) & 0x3333333333333333
+        return (value | (value << 1)) & 0x5555555555555555
+
+    @classmethod
+    def _interleave(cls, lat_cell: int, lon_cell: int) -> int:
+        return cls._spread(lat_cell) | (cls._spread(lon_cell) << 1)
+
+    @classmethod
+    def encode(cls, lat: float, lon: float) -> int:
+        return cls._interleave(cls._quantize(lat, 90.0, 180.0), cls._quantize(lon, 180.0, 360.0))
+
+    @classmethod
+    def _cover(
+        cls, lat_cells: tuple[int, int], lon_cells: tuple[int, int], level: int
+    ) -> list[tuple[int, int]]:
+        shift = 2 * (cls.BITS - level)
+        lat_bits = [cls._spread(lat_cell) for lat_cell in range(lat_cells[0], lat_cells[1] + 1)]
+        lon_bits = [cls._spread(lon_cell) << 1 for lon_cell in range(lon_cells[0], lon_cells[1] + 1)]
+        prefixes = sorted(lat | lon for lat in lat_bits for lon in lon_bits)
+        ranges: list[tuple[int, int]] = []
+        for prefix in prefixes:
+            low, high = prefix << shift, ((prefix + 1) << shift) - 1
+            if ranges and ranges[-1][1] + 1 == low:
+                ranges[-1] = (ranges[-1][0], high)
+            else:
+                ranges.append((low, high))
+        return ranges
+
+    @classmethod
+    def ranges(cls, box: BoundingBox) -> list[tuple[int, int]]:
+        # Inclusive key ranges covering the box. Cells get finer level by level while the merged
+        # ranges stay within MAX_RANGES; the cover is a superset, so rows still need an exact check.
+        lat_low, lat_high = cls._quantize(box.min_lat, 90.0, 180.0), cls._quantize(box.max_lat, 90.0, 180.0)
+        lon_low, lon_high = cls._quantize(box.min_lon, 180.0, 360.0), cls._quantize(box.max_lon, 180.0, 360.0)
+        best = [(0, cls._interleave(cls.SCALE - 1, cls.SCALE - 1))]
+        for level in range(1, cls.BITS + 1):
+            shift = cls.BITS - level
+            lat_cells = (lat_low >> shift, lat_high >> shift)
+            lon_cells = (lon_low >> shift, lon_high >> shift)
+            if (lat_cells[1] - lat_cells[0] + 1) * (lon_cells[1] - lon_cells[0] + 1) > cls.MAX_CELLS:
+                break
+            cover = cls._cover(lat_cells, lon_cells, level)
+            if len(cover) > cls.MAX_RANGES:
+                break
+            best = cover
+        return best
@@ -0,0 +1,32 @@
+import re
+
+LEGAL_FORMS = (
+    "ооо",
+    "оао",
+    "зао",
+    "пао",
+    "ао",
+    "нао",
+    "ип",
+    "пбоюл",
+    "нко",
+    "ано",
+    "гуп",
+    "муп",
+    "фгуп",
+    "тсж",
+    "снт",
+)
+
+
+class OrganizationNameNormalizer:
+    QUOTES_PATTERN = re.compile(r"[\"'`«»„“”‘’]")
+    # Explicit word characters instead of \b keep this in line with the generated search_name column.
+    LEGAL_FORMS_PATTERN = re.compile(rf"(?<![0-9a-zа-я_])(?:{'|'.join(LEGAL_FORMS)})(?![0-9a-zа-я_])\.?")
+
+    @classmethod
+    def normalize(cls, name: str) -> str:
+        value = name.lower().replace("ё", "е")
+        value = cls.QUOTES_PATTERN.sub(" ", value)
+        value = cls.LEGAL_FORMS_PATTERN.sub(" ", value)
+        return " ".join(value.split())
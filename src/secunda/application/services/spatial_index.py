@@ -0,0 +1,136 @@
+import math
+from collections.abc import Iterator, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from secunda.application.services.geo import GeoService
+
+IntArray = npt.NDArray[np.int64]
+
+# Cell keys pack (row, col) into one int64 so that every row of a query
+# window is a single contiguous slice of the sorted key array.
+_CELL_OFFSET = 1 << 24
+_ROW_STRIDE = 1 << 26
+# The nearest search starts from a circle this many times narrower than a cell.
+_NEAREST_START_FRACTION = 8
+
+
+class GridSpatialIndex:
+    def __init__(self, cell_size_deg: float = 0.05) -> None:
+        self._cell_size_deg = cell_size_deg
+        self._keys: IntArray = np.empty(0, dtype=np.int64)
+        self._ids: IntArray = np.empty(0, dtype=np.int64)
+        self._lats = np.empty(0, dtype=np.float64)
+        self._lons = np.empty(0, dtype=np.float64)
+        self._pending: list[tuple[int, float, float]] = []
+        self._row_range = (0, -1)
+        self._col_range = (0, -1)
+
+    def __len__(self) -> int:
+        return len(self._ids) + len(self._pending)
+
+    def _cell(self, value: float) -> int:
+        return math.floor(value / self._cell_size_deg)
+
+    def _cell_key(self, row: IntArray | int, col: IntArray | int) -> IntArray:
+        return (np.asarray(row, dtype=np.int64) + _CELL_OFFSET) * _ROW_STRIDE + (col + _CELL_OFFSET)
+
+    def add(self, building_id: int, lat: float, lon: float) -> None:
+        self._pending.append((building_id, lat, lon))
+
+    def _compact(self) -> None:
+        if not self._pending:
+            return
+        pending_ids, pending_lats, pending_lons = zip(*self._pending)
+        self._pending = []
+
+        ids = np.concatenate([self._ids, np.array(pending_ids, dtype=np.int64)])
+        lats = np.concatenate([self._lats, np.array(pending_lats, dtype=np.float64)])
+        lons = np.concatenate([self._lons, np.array(pending_lons, dtype=np.float64)])
+        rows = np.floor(lats / self._cell_size_deg).astype(np.int64)
+        cols = np.floor(lons / self._cell_size_deg).astype(np.int64)
+        keys = self._cell_key(rows, cols)
+
+        order = np.argsort(keys, kind="stable")
+        self._keys = np.ascontiguousarray(keys[order])
+        self._ids = np.ascontiguousarray(ids[order])
+        self._lats = np.ascontiguousarray(lats[order])
+        self._lons = np.ascontiguousarray(lons[order])
+        self._row_range = (int(rows.min()), int(rows.max()))
+        self._col_range = (int(cols.min()), int(cols.max()))
+
+    def _row_slices(self, rows: IntArray, min_col: int, max_col: int) -> IntArray:
+        starts = np.searchsorted(self._keys, self._cell_key(rows, min_col), side="left")
+        stops = np.searchsorted(self._keys, self._cell_key(rows, max_col), side="right")
+        slices = [np.arange(start, stop) for start, stop in zip(starts, stops) if stop > start]
+        return np.concatenate(slices) if slices else np.empty(0, dtype=np.int64)
+
+    def _candidates(self, min_lat: float, max_lat: float, min_lon: float, max_lon: float) -> IntArray:
+        # Clipped to the cells that hold buildings, so a column window never spills into the next row.
+        self._compact()
+        min_row = max(self._cell(min_lat), self._row_range[0])
+        max_row = min(self._cell(max_lat), self._row_range[1])
+        min_col = max(self._cell(min_lon), self._col_range[0])
+        max_col = min(self._cell(max_lon), self._col_range[1])
+        if min_row > max_row or min_col > max_col or not len(self._keys):
+            return np.empty(0, dtype=np.int64)
+        return self._row_slices(np.arange(min_row, max_row + 1, dtype=np.int64), min_col, max_col)
+
+    def _in_cap(self, lat: float, lon: float, radius_km: float) -> IntArray:
+        # Positions of candidates for a circle: every box of its spherical cap.
+        boxes = GeoService.cap_boxes(lat, lon, radius_km)
+        return np.unique(
+            np.concatenate(
+                [self._candidates(box.min_lat, box.max_lat, box.min_lon, box.max_lon) for box in boxes]
+            )
+        )
+
+    def iter_nearest(
+        self, lat: float, lon: float, max_distance_km: float = math.inf, only: Sequence[int] | None = None
+    ) -> Iterator[list[tuple[int, float]]]:
+        # Searches circles whose radius doubles from a fraction of a cell. Each step yields, nearest
+        # first, the candidates between the previous radius and its own: everything inside the circle
+        # has been seen, so they are final and the caller stops as soon as it has enough. The search
+        # ends at max_distance_km or once the circle covers the globe; `only` restricts the
+        # candidates to these ids.
+        self._compact()
+        if not len(self._ids):
+            return
+        only_ids = np.asarray(only, dtype=np.int64) if only is not None else None
+        limit = min(max_distance_km, math.pi * GeoService.EARTH_RADIUS_KM)
+        inner, radius = -1.0, self._cell_size_deg * GeoService.DEGREES_PER_KM / _NEAREST_START_FRACTION
+        while inner < limit:
+            radius = min(radius, limit)
+            positions = self._in_cap(lat, lon, radius)
+            if only_ids is not None and len(positions):
+                positions = positions[np.isin(self._ids[positions], only_ids)]
+            distances = GeoService.haversine_distances(lat, lon, self._lats[positions], self._lons[positions])
+            ring = (distances > inner) & (distances <= radius)
+            if ring.any():
+                order = np.argsort(distances[ring], kind="stable")
+                yield list(zip(self._ids[positions[ring]][order].tolist(), distances[ring][order].tolist()))
+            inner, radius = radius, radius * 2
+
+    def in_rectangle(self, min_lat: float, max_lat: float, min_lon: float, max_lon: float) -> list[int]:
+        positions = self._candidates(min_lat, max_lat, min_lon, max_lon)
+        lats = self._lats[positions]
+        lons = self._lons[positions]
+        mask = (lats >= min_lat) & (lats <= max_lat) & (lons >= min_lon) & (lons <= max_lon)
+        return self._ids[positions[mask]].tolist()
+
+    def in_radius(self, lat: float, lon: float, radius_km: float) -> list[int]:
+        positions = self._in_cap(lat, lon, radius_km)
+        mask = GeoService.within_radius_mask(
+            lat, lon, self._lats[positions], self._lons[positions], radius_km
+        )
+        return self._ids[positions[mask]].tolist()
+
+    def nearest_in_radius(self, lat: float, lon: float, radius_km: float) -> list[tuple[int, float]]:
+        # Ids with their distances, nearest first and by id on ties.
+        positions = self._in_cap(lat, lon, radius_km)
+        distances = GeoService.haversine_distances(lat, lon, self._lats[positions], self._lons[positions])
+        near = distances <= radius_km
+        ids, distances = self._ids[positions[near]], distances[near]
+        order = np.lexsort((ids, distances))
+        return list(zip(ids[order].tolist(), distances[order].tolist()))
@@ -0,0 +1,3 @@
+from .loader import BulkImportSources, BulkImportStats, BulkLoader
+
+__all__ = ["BulkImportSources", "BulkImportStats", "BulkLoader"]
@@ -0,0 +1,152 @@
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from asyncpg import Connection
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from secunda.application.constants import MAX_ACTIVITY_NESTING_LEVEL
+from secunda.infra.bulk.readers import batched, parse_optional_int, parse_phones, read_records
+from secunda.infra.database.models import ActivityModel
+from secunda.infra.repositories.activity import build_activity_path
+
+DEFAULT_BATCH_SIZE = 50_000
+
+BUILDING_COLUMNS = ("id", "address", "latitude", "longitude")
+ACTIVITY_COLUMNS = ("id", "name", "parent_id", "level", "path")
+ORGANIZATION_COLUMNS = ("id", "name", "phones", "building_id")
+ORGANIZATION_ACTIVITY_COLUMNS = ("organization_id", "activity_id")
+
+TABLES = ("buildings", "activities", "organizations", "organization_activity")
+
+
+@dataclass
+class BulkImportSources:
+    buildings: Path | None = None
+    activities: Path | None = None
+    organizations: Path | None = None
+    organization_activities: Path | None = None
+
+
+@dataclass
+class BulkImportStats:
+    rows: dict[str, int] = field(default_factory=lambda: dict.fromkeys(TABLES, 0))
+
+
+def building_records(records: Iterable[dict[str, Any]]) -> Iterator[tuple[Any, ...]]:
+    for record in records:
+        yield int(record["id"]), record["address"], float(record["latitude"]), float(record["longitude"])
+
+
+def organization_records(records: Iterable[dict[str, Any]]) -> Iterator[tuple[Any, ...]]:
+    for record in records:
+        yield (
+            int(record["id"]),
+            record["name"],
+            json.dumps(parse_phones(record.get("phones")), ensure_ascii=False),
+            int(record["building_id"]),
+        )
+
+
+def organization_activity_records(records: Iterable[dict[str, Any]]) -> Iterator[tuple[Any, ...]]:
+    for record in records:
+        yield int(record["organization_id"]), int(record["activity_id"])
+
+
+def resolve_activities(
+    records: Iterable[dict[str, Any]], existing: dict[int, tuple[int, str]]
+) -> list[tuple[Any, ...]]:
+    pending = {int(record["id"]): record for record in records}
+    resolved = dict(existing)
+
+    def resolve(activity_id: int, chain: tuple[int, ...] = ()) -> tuple[int, str]:
+        if activity_id in resolved:
+            return resolved[activity_id]
+        if activity_id in chain:
+            raise ValueError(f"Цикл в дереве деятельностей: {activity_id}")
+        if activity_id not in pending:
+            raise ValueError(f"Неизвестная родительская деятельность: {activity_id}")
+        parent_id = parse_optional_int(pending[activity_id].get("parent_id"))
+        level, parent_path = 0, ""
+        if parent_id is not None:
+            level, parent_path = resolve(parent_id, (*chain, activity_id))
+        if level + 1 > MAX_ACTIVITY_NESTING_LEVEL:
+            raise ValueError(f"Максимальный уровень вложенности: {MAX_ACTIVITY_NESTING_LEVEL}")
+        resolved[activity_id] = (level + 1, build_activity_path(activity_id, parent_path))
+        return resolved[activity_id]
+
+    rows = []
+    for activity_id, record in pending.items():
+        level, path = resolve(activity_id)
+        rows.append((activity_id, record["name"], parse_optional_int(record.get("parent_id")), level, path))
+    # Parents first, so the self-referencing foreign key holds row by row.
+    rows.sort(key=lambda row: row[3])
+    return rows
+
+
+class BulkLoader:
+    def __init__(self, engine: AsyncEngine, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self._engine = engine
+        self._batch_size = batch_size
+
+    async def _copy(
+        self,
+        connection: Connection,
+        table: str,
+        columns: tuple[str, ...],
+        records: Iterator[tuple[Any, ...]],
+        stats: BulkImportStats,
+    ) -> None:
+        for batch in batched(records, self._batch_size):
+            await connection.copy_records_to_table(table, records=batch, columns=columns)
+            stats.rows[table] += len(batch)
+
+    async def _reset_sequences(self, connection: Connection) -> None:
+        for table in ("buildings", "activities", "organizations"):
+            await connection.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"coalesce(max(id), 1), max(id) IS NOT NULL) FROM {table}"
+            )
+
+    async def load(self, sources: BulkImportSources, truncate: bool = False) -> BulkImportStats:
+        stats = BulkImportStats()
+        async with self._engine.connect() as sa_connection:
+            existing_activities: dict[int, tuple[int, str]] = {}
+            if not truncate:
+                result = await sa_connection.execute(
+                    select(ActivityModel.id, ActivityModel.level, ActivityModel.path)
+                )
+                existing_activities = {row.id: (row.level, row.path) for row in result}
+                await sa_connection.rollback()
+
+            raw_connection = await sa_connection.get_raw_connection()
+            connection: Connection = raw_connection.driver_connection
+            async with connection.transaction():
+                if truncate:
+                    await connection.execute(f"TRUNCATE TABLE {', '.join(reversed(TABLES))} RESTART IDENTITY")
+
+                if sources.buildings:
+                    await self._copy(
+                        connection, "buildings", BUILDING_COLUMNS,
+                        building_records(read_records(sources.buildings)), stats,
+                    )
+                if sources.activities:
+                    activities = resolve_activities(read_records(sources.activities), existing_activities)
+                    await self._copy(connection, "activities", ACTIVITY_COLUMNS, iter(activities), stats)
+                if sources.organizations:
+                    await self._copy(
+                        connection, "organizations", ORGANIZATION_COLUMNS,
+                        organization_records(read_records(sources.organizations)), stats,
+                    )
+                if sources.organization_activities:
+                    await self._copy(
+                        connection, "organization_activity", ORGANIZATION_ACTIVITY_COLUMNS,
+                        organization_activity_records(read_records(sources.organization_activities)), stats,
+                    )
+                await self._reset_sequences(connection)
+
+            await connection.execute(f"ANALYZE {', '.join(TABLES)}")
+        return stats
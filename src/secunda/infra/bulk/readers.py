@@ -0,0 +1,44 @@
+import csv
+import json
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+NDJSON_SUFFIXES = {".ndjson", ".jsonl"}
+
+
+def read_records(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open(encoding="utf-8", newline="") as file:
+        if path.suffix.lower() in NDJSON_SUFFIXES:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+        elif path.suffix.lower() == ".csv":
+            yield from csv.DictReader(file)
+        else:
+            raise ValueError(f"Неподдерживаемый формат файла: {path.name} (ожидается .csv или .ndjson)")
+
+
+def batched(iterable: Iterator[T], size: int) -> Iterator[list[T]]:
+    while batch := list(islice(iterable, size)):
+        yield batch
+
+
+def parse_optional_int(value: Any) -> int | None:
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+def parse_phones(value: Any) -> list[str]:
+    if value is None or value == "":
+        return []
+    if isinstance(value, list):
+        return [str(phone) for phone in value]
+    value = str(value).strip()
+    if value.startswith("["):
+        return [str(phone) for phone in json.loads(value)]
+    return [phone.strip() for phone in value.split(";") if phone.strip()]
@@ -0,0 +1,16 @@
+from .activity_tree import ActivityTreeCache
+from .building_index import BuildingIndexCache
+from .response import InMemoryResponseCache, NullResponseCache, PrimaryReadCache, RedisResponseCache
+from .single_flight import SingleFlightResponseCache
+from .snapshot import SnapshotCache
+
+__all__ = [
+    "ActivityTreeCache",
+    "BuildingIndexCache",
+    "InMemoryResponseCache",
+    "NullResponseCache",
+    "PrimaryReadCache",
+    "RedisResponseCache",
+    "SingleFlightResponseCache",
+    "SnapshotCache",
+]
@@ -0,0 +1,6 @@
+from secunda.application.services import ActivityTree
+from secunda.infra.cache.snapshot import SnapshotCache
+
+
+class ActivityTreeCache(SnapshotCache[ActivityTree]):
+    name = "activity_tree"
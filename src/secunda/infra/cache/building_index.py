@@ -0,0 +1,10 @@
+from secunda.application.entities import BuildingEntity
+from secunda.application.services import GridSpatialIndex
+from secunda.infra.cache.snapshot import SnapshotCache
+
+
+class BuildingIndexCache(SnapshotCache[GridSpatialIndex]):
+    name = "building_index"
+
+    def add(self, building: BuildingEntity) -> None:
+        self.update(lambda index: index.add(building.id, building.latitude, building.longitude))
@@ -0,0 +1,28 @@
+import time
+from collections import defaultdict
+
+
+# Every group has a generation that invalidate() bumps. A load that raced with invalidate() may
+# predate the write, and for settle_seconds after it a lagging replica may still return older
+# rows: such a load is served once, but never kept.
+class Generations:
+    def __init__(self, settle_seconds: float = 0.0) -> None:
+        self._settle_seconds = settle_seconds
+        self._generations: defaultdict[str, int] = defaultdict(int)
+        self._invalidated_at: dict[str, float] = {}
+
+    def __getitem__(self, group: str) -> int:
+        return self._generations[group]
+
+    def invalidate(self, *groups: str) -> None:
+        now = time.monotonic()
+        for group in groups:
+            self._generations[group] += 1
+            self._invalidated_at[group] = now
+
+    def settling(self, group: str) -> bool:
+        invalidated_at = self._invalidated_at.get(group)
+        return invalidated_at is not None and time.monotonic() - invalidated_at < self._settle_seconds
+
+    def can_keep(self, group: str, generation: int) -> bool:
+        return generation == self._generations[group] and not self.settling(group)
@@ -0,0 +1,209 @@
+import functools
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from pydantic import TypeAdapter, ValidationError
+
+from secunda.application.interfaces import ResponseCacheProtocol
+from secunda.infra.cache.generations import Generations
+from secunda.infra.metrics import count_cache_lookup
+
+T = TypeVar("T")
+
+CACHE_NAME = "response"
+
+logger = logging.getLogger(__name__)
+
+
+@functools.cache
+def _adapter(result_type: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(result_type)
+
+
+# Every group has a generation that is part of each cached entry: invalidate()
+# bumps it, so older entries stop matching without scanning the cache. Shared
+# generations double as table versions for HTTP entity tags.
+class LocalTableVersions:
+    # Counters are per process. With a single worker they see every write and, with an epoch that
+    # changes on restart, version responses; another worker would neither see them nor a write made
+    # through it, so with several workers no entity tag is issued.
+    def __init__(self, settle_seconds: float = 0.0, single_process: bool = False) -> None:
+        self._generations = Generations(settle_seconds)
+        self._epoch = secrets.token_hex(4) if single_process else None
+
+    async def current(self, *groups: str) -> str | None:
+        if self._epoch is None:
+            return None
+        # A body read from a lagging replica must not get the tag of the new version.
+        if any(self._generations.settling(group) for group in groups):
+            return None
+        return ".".join([self._epoch, *(str(self._generations[group]) for group in groups)])
+
+    async def invalidate(self, *groups: str) -> None:
+        self._generations.invalidate(*groups)
+
+    async def close(self) -> None:
+        return None
+
+
+class NullResponseCache(LocalTableVersions):
+    async def get_or_load(self, group: str, key: str, result_type: Any, loader: Callable[[], Awaitable[T]]) -> T:
+        return await loader()
+
+
+class PrimaryReadCache:
+    # For clients inside the read-your-writes window: their loads go to the primary and skip the
+    # shared cache, which may hold rows a lagging replica returned right after their write.
+    def __init__(self, cache: ResponseCacheProtocol) -> None:
+        self._cache = cache
+
+    async def get_or_load(self, group: str, key: str, result_type: Any, loader: Callable[[], Awaitable[T]]) -> T:
+        return await loader()
+
+    async def invalidate(self, *groups: str) -> None:
+        await self._cache.invalidate(*groups)
+
+
+class InMemoryResponseCache(LocalTableVersions):
+    def __init__(
+        self, ttl_seconds: float, max_entries: int, settle_seconds: float = 0.0, single_process: bool = False
+    ) -> None:
+        super().__init__(settle_seconds, single_process)
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[int, float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load(self, group: str, key: str, result_type: Any, loader: Callable[[], Awaitable[T]]) -> T:
+        entry_key = (group, key)
+        generation = self._generations[group]
+        entry = self._entries.get(entry_key)
+        if entry is not None:
+            entry_generation, expires_at, value = entry
+            if entry_generation == generation and expires_at > time.monotonic():
+                self._entries.move_to_end(entry_key)
+                count_cache_lookup(CACHE_NAME, hit=True)
+                return value
+            del self._entries[entry_key]
+
+        count_cache_lookup(CACHE_NAME, hit=False)
+        value = await loader()
+        if not self._generations.can_keep(group, generation):
+            return value
+        self._entries[entry_key] = (generation, time.monotonic() + self._ttl_seconds, value)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    async def close(self) -> None:
+        self._entries.clear()
+
+
+class RedisResponseCache:
+    # Shared by all workers; the size bound is left to the server's maxmemory policy.
+    def __init__(
+        self, url: str, ttl_seconds: float, settle_seconds: float = 0.0, prefix: str = "secunda:cache"
+    ) -> None:
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise RuntimeError("Для response_cache_backend=redis установите пакет redis") from e
+
+        self._redis = Redis.from_url(url)
+        self._ttl_ms = max(1, int(ttl_seconds * 1000))
+        self._settle_ms = int(settle_seconds * 1000)
+        self._prefix = prefix
+
+    def _generation_key(self, group: str) -> str:
+        return f"{self._prefix}:{group}:generation"
+
+    def _settling_key(self, group: str) -> str:
+        # Set by invalidate() and expiring after settle_seconds, while replicas may still lag.
+        return f"{self._prefix}:{group}:settling"
+
+    def _entry_key(self, group: str, generation: int, key: str) -> str:
+        return f"{self._prefix}:{group}:{generation}:{key}"
+
+    async def current(self, *groups: str) -> str | None:
+        from redis.exceptions import RedisError
+
+        # Generations restart from zero if the server loses its data; the epoch key changes with them.
+        epoch_key = f"{self._prefix}:epoch"
+        keys = [
+            epoch_key,
+            *(self._generation_key(group) for group in groups),
+            *(self._settling_key(group) for group in groups),
+        ]
+        try:
+            values = await self._redis.mget(keys)
+            if values[0] is None:
+                await self._redis.set(epoch_key, secrets.token_hex(4), nx=True)
+                values = await self._redis.mget(keys)
+        except RedisError:
+            logger.warning("Response cache is unavailable, versions are unknown", exc_info=True)
+            return None
+        generations, settling = values[1 : len(groups) + 1], values[len(groups) + 1 :]
+        # A body read from a lagging replica must not get the tag of the new version.
+        if any(value is not None for value in settling):
+            return None
+        return ".".join([values[0].decode(), *(str(int(value or 0)) for value in generations)])
+
+    async def get_or_load(self, group: str, key: str, result_type: Any, loader: Callable[[], Awaitable[T]]) -> T:
+        from redis.exceptions import RedisError
+
+        try:
+            generation, settling = await self._redis.mget(
+                self._generation_key(group), self._settling_key(group)
+            )
+            entry_key = self._entry_key(group, int(generation or 0), key)
+            cached = await self._redis.get(entry_key)
+        except RedisError:
+            logger.warning("Response cache is unavailable, reading from the database", exc_info=True)
+            return await loader()
+        adapter = _adapter(result_type)
+        if cached is not None:
+            # Entries are plain JSON validated into the expected type: whoever can write to the
+            # server can at most poison a response, not run code in the workers.
+            try:
+                value = adapter.validate_json(cached)
+            except ValidationError:
+                logger.warning("Discarding a malformed response cache entry %s", entry_key)
+            else:
+                count_cache_lookup(CACHE_NAME, hit=True)
+                return value
+        count_cache_lookup(CACHE_NAME, hit=False)
+
+        value = await loader()
+        if settling is not None:
+            return value
+        # Stored under the generation read before the load, so a racing invalidate() hides it.
+        try:
+            await self._redis.set(entry_key, adapter.dump_json(value), px=self._ttl_ms)
+        except RedisError:
+            logger.warning("Failed to store a response cache entry", exc_info=True)
+        return value
+
+    async def invalidate(self, *groups: str) -> None:
+        if not groups:
+            return
+        from redis.exceptions import RedisError
+
+        # The write is already committed, so a failed invalidation only costs staleness up to the TTL.
+        try:
+            async with self._redis.pipeline(transaction=False) as pipeline:
+                for group in groups:
+                    pipeline.incr(self._generation_key(group))
+                    if self._settle_ms > 0:
+                        pipeline.set(self._settling_key(group), 1, px=self._settle_ms)
+                await pipeline.execute()
+        except RedisError:
+            logger.warning("Failed to invalidate response cache groups %s", groups, exc_info=True)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
@@ -0,0 +1,61 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from secunda.infra.cache.response import InMemoryResponseCache, NullResponseCache, RedisResponseCache
+from secunda.infra.metrics import count_cache_lookup
+
+T = TypeVar("T")
+
+ResponseCache = InMemoryResponseCache | NullResponseCache | RedisResponseCache
+
+
+# Concurrent get_or_load calls with the same group and key share one in-flight load:
+# the first caller runs its loader, the others await the same task. Wraps any response
+# cache, so identical queries are collapsed even with response_cache_backend=none.
+class SingleFlightResponseCache:
+    def __init__(self, cache: ResponseCache) -> None:
+        self._cache = cache
+        self._in_flight: dict[tuple[str, str], asyncio.Task[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def get_or_load(self, group: str, key: str, result_type: Any, loader: Callable[[], Awaitable[T]]) -> T:
+        flight_key = (group, key)
+        while True:
+            task = self._in_flight.get(flight_key)
+            if task is None or task.cancelled():
+                count_cache_lookup("single_flight", hit=False)
+                return await self._lead(flight_key, result_type, loader)
+            count_cache_lookup("single_flight", hit=True)
+            try:
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                # The loader runs on the leader's session and dies with its request; a follower
+                # that was not cancelled itself starts the load over.
+                current = asyncio.current_task()
+                if not task.cancelled() or (current is not None and current.cancelling()):
+                    raise
+
+    async def _lead(self, flight_key: tuple[str, str], result_type: Any, loader: Callable[[], Awaitable[T]]) -> T:
+        group, key = flight_key
+        task = asyncio.ensure_future(self._cache.get_or_load(group, key, result_type, loader))
+        self._in_flight[flight_key] = task
+        try:
+            return await task
+        finally:
+            if self._in_flight.get(flight_key) is task:
+                del self._in_flight[flight_key]
+
+    async def invalidate(self, *groups: str) -> None:
+        # Loads started before the write may return old rows: later callers must not join them.
+        for flight_key in [flight_key for flight_key in self._in_flight if flight_key[0] in groups]:
+            del self._in_flight[flight_key]
+        await self._cache.invalidate(*groups)
+
+    async def current(self, *groups: str) -> str | None:
+        return await self._cache.current(*groups)
+
+    async def close(self) -> None:
+        await self._cache.close()
@@ -0,0 +1,55 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+from secunda.infra.cache.generations import Generations
+from secunda.infra.metrics import count_cache_lookup
+
+T = TypeVar("T")
+
+
+class SnapshotCache(Generic[T]):
+    name = "snapshot"
+
+    # ttl_seconds bounds how long a snapshot can miss writes made by other worker processes;
+    # settle_seconds is how long after a write a replica may still load it without that write.
+    def __init__(self, ttl_seconds: float | None = None, settle_seconds: float = 0.0) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._snapshot: T | None = None
+        self._loaded_at = 0.0
+        self._generations = Generations(settle_seconds)
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        if self._snapshot is None:
+            return False
+        if self._ttl_seconds is None:
+            return True
+        return time.monotonic() - self._loaded_at < self._ttl_seconds
+
+    async def get(self, loader: Callable[[], Awaitable[T]]) -> T:
+        if self._is_fresh():
+            count_cache_lookup(self.name, hit=True)
+            return self._snapshot  # type: ignore[return-value]
+
+        async with self._lock:
+            if self._is_fresh():
+                count_cache_lookup(self.name, hit=True)
+                return self._snapshot  # type: ignore[return-value]
+            count_cache_lookup(self.name, hit=False)
+            generation = self._generations[self.name]
+            snapshot = await loader()
+            if self._generations.can_keep(self.name, generation):
+                self._snapshot = snapshot
+                self._loaded_at = time.monotonic()
+            return snapshot
+
+    def update(self, apply: Callable[[T], None]) -> None:
+        self._generations.invalidate(self.name)
+        if self._snapshot is not None:
+            apply(self._snapshot)
+
+    def invalidate(self) -> None:
+        self._generations.invalidate(self.name)
+        self._snapshot = None
@@ -1,7 +1,12 @@
-from pydantic import Field
+from typing import Literal
+
+from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+GeoBackend = Literal["memory", "gist", "morton"]
+
+
 class ProjectBaseSettings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -20,14 +25,64 @@ class PostgresSettings(ProjectBaseSettings):
     user: str = Field(default="postgres")
     password: str = Field(default="postgres")
     database: str = Field(default="secunda")
+    # Full SQLAlchemy URLs of streaming replicas, as a JSON list; empty sends reads to the primary.
+    replica_urls: list[str] = Field(default_factory=list)
+    read_your_writes_seconds: float = Field(default=5.0, ge=0)
+    # Connection pool of every engine (the primary and each replica), per worker process.
+    pool_size: int = Field(default=15, ge=1)
+    max_overflow: int = Field(default=15, ge=0)
+    pool_timeout_seconds: float = Field(default=30.0, gt=0)
+    pool_recycle_seconds: int = Field(default=-1)
+    # Opt-in: a round-trip on every checkout, worth it only where idle connections get dropped.
+    pool_pre_ping: bool = Field(default=False)
+    # When set, the budget is split between workers in the pool_size:max_overflow proportion.
+    max_connections: int | None = Field(default=None, ge=1)
+    workers: int = Field(default=1, ge=1, validation_alias=AliasChoices("POSTGRES_WORKERS", "WEB_CONCURRENCY"))
+    # Prepared statements cached per connection; 0 behind PgBouncer in transaction mode.
+    statement_cache_size: int = Field(default=100, ge=0)
+    statement_timeout_ms: int | None = Field(default=None, ge=0)
+    idle_in_transaction_session_timeout_ms: int | None = Field(default=None, ge=0)
 
     model_config = SettingsConfigDict(env_prefix="POSTGRES_")
 
     def async_url(self) -> str:
         return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}?ssl=disable"
 
+    def pool_limits(self) -> tuple[int, int]:
+        if self.max_connections is None:
+            return self.pool_size, self.max_overflow
+        per_worker = max(1, self.max_connections // self.workers)
+        pool_size = max(1, per_worker * self.pool_size // (self.pool_size + self.max_overflow))
+        return pool_size, per_worker - pool_size
+
+    def replica_lag_seconds(self) -> float:
+        # How long a replica may trail a write; without replicas reads see every write at once.
+        return self.read_your_writes_seconds if self.replica_urls else 0.0
+
+    def server_settings(self) -> dict[str, str]:
+        settings = {
+            "statement_timeout": self.statement_timeout_ms,
+            "idle_in_transaction_session_timeout": self.idle_in_transaction_session_timeout_ms,
+        }
+        return {name: str(value) for name, value in settings.items() if value is not None}
+
 
 class AppSettings(ProjectBaseSettings):
     debug: bool = Field(default=False)
+    # With debug, a request repeating one statement shape more often than this is logged as N+1.
+    n_plus_one_threshold: int = Field(default=5, ge=1)
+    activity_cache_ttl_seconds: float = Field(default=60.0)
+    building_index_ttl_seconds: float = Field(default=300.0)
+    building_index_cell_size_deg: float = Field(default=0.05, gt=0)
+    # Radius and rectangle searches: "gist" filters buildings.location in SQL, "morton" scans
+    # key ranges of buildings.geo_key, "memory" takes building ids from the in-process grid index.
+    geo_backend: GeoBackend = Field(default="gist")
+    # "redis" keeps table versions shared by all workers; "memory" and "none" version responses only
+    # with a single worker (POSTGRES_WORKERS or WEB_CONCURRENCY), otherwise no ETag is issued.
+    response_cache_backend: Literal["memory", "redis", "none"] = Field(default="memory")
+    response_cache_ttl_seconds: float = Field(default=30.0, gt=0)
+    response_cache_max_entries: int = Field(default=10_000, gt=0)
+    response_cache_redis_url: str = Field(default="redis://localhost:6379/0")
+    single_flight: bool = Field(default=True)
 
     model_config = SettingsConfigDict(env_prefix="APP_")
@@ -1,3 +1,10 @@
-from .session import new_session_maker
+from .routing import ReadYourWritesMiddleware, wrote_recently
+from .session import ReadSessionMaker, new_read_session_maker, new_session_maker
 
-__all__ = ["new_session_maker"]
+__all__ = [
+    "ReadSessionMaker",
+    "ReadYourWritesMiddleware",
+    "new_read_session_maker",
+    "new_session_maker",
+    "wrote_recently",
+]
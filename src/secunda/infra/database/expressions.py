@@ -0,0 +1,10 @@
+from collections.abc import Iterable
+
+from sqlalchemy import BigInteger, ColumnElement, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+
+
+def in_ids(column: ColumnElement[int], ids: Iterable[int]) -> ColumnElement[bool]:
+    # One array parameter instead of one bind per id keeps large id sets
+    # under asyncpg's 32767 arguments limit.
+    return column == any_(bindparam(None, list(ids), type_=ARRAY(BigInteger)))
@@ -0,0 +1,41 @@
+import math
+from typing import Any
+
+from sqlalchemy import ColumnElement, Float, func, literal
+from sqlalchemy.types import UserDefinedType
+
+from secunda.application.services import BoundingBox, GeoService
+
+
+class Point(UserDefinedType[Any]):
+    # Postgres' built-in geometric point, (x, y) = (longitude, latitude); no extension needed.
+    cache_ok = True
+
+    def get_col_spec(self, **_: Any) -> str:
+        return "POINT"
+
+
+def _float(value: float) -> ColumnElement[float]:
+    return literal(value, Float)
+
+
+def point(lat: float, lon: float) -> ColumnElement[Any]:
+    return func.point(_float(lon), _float(lat), type_=Point)
+
+
+def in_box(location: ColumnElement[Any], box: BoundingBox) -> ColumnElement[bool]:
+    # Served by a GiST index on the location column; boundaries are inclusive.
+    corners = func.box(point(box.min_lat, box.min_lon), point(box.max_lat, box.max_lon))
+    return location.op("<@")(corners)
+
+
+def haversine_km(
+    latitude: ColumnElement[float], longitude: ColumnElement[float], lat: float, lon: float
+) -> ColumnElement[float]:
+    # Same formula as GeoService.haversine_distance; least() keeps rounding from pushing asin out of range.
+    half_dlat = func.radians(latitude - _float(lat)) / _float(2.0)
+    half_dlon = func.radians(longitude - _float(lon)) / _float(2.0)
+    a = func.power(func.sin(half_dlat), 2) + _float(math.cos(math.radians(lat))) * func.cos(
+        func.radians(latitude)
+    ) * func.power(func.sin(half_dlon), 2)
+    return 2 * GeoService.EARTH_RADIUS_KM * func.asin(func.sqrt(func.least(_float(1.0), a)))
@@ -3,9 +3,11 @@ from datetime import datetime
 from sqlalchemy import (
     BigInteger,
     CheckConstraint,
+    Computed,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     JSON,
     String,
     Table,
@@ -14,6 +16,9 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+from secunda.application.services.name_normalizer import LEGAL_FORMS
+from secunda.infra.database.geo import Point
+
 
 class Base(DeclarativeBase):
     pass
@@ -24,6 +29,7 @@ organization_activity = Table(
     Base.metadata,
     Column("organization_id", BigInteger, ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True),
     Column("activity_id", BigInteger, ForeignKey("activities.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_organization_activity_activity_id", "activity_id"),
 )
 
 
@@ -34,12 +40,28 @@ class BuildingModel(Base):
     address: Mapped[str] = mapped_column(String(500), nullable=False)
     latitude: Mapped[float] = mapped_column(Float, nullable=False)
     longitude: Mapped[float] = mapped_column(Float, nullable=False)
+    # Kept by Postgres from latitude/longitude; only read through SQL predicates.
+    location: Mapped[tuple[float, float]] = mapped_column(
+        Point, Computed("point(longitude, latitude)", persisted=True), deferred=True
+    )
+    # MortonCode.encode of latitude/longitude, kept by Postgres through building_geo_key().
+    geo_key: Mapped[int] = mapped_column(
+        BigInteger,
+        Computed("building_geo_key(latitude, longitude)", persisted=True),
+        nullable=False,
+        index=True,
+        deferred=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
+    __table_args__ = (
+        Index("ix_buildings_location", "location", postgresql_using="gist"),
+    )
+
     organizations: Mapped[list["OrganizationModel"]] = relationship(
-        back_populates="building", lazy="selectin"
+        back_populates="building", lazy="raise"
     )
 
 
@@ -49,9 +71,10 @@ class ActivityModel(Base):
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     parent_id: Mapped[int | None] = mapped_column(
-        BigInteger, ForeignKey("activities.id", ondelete="CASCADE"), nullable=True
+        BigInteger, ForeignKey("activities.id", ondelete="CASCADE"), nullable=True, index=True
     )
     level: Mapped[int] = mapped_column(default=1, nullable=False)
+    path: Mapped[str] = mapped_column(String(64, collation="C"), nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -64,29 +87,50 @@ class ActivityModel(Base):
         back_populates="children", remote_side=[id], lazy="joined"
     )
     children: Mapped[list["ActivityModel"]] = relationship(
-        back_populates="parent", lazy="selectin"
+        back_populates="parent", lazy="raise"
     )
     organizations: Mapped[list["OrganizationModel"]] = relationship(
-        secondary=organization_activity, back_populates="activities", lazy="selectin"
+        secondary=organization_activity, back_populates="activities", lazy="raise"
     )
 
 
+# Mirrors OrganizationNameNormalizer.normalize; Postgres keeps the column in step with name.
+SEARCH_NAME_SQL = (
+    "btrim(regexp_replace(regexp_replace("
+    "regexp_replace(replace(lower(name), 'ё', 'е'), '[\"''`«»„“”‘’]', ' ', 'g'), "
+    f"'(?<![0-9a-zа-я_])({'|'.join(LEGAL_FORMS)})(?![0-9a-zа-я_])\\.?', ' ', 'g'), "
+    "'\\s+', ' ', 'g'))"
+)
+
+
 class OrganizationModel(Base):
     __tablename__ = "organizations"
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    search_name: Mapped[str] = mapped_column(
+        String(255), Computed(SEARCH_NAME_SQL, persisted=True), nullable=False, deferred=True
+    )
     phones: Mapped[list[str]] = mapped_column(JSON, default=list)
     building_id: Mapped[int] = mapped_column(
-        BigInteger, ForeignKey("buildings.id", ondelete="CASCADE"), nullable=False
+        BigInteger, ForeignKey("buildings.id", ondelete="CASCADE"), nullable=False, index=True
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
+    __table_args__ = (
+        Index(
+            "ix_organizations_search_name_trgm",
+            "search_name",
+            postgresql_using="gin",
+            postgresql_ops={"search_name": "gin_trgm_ops"},
+        ),
+    )
+
     building: Mapped["BuildingModel"] = relationship(
         back_populates="organizations", lazy="joined"
     )
     activities: Mapped[list["ActivityModel"]] = relationship(
-        secondary=organization_activity, back_populates="organizations", lazy="selectin"
+        secondary=organization_activity, back_populates="organizations", lazy="raise"
     )
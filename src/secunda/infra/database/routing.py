@@ -0,0 +1,41 @@
+import math
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LAST_WRITE_COOKIE = "secunda_last_write"
+
+
+# Replicas lag behind the primary, so a client that has just created something
+# reads from the primary for a short window: every 201 response stamps a cookie
+# with the write time and the read session checks it.
+class ReadYourWritesMiddleware:
+    def __init__(self, app: ASGIApp, window_seconds: float) -> None:
+        self._app = app
+        self._window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._window_seconds <= 0:
+            await self._app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 201:
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{LAST_WRITE_COOKIE}={time.time():.3f}; Max-Age={math.ceil(self._window_seconds)}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self._app(scope, receive, send_with_cookie)
+
+
+def wrote_recently(connection: HTTPConnection, window_seconds: float) -> bool:
+    try:
+        written_at = float(connection.cookies.get(LAST_WRITE_COOKIE, ""))
+    except ValueError:
+        return False
+    return 0 <= time.time() - written_at < window_seconds
@@ -1,24 +1,67 @@
+import itertools
+
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 
 from secunda.infra.config import PostgresSettings
+from secunda.infra.metrics import InstrumentedQueuePool, instrument_engine
 
 
-def new_session_maker(psql_config: PostgresSettings) -> async_sessionmaker[AsyncSession]:
-    database_uri = psql_config.async_url()
-
+def new_engine(database_uri: str, psql_config: PostgresSettings, name: str = "primary") -> AsyncEngine:
+    pool_size, max_overflow = psql_config.pool_limits()
     engine = create_async_engine(
         database_uri,
-        pool_size=15,
-        max_overflow=15,
+        poolclass=InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=psql_config.pool_timeout_seconds,
+        pool_recycle=psql_config.pool_recycle_seconds,
+        pool_pre_ping=psql_config.pool_pre_ping,
         echo=False,
+        connect_args={
+            # SQLAlchemy prepares every statement itself and keeps its own per-connection
+            # cache; asyncpg's cache is sized the same so one setting disables both.
+            "prepared_statement_cache_size": psql_config.statement_cache_size,
+            "statement_cache_size": psql_config.statement_cache_size,
+            "server_settings": psql_config.server_settings(),
+        },
     )
+    instrument_engine(engine, name)
+    return engine
+
+
+def _session_maker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
     return async_sessionmaker(
         engine,
         class_=AsyncSession,
         autoflush=False,
         expire_on_commit=False,
     )
+
+
+def new_session_maker(psql_config: PostgresSettings) -> async_sessionmaker[AsyncSession]:
+    return _session_maker(new_engine(psql_config.async_url(), psql_config))
+
+
+class ReadSessionMaker:
+    # Opens sessions on the replicas in turn; each replica has its own pool.
+    def __init__(self, session_makers: list[async_sessionmaker[AsyncSession]]) -> None:
+        self._session_makers = itertools.cycle(session_makers)
+
+    def __call__(self) -> AsyncSession:
+        return next(self._session_makers)()
+
+
+def new_read_session_maker(
+    psql_config: PostgresSettings, primary: async_sessionmaker[AsyncSession]
+) -> ReadSessionMaker:
+    if not psql_config.replica_urls:
+        return ReadSessionMaker([primary])
+    return ReadSessionMaker([
+        _session_maker(new_engine(url, psql_config, f"replica-{number}"))
+        for number, url in enumerate(psql_config.replica_urls, start=1)
+    ])
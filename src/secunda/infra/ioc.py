@@ -1,33 +1,60 @@
-from dishka import Provider, Scope, provide
+from typing import Annotated, NewType
+
+from dishka import DEFAULT_COMPONENT, FromComponent, Provider, Scope, alias, provide
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from typing_extensions import AsyncIterable
 
+from secunda.application.dto import OrganizationLoadProfileDTO
+from secunda.application.entities import BuildingEntity, OrganizationEntity
 from secunda.application.interfaces import (
     ActivityRepositoryProtocol,
+    BatchLoaderProtocol,
+    ActivityTreeCacheProtocol,
+    BuildingIndexCacheProtocol,
     BuildingRepositoryProtocol,
     OrganizationRepositoryProtocol,
+    ResponseCacheProtocol,
+    TableVersionsProtocol,
 )
 from secunda.application.interactors import (
     CreateActivityInteractor,
     CreateBuildingInteractor,
     CreateOrganizationInteractor,
+    GetActivitiesByIdsInteractor,
     GetActivitiesInteractor,
     GetActivityByIdInteractor,
     GetActivityWithChildrenInteractor,
     GetBuildingByIdInteractor,
+    GetBuildingsByIdsInteractor,
     GetBuildingsInteractor,
     GetOrganizationByIdInteractor,
+    GetOrganizationsByIdsInteractor,
     GetOrganizationsByActivityInteractor,
     GetOrganizationsByBuildingInteractor,
     GetOrganizationsInGeoAreaInteractor,
+    GetOrganizationsInRadiusInteractor,
+    GetNearestOrganizationsInteractor,
     SearchOrganizationsByNameInteractor,
+    SearchOrganizationsInteractor,
+    GetActivityFacetsInteractor,
+)
+from secunda.infra.cache import (
+    ActivityTreeCache,
+    BuildingIndexCache,
+    InMemoryResponseCache,
+    NullResponseCache,
+    PrimaryReadCache,
+    RedisResponseCache,
+    SingleFlightResponseCache,
 )
 from secunda.infra.config import AppSettings, PostgresSettings
-from secunda.infra.database import new_session_maker
+from secunda.infra.database import ReadSessionMaker, new_read_session_maker, new_session_maker, wrote_recently
 from secunda.infra.repositories import (
     ActivityRepository,
     BuildingRepository,
     OrganizationRepository,
+    RepositoryLoaders,
 )
 
 
@@ -48,6 +75,12 @@ class DatabaseProvider(Provider):
     ) -> async_sessionmaker[AsyncSession]:
         return new_session_maker(psql_config)
 
+    @provide(scope=Scope.APP)
+    def get_read_session_maker(
+        self, psql_config: PostgresSettings, session_maker: async_sessionmaker[AsyncSession]
+    ) -> ReadSessionMaker:
+        return new_read_session_maker(psql_config, session_maker)
+
     @provide(scope=Scope.REQUEST)
     async def get_session(
         self, session_maker: async_sessionmaker[AsyncSession]
@@ -55,94 +88,296 @@ class DatabaseProvider(Provider):
         async with session_maker() as session:
             yield session
 
+    @provide(scope=Scope.APP)
+    def get_loaders(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        index_cache: BuildingIndexCache,
+        app_config: AppSettings,
+    ) -> RepositoryLoaders:
+        return RepositoryLoaders(session_maker, index_cache, app_config.building_index_cell_size_deg)
+
+
+# Read interactors take their repositories from this component: the same
+# RepositoryProvider, but on a replica session.
+READ_COMPONENT = "read"
+
+
+ReadBuildingRepository = Annotated[BuildingRepositoryProtocol, FromComponent(READ_COMPONENT)]
+ReadActivityRepository = Annotated[ActivityRepositoryProtocol, FromComponent(READ_COMPONENT)]
+ReadOrganizationRepository = Annotated[OrganizationRepositoryProtocol, FromComponent(READ_COMPONENT)]
+ReadResponseCache = Annotated[ResponseCacheProtocol, FromComponent(READ_COMPONENT)]
+BuildingLoader = BatchLoaderProtocol[int, BuildingEntity]
+OrganizationLoader = BatchLoaderProtocol[tuple[int, OrganizationLoadProfileDTO], OrganizationEntity]
+
+# Clients inside the read-your-writes window read from the primary.
+ReadFromPrimary = NewType("ReadFromPrimary", bool)
+
+
+class ReadDatabaseProvider(Provider):
+    component = READ_COMPONENT
+
+    @provide(scope=Scope.REQUEST)
+    def get_read_from_primary(
+        self,
+        psql_config: Annotated[PostgresSettings, FromComponent()],
+        request: Annotated[Request, FromComponent()],
+    ) -> ReadFromPrimary:
+        return ReadFromPrimary(wrote_recently(request, psql_config.read_your_writes_seconds))
+
+    @provide(scope=Scope.REQUEST)
+    async def get_session(
+        self,
+        read_session_maker: Annotated[ReadSessionMaker, FromComponent()],
+        session_maker: Annotated[async_sessionmaker[AsyncSession], FromComponent()],
+        read_from_primary: ReadFromPrimary,
+    ) -> AsyncIterable[AsyncSession]:
+        session = session_maker() if read_from_primary else read_session_maker()
+        async with session:
+            yield session
+
+    @provide(scope=Scope.APP)
+    def get_loaders(
+        self,
+        read_session_maker: Annotated[ReadSessionMaker, FromComponent()],
+        index_cache: BuildingIndexCache,
+        app_config: AppSettings,
+    ) -> RepositoryLoaders:
+        return RepositoryLoaders(read_session_maker, index_cache, app_config.building_index_cell_size_deg)
+
+    @provide(scope=Scope.REQUEST)
+    def get_building_loader(
+        self,
+        loaders: RepositoryLoaders,
+        primary_loaders: Annotated[RepositoryLoaders, FromComponent()],
+        read_from_primary: ReadFromPrimary,
+    ) -> BuildingLoader:
+        return (primary_loaders if read_from_primary else loaders).buildings
+
+    @provide(scope=Scope.REQUEST)
+    def get_organization_loader(
+        self,
+        loaders: RepositoryLoaders,
+        primary_loaders: Annotated[RepositoryLoaders, FromComponent()],
+        read_from_primary: ReadFromPrimary,
+    ) -> OrganizationLoader:
+        return (primary_loaders if read_from_primary else loaders).organizations
+
+    @provide(scope=Scope.REQUEST)
+    def get_response_cache(
+        self,
+        cache: Annotated[ResponseCacheProtocol, FromComponent()],
+        read_from_primary: ReadFromPrimary,
+    ) -> ResponseCacheProtocol:
+        # Neither the shared cache nor an in-flight load of another request may answer a client
+        # that has just written: both can hold rows from a replica that has not caught up.
+        return PrimaryReadCache(cache) if read_from_primary else cache
+
+    app_settings = alias(source=AppSettings, component=DEFAULT_COMPONENT)
+    activity_tree_cache = alias(source=ActivityTreeCache, component=DEFAULT_COMPONENT)
+    building_index_cache = alias(source=BuildingIndexCache, component=DEFAULT_COMPONENT)
+
+
+class CacheProvider(Provider):
+    # Snapshots are loaded on replica sessions too, so right after a write they are not kept either.
+    @provide(scope=Scope.APP)
+    def get_activity_tree_cache(self, app_config: AppSettings, psql_config: PostgresSettings) -> ActivityTreeCache:
+        return ActivityTreeCache(
+            ttl_seconds=app_config.activity_cache_ttl_seconds, settle_seconds=psql_config.replica_lag_seconds()
+        )
+
+    @provide(scope=Scope.APP)
+    def get_building_index_cache(self, app_config: AppSettings, psql_config: PostgresSettings) -> BuildingIndexCache:
+        return BuildingIndexCache(
+            ttl_seconds=app_config.building_index_ttl_seconds, settle_seconds=psql_config.replica_lag_seconds()
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_response_cache(
+        self, app_config: AppSettings, psql_config: PostgresSettings
+    ) -> AsyncIterable[ResponseCacheProtocol]:
+        # Loads go to replicas, so right after a write they are served but not kept.
+        settle_seconds = psql_config.replica_lag_seconds()
+        single_process = psql_config.workers == 1
+        if app_config.response_cache_backend == "redis":
+            cache = RedisResponseCache(
+                app_config.response_cache_redis_url,
+                ttl_seconds=app_config.response_cache_ttl_seconds,
+                settle_seconds=settle_seconds,
+            )
+        elif app_config.response_cache_backend == "memory":
+            cache = InMemoryResponseCache(
+                ttl_seconds=app_config.response_cache_ttl_seconds,
+                max_entries=app_config.response_cache_max_entries,
+                settle_seconds=settle_seconds,
+                single_process=single_process,
+            )
+        else:
+            cache = NullResponseCache(settle_seconds=settle_seconds, single_process=single_process)
+        if app_config.single_flight:
+            cache = SingleFlightResponseCache(cache)
+        yield cache
+        await cache.close()
+
+    table_versions_protocol = alias(source=ResponseCacheProtocol, provides=TableVersionsProtocol)
+    activity_tree_cache_protocol = alias(source=ActivityTreeCache, provides=ActivityTreeCacheProtocol)
+    building_index_cache_protocol = alias(source=BuildingIndexCache, provides=BuildingIndexCacheProtocol)
+
 
 class RepositoryProvider(Provider):
     @provide(scope=Scope.REQUEST)
-    def get_building_repository(self, session: AsyncSession) -> BuildingRepositoryProtocol:
-        return BuildingRepository(session)
+    def get_building_repository(
+        self, session: AsyncSession, index_cache: BuildingIndexCache, app_config: AppSettings
+    ) -> BuildingRepositoryProtocol:
+        return BuildingRepository(
+            session, index_cache, app_config.building_index_cell_size_deg, app_config.geo_backend
+        )
 
     @provide(scope=Scope.REQUEST)
-    def get_activity_repository(self, session: AsyncSession) -> ActivityRepositoryProtocol:
-        return ActivityRepository(session)
+    def get_activity_repository(
+        self, session: AsyncSession, tree_cache: ActivityTreeCache
+    ) -> ActivityRepositoryProtocol:
+        return ActivityRepository(session, tree_cache)
 
     @provide(scope=Scope.REQUEST)
-    def get_organization_repository(self, session: AsyncSession) -> OrganizationRepositoryProtocol:
-        return OrganizationRepository(session)
+    def get_organization_repository(
+        self, session: AsyncSession, index_cache: BuildingIndexCache, app_config: AppSettings
+    ) -> OrganizationRepositoryProtocol:
+        return OrganizationRepository(
+            session, index_cache, app_config.building_index_cell_size_deg, app_config.geo_backend
+        )
 
 
 class InteractorProvider(Provider):
     @provide(scope=Scope.REQUEST)
-    def get_buildings(self, repository: BuildingRepositoryProtocol) -> GetBuildingsInteractor:
-        return GetBuildingsInteractor(repository)
+    def get_buildings(
+        self, repository: ReadBuildingRepository, cache: ReadResponseCache
+    ) -> GetBuildingsInteractor:
+        return GetBuildingsInteractor(repository, cache)
 
     @provide(scope=Scope.REQUEST)
     def get_building_by_id(
-        self, repository: BuildingRepositoryProtocol
+        self, loader: Annotated[BuildingLoader, FromComponent(READ_COMPONENT)], cache: ReadResponseCache
     ) -> GetBuildingByIdInteractor:
-        return GetBuildingByIdInteractor(repository)
+        return GetBuildingByIdInteractor(loader, cache)
+
+    @provide(scope=Scope.REQUEST)
+    def get_buildings_by_ids(
+        self, repository: ReadBuildingRepository, cache: ReadResponseCache
+    ) -> GetBuildingsByIdsInteractor:
+        return GetBuildingsByIdsInteractor(repository, cache)
 
     @provide(scope=Scope.REQUEST)
     def create_building(
-        self, repository: BuildingRepositoryProtocol, session: AsyncSession
+        self,
+        repository: BuildingRepositoryProtocol,
+        session: AsyncSession,
+        index_cache: BuildingIndexCacheProtocol,
+        cache: ResponseCacheProtocol,
     ) -> CreateBuildingInteractor:
-        return CreateBuildingInteractor(repository, session)
+        return CreateBuildingInteractor(repository, session, index_cache, cache)
 
     @provide(scope=Scope.REQUEST)
-    def get_activities(self, repository: ActivityRepositoryProtocol) -> GetActivitiesInteractor:
-        return GetActivitiesInteractor(repository)
+    def get_activities(
+        self, repository: ReadActivityRepository, cache: ReadResponseCache
+    ) -> GetActivitiesInteractor:
+        return GetActivitiesInteractor(repository, cache)
 
     @provide(scope=Scope.REQUEST)
     def get_activity_by_id(
-        self, repository: ActivityRepositoryProtocol
+        self, repository: ReadActivityRepository, cache: ReadResponseCache
     ) -> GetActivityByIdInteractor:
-        return GetActivityByIdInteractor(repository)
+        return GetActivityByIdInteractor(repository, cache)
+
+    @provide(scope=Scope.REQUEST)
+    def get_activities_by_ids(
+        self, repository: ReadActivityRepository, cache: ReadResponseCache
+    ) -> GetActivitiesByIdsInteractor:
+        return GetActivitiesByIdsInteractor(repository, cache)
 
     @provide(scope=Scope.REQUEST)
     def create_activity(
-        self, repository: ActivityRepositoryProtocol, session: AsyncSession
+        self,
+        repository: ActivityRepositoryProtocol,
+        session: AsyncSession,
+        tree_cache: ActivityTreeCacheProtocol,
+        cache: ResponseCacheProtocol,
     ) -> CreateActivityInteractor:
-        return CreateActivityInteractor(repository, session)
+        return CreateActivityInteractor(repository, session, tree_cache, cache)
 
     @provide(scope=Scope.REQUEST)
     def get_activity_with_children(
-        self, repository: ActivityRepositoryProtocol
+        self, repository: ReadActivityRepository, cache: ReadResponseCache
     ) -> GetActivityWithChildrenInteractor:
-        return GetActivityWithChildrenInteractor(repository)
+        return GetActivityWithChildrenInteractor(repository, cache)
 
     @provide(scope=Scope.REQUEST)
     def get_organization_by_id(
-        self, repository: OrganizationRepositoryProtocol
+        self,
+        loader: Annotated[OrganizationLoader, FromComponent(READ_COMPONENT)],
+        cache: ReadResponseCache,
     ) -> GetOrganizationByIdInteractor:
-        return GetOrganizationByIdInteractor(repository)
+        return GetOrganizationByIdInteractor(loader, cache)
+
+    @provide(scope=Scope.REQUEST)
+    def get_organizations_by_ids(
+        self, repository: ReadOrganizationRepository, cache: ReadResponseCache
+    ) -> GetOrganizationsByIdsInteractor:
+        return GetOrganizationsByIdsInteractor(repository, cache)
 
     @provide(scope=Scope.REQUEST)
     def get_organizations_by_building(
-        self, repository: OrganizationRepositoryProtocol
+        self, repository: ReadOrganizationRepository, cache: ReadResponseCache
     ) -> GetOrganizationsByBuildingInteractor:
-        return GetOrganizationsByBuildingInteractor(repository)
+        return GetOrganizationsByBuildingInteractor(repository, cache)
 
     @provide(scope=Scope.REQUEST)
     def get_organizations_by_activity(
-        self,
-        organization_repo: OrganizationRepositoryProtocol,
-        activity_repo: ActivityRepositoryProtocol,
+        self, repository: ReadOrganizationRepository, cache: ReadResponseCache
     ) -> GetOrganizationsByActivityInteractor:
-        return GetOrganizationsByActivityInteractor(organization_repo, activity_repo)
+        return GetOrganizationsByActivityInteractor(repository, cache)
 
     @provide(scope=Scope.REQUEST)
     def get_organizations_in_geo_area(
-        self, repository: OrganizationRepositoryProtocol
+        self, repository: ReadOrganizationRepository, cache: ReadResponseCache
     ) -> GetOrganizationsInGeoAreaInteractor:
-        return GetOrganizationsInGeoAreaInteractor(repository)
+        return GetOrganizationsInGeoAreaInteractor(repository, cache)
+
+    @provide(scope=Scope.REQUEST)
+    def get_organizations_in_radius(
+        self, repository: ReadOrganizationRepository, cache: ReadResponseCache
+    ) -> GetOrganizationsInRadiusInteractor:
+        return GetOrganizationsInRadiusInteractor(repository, cache)
+
+    @provide(scope=Scope.REQUEST)
+    def get_nearest_organizations(
+        self, repository: ReadOrganizationRepository, cache: ReadResponseCache
+    ) -> GetNearestOrganizationsInteractor:
+        return GetNearestOrganizationsInteractor(repository, cache)
 
     @provide(scope=Scope.REQUEST)
     def search_organizations_by_name(
-        self, repository: OrganizationRepositoryProtocol
+        self, repository: ReadOrganizationRepository, cache: ReadResponseCache
     ) -> SearchOrganizationsByNameInteractor:
-        return SearchOrganizationsByNameInteractor(repository)
+        return SearchOrganizationsByNameInteractor(repository, cache)
+
+    @provide(scope=Scope.REQUEST)
+    def search_organizations(
+        self, repository: ReadOrganizationRepository, cache: ReadResponseCache
+    ) -> SearchOrganizationsInteractor:
+        return SearchOrganizationsInteractor(repository, cache)
+
+    @provide(scope=Scope.REQUEST)
+    def get_activity_facets(
+        self, repository: ReadOrganizationRepository, cache: ReadResponseCache
+    ) -> GetActivityFacetsInteractor:
+        return GetActivityFacetsInteractor(repository, cache)
 
     @provide(scope=Scope.REQUEST)
     def create_organization(
-        self, repository: OrganizationRepositoryProtocol, session: AsyncSession
+        self,
+        repository: OrganizationRepositoryProtocol,
+        session: AsyncSession,
+        cache: ResponseCacheProtocol,
     ) -> CreateOrganizationInteractor:
-        return CreateOrganizationInteractor(repository, session)
+        return CreateOrganizationInteractor(repository, session, cache)
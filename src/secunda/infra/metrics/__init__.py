@@ -0,0 +1,20 @@
+from .collectors import (
+    InstrumentedQueuePool,
+    count_cache_lookup,
+    instrument_engine,
+    instrument_repository,
+    request_statements,
+)
+from .middleware import MetricsMiddleware, metrics_endpoint
+from .tracing import SqlTraceMiddleware
+
+__all__ = [
+    "InstrumentedQueuePool",
+    "MetricsMiddleware",
+    "SqlTraceMiddleware",
+    "count_cache_lookup",
+    "instrument_engine",
+    "instrument_repository",
+    "metrics_endpoint",
+    "request_statements",
+]
@@ -0,0 +1,140 @@
+import functools
+import inspect
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from secunda.infra.metrics.tracing import after_cursor_execute, before_cursor_execute
+
+C = TypeVar("C", bound=type)
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+ROUTE_LATENCY = Histogram(
+    "secunda_http_request_duration_seconds",
+    "Time to the end of the response body, per route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+REPOSITORY_LATENCY = Histogram(
+    "secunda_repository_call_duration_seconds",
+    "Repository method latency",
+    ["repository", "method"],
+    buckets=LATENCY_BUCKETS,
+)
+STATEMENTS_PER_REQUEST = Histogram(
+    "secunda_sql_statements_per_request",
+    "SQL statements executed while serving one request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+POOL_CHECKOUT_WAIT = Histogram(
+    "secunda_db_pool_checkout_duration_seconds",
+    "Time to get a connection from the pool, including pre-ping and new connections",
+    ["engine"],
+    buckets=LATENCY_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    "secunda_cache_requests_total",
+    "Cache lookups by outcome; the hit ratio is hit / (hit + miss)",
+    ["cache", "result"],
+)
+
+
+class RequestStatements:
+    def __init__(self) -> None:
+        self.count = 0
+
+
+# Set by MetricsMiddleware for the duration of a request. Tasks started while serving it
+# (batch loads, single-flight loads) inherit the counter, so their statements are counted
+# for the request that started them.
+request_statements: ContextVar[RequestStatements | None] = ContextVar("request_statements", default=None)
+
+
+def count_cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    engine_name = "default"
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        connection = super().connect()
+        POOL_CHECKOUT_WAIT.labels(self.engine_name).observe(time.perf_counter() - started)
+        return connection
+
+
+class PoolCollector(Collector):
+    # Reads the pools on every scrape instead of tracking checkouts and checkins.
+    def __init__(self) -> None:
+        self._pools: dict[str, AsyncAdaptedQueuePool] = {}
+
+    def add(self, name: str, pool: AsyncAdaptedQueuePool) -> None:
+        self._pools[name] = pool
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        size = GaugeMetricFamily("secunda_db_pool_size", "Configured pool size", labels=["engine"])
+        in_use = GaugeMetricFamily(
+            "secunda_db_pool_connections_in_use", "Connections checked out of the pool", labels=["engine"]
+        )
+        overflow = GaugeMetricFamily(
+            "secunda_db_pool_overflow_connections", "Open connections beyond the pool size", labels=["engine"]
+        )
+        for name, pool in self._pools.items():
+            size.add_metric([name], pool.size())
+            in_use.add_metric([name], pool.checkedout())
+            overflow.add_metric([name], max(0, pool.overflow()))
+        yield size
+        yield in_use
+        yield overflow
+
+
+pool_collector = PoolCollector()
+REGISTRY.register(pool_collector)
+
+
+def _count_statement(*_: Any) -> None:
+    statements = request_statements.get()
+    if statements is not None:
+        statements.count += 1
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    pool = engine.sync_engine.pool
+    if isinstance(pool, InstrumentedQueuePool):
+        pool.engine_name = name
+        pool_collector.add(name, pool)
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_statement)
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+
+
+def instrument_repository(cls: C) -> C:
+    # Wraps the public coroutine methods; streaming methods return iterators and are left as is.
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(method):
+            continue
+        setattr(cls, name, _timed(method, REPOSITORY_LATENCY.labels(cls.__name__, name)))
+    return cls
+
+
+def _timed(method: Any, histogram: Any) -> Any:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - started)
+
+    return wrapper
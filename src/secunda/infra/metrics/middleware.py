@@ -0,0 +1,51 @@
+import time
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from secunda.infra.metrics.collectors import (
+    ROUTE_LATENCY,
+    STATEMENTS_PER_REQUEST,
+    RequestStatements,
+    request_statements,
+)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+# Labels by route template, not by URL, so ids in paths do not multiply the series.
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        statements = RequestStatements()
+        token = request_statements.set(statements)
+        started = time.perf_counter()
+        try:
+            await self._app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            request_statements.reset(token)
+            route = scope.get("route")
+            route_path = getattr(route, "path", UNMATCHED_ROUTE)
+            ROUTE_LATENCY.labels(scope["method"], route_path, str(status_code)).observe(elapsed)
+            STATEMENTS_PER_REQUEST.labels(route_path).observe(statements.count)
+
+
+async def metrics_endpoint(_: Request) -> Response:
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
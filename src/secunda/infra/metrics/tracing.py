@@ -0,0 +1,110 @@
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+STATEMENTS_HEADER = "X-SQL-Statements"
+DURATION_HEADER = "X-SQL-Duration-Ms"
+
+logger = logging.getLogger(__name__)
+
+_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s|\b\d+(\.\d+)?\b|'(?:[^']|'')*'")
+_PARAMETER_LIST = re.compile(r"\?(\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    # Literals and bind parameters become "?", so the same query with other ids has one shape.
+    shape = _PARAMETER.sub("?", _WHITESPACE.sub(" ", statement).strip())
+    return _PARAMETER_LIST.sub("?, ...", shape)
+
+
+class SqlTrace:
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, float]] = []
+
+    def record(self, statement: str, duration: float) -> None:
+        self.statements.append((statement, duration))
+
+    @property
+    def duration(self) -> float:
+        return sum(duration for _, duration in self.statements)
+
+    def repeated_shapes(self, threshold: int) -> list[tuple[str, int]]:
+        shapes = Counter(statement_shape(statement) for statement, _ in self.statements)
+        return [(shape, count) for shape, count in shapes.most_common() if count > threshold]
+
+
+sql_trace: ContextVar[SqlTrace | None] = ContextVar("sql_trace", default=None)
+
+
+def before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, *_: Any) -> None:
+    if sql_trace.get() is not None:
+        context._secunda_started = time.perf_counter()
+
+
+def after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, *_: Any) -> None:
+    trace = sql_trace.get()
+    started = getattr(context, "_secunda_started", None)
+    if trace is not None and started is not None:
+        trace.record(statement, time.perf_counter() - started)
+
+
+# Installed only with APP_DEBUG: records every statement of the request with its timing,
+# reports the count in response headers and one JSON log line per request, and flags
+# statement shapes repeated more than n_plus_one_threshold times as N+1 queries.
+class SqlTraceMiddleware:
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int) -> None:
+        self._app = app
+        self._n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        trace = SqlTrace()
+        status_code = 500
+
+        # Streaming responses keep querying after the headers: these count statements so far.
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers[STATEMENTS_HEADER] = str(len(trace.statements))
+                headers[DURATION_HEADER] = f"{trace.duration * 1000:.3f}"
+            await send(message)
+
+        token = sql_trace.set(trace)
+        started = time.perf_counter()
+        try:
+            await self._app(scope, receive, send_with_headers)
+        finally:
+            sql_trace.reset(token)
+            self._log(scope, status_code, time.perf_counter() - started, trace)
+
+    def _log(self, scope: Scope, status_code: int, elapsed: float, trace: SqlTrace) -> None:
+        repeated = trace.repeated_shapes(self._n_plus_one_threshold)
+        record = {
+            "event": "sql_trace",
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": getattr(scope.get("route"), "path", None),
+            "status": status_code,
+            "duration_ms": round(elapsed * 1000, 3),
+            "statements": len(trace.statements),
+            "sql_duration_ms": round(trace.duration * 1000, 3),
+            "n_plus_one": [{"statement": shape, "count": count} for shape, count in repeated],
+            "queries": [
+                {"statement": _WHITESPACE.sub(" ", statement).strip(), "duration_ms": round(duration * 1000, 3)}
+                for statement, duration in trace.statements
+            ],
+        }
+        logger.log(logging.WARNING if repeated else logging.INFO, json.dumps(record, ensure_ascii=False))
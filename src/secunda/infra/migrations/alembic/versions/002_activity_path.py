@@ -0,0 +1,56 @@
+"""Materialized activity path
+
+Revision ID: 002_activity_path
+Revises: 001_initial
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "002_activity_path"
+down_revision: Union[str, None] = "001_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "activities",
+        sa.Column("path", sa.String(length=64, collation="C"), nullable=True),
+    )
+    op.execute(
+        """
+        WITH RECURSIVE tree AS (
+            SELECT id, id::text || '/' AS path
+            FROM activities
+            WHERE parent_id IS NULL
+            UNION ALL
+            SELECT a.id, tree.path || a.id::text || '/'
+            FROM activities a
+            JOIN tree ON a.parent_id = tree.id
+        )
+        UPDATE activities
+        SET path = tree.path
+        FROM tree
+        WHERE activities.id = tree.id
+        """
+    )
+    op.alter_column("activities", "path", nullable=False)
+    op.create_index(op.f("ix_activities_path"), "activities", ["path"], unique=False)
+    op.create_index(op.f("ix_activities_parent_id"), "activities", ["parent_id"], unique=False)
+    op.create_index(
+        "ix_organization_activity_activity_id",
+        "organization_activity",
+        ["activity_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_organization_activity_activity_id", table_name="organization_activity")
+    op.drop_index(op.f("ix_activities_parent_id"), table_name="activities")
+    op.drop_index(op.f("ix_activities_path"), table_name="activities")
+    op.drop_column("activities", "path")
@@ -0,0 +1,25 @@
+"""Index organizations by building
+
+Revision ID: 003_organization_building_index
+Revises: 002_activity_path
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "003_organization_building_index"
+down_revision: Union[str, None] = "002_activity_path"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_organizations_building_id"), "organizations", ["building_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_organizations_building_id"), table_name="organizations")
@@ -0,0 +1,52 @@
+"""Trigram search over normalized organization names
+
+Revision ID: 004_organization_search_name
+Revises: 003_organization_building_index
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "004_organization_search_name"
+down_revision: Union[str, None] = "003_organization_building_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LEGAL_FORMS = "ооо|оао|зао|пао|ао|нао|ип|пбоюл|нко|ано|гуп|муп|фгуп|тсж|снт"
+
+# Mirrors OrganizationNameNormalizer.normalize.
+SEARCH_NAME_SQL = f"""
+    btrim(
+        regexp_replace(
+            regexp_replace(
+                regexp_replace(replace(lower(name), 'ё', 'е'), '["''`«»„“”‘’]', ' ', 'g'),
+                '(?<![0-9a-zа-я_])({LEGAL_FORMS})(?![0-9a-zа-я_])\\.?', ' ', 'g'
+            ),
+            '\\s+', ' ', 'g'
+        )
+    )
+"""
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Generated, so Postgres keeps it in step with name on every insert and update.
+    op.execute(
+        "ALTER TABLE organizations ADD COLUMN search_name varchar(255) NOT NULL "
+        f"GENERATED ALWAYS AS ({SEARCH_NAME_SQL}) STORED"
+    )
+    op.create_index(
+        "ix_organizations_search_name_trgm",
+        "organizations",
+        ["search_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"search_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_organizations_search_name_trgm", table_name="organizations")
+    op.drop_column("organizations", "search_name")
@@ -0,0 +1,35 @@
+"""GiST-indexed point location of buildings
+
+Revision ID: 005_building_location
+Revises: 004_organization_search_name
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "005_building_location"
+down_revision: Union[str, None] = "004_organization_search_name"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built-in point type: no contrib extension is required.
+    op.execute(
+        "ALTER TABLE buildings "
+        "ADD COLUMN location point GENERATED ALWAYS AS (point(longitude, latitude)) STORED"
+    )
+    op.create_index(
+        "ix_buildings_location",
+        "buildings",
+        ["location"],
+        unique=False,
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_buildings_location", table_name="buildings")
+    op.drop_column("buildings", "location")
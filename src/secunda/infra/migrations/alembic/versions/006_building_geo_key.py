@@ -0,0 +1,55 @@
+"""Z-order (Morton) key of building coordinates
+
+Revision ID: 006_building_geo_key
+Revises: 005_building_location
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "006_building_geo_key"
+down_revision: Union[str, None] = "005_building_location"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Mirrors MortonCode.encode: 31-bit cells of latitude and longitude, latitude bits at even positions.
+    # Self-contained, so the generated column also evaluates under the empty search_path of pg_restore.
+    op.execute(
+        """
+        CREATE FUNCTION building_geo_key(latitude double precision, longitude double precision) RETURNS bigint
+        LANGUAGE plpgsql IMMUTABLE STRICT PARALLEL SAFE AS $$
+        DECLARE
+            lat bigint := least(2147483647, greatest(0, floor((latitude + 90) / 180 * 2147483648)));
+            lon bigint := least(2147483647, greatest(0, floor((longitude + 180) / 360 * 2147483648)));
+        BEGIN
+            lat := (lat | (lat << 16)) & 281470681808895;
+            lat := (lat | (lat << 8)) & 71777214294589695;
+            lat := (lat | (lat << 4)) & 1085102592571150095;
+            lat := (lat | (lat << 2)) & 3689348814741910323;
+            lat := (lat | (lat << 1)) & 6148914691236517205;
+            lon := (lon | (lon << 16)) & 281470681808895;
+            lon := (lon | (lon << 8)) & 71777214294589695;
+            lon := (lon | (lon << 4)) & 1085102592571150095;
+            lon := (lon | (lon << 2)) & 3689348814741910323;
+            lon := (lon | (lon << 1)) & 6148914691236517205;
+            RETURN lat | (lon << 1);
+        END
+        $$
+        """
+    )
+    # Generated, so Postgres keeps it in step with the coordinates on every insert and update.
+    op.execute(
+        "ALTER TABLE buildings "
+        "ADD COLUMN geo_key bigint NOT NULL GENERATED ALWAYS AS (building_geo_key(latitude, longitude)) STORED"
+    )
+    op.create_index("ix_buildings_geo_key", "buildings", ["geo_key"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_buildings_geo_key", table_name="buildings")
+    op.drop_column("buildings", "geo_key")
+    op.execute("DROP FUNCTION building_geo_key(double precision, double precision)")
@@ -1,5 +1,12 @@
 from .building import BuildingRepository
 from .activity import ActivityRepository
 from .organization import OrganizationRepository
+from .loader import BatchLoader, RepositoryLoaders
 
-__all__ = ["BuildingRepository", "ActivityRepository", "OrganizationRepository"]
+__all__ = [
+    "BuildingRepository",
+    "ActivityRepository",
+    "OrganizationRepository",
+    "BatchLoader",
+    "RepositoryLoaders",
+]
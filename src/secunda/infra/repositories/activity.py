@@ -1,17 +1,55 @@
-from sqlalchemy import select
+from sqlalchemy import BigInteger, ColumnElement, String, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased
 
 from secunda.application.constants import MAX_ACTIVITY_NESTING_LEVEL
 from secunda.application.dto import CreateActivityDTO
 from secunda.application.entities import ActivityEntity
+from secunda.application.services import ActivityTree
+from secunda.infra.cache import ActivityTreeCache
 from secunda.infra.database.models import ActivityModel
+from secunda.infra.metrics import instrument_repository
 
+ACTIVITY_PATH_SEPARATOR = "/"
 
+# Same order as the ActivityEntity fields, so rows map with ActivityEntity(*row).
+ACTIVITY_COLUMNS = (
+    ActivityModel.id,
+    ActivityModel.name,
+    ActivityModel.level,
+    ActivityModel.parent_id,
+    ActivityModel.created_at,
+)
+
+
+def build_activity_path(activity_id: int, parent_path: str = "") -> str:
+    return f"{parent_path}{activity_id}{ACTIVITY_PATH_SEPARATOR}"
+
+
+def path_activity_ids(path: ColumnElement[str]) -> ColumnElement[list[int]]:
+    # "1/4/9/" -> {1,4,9}: the activity and its ancestors, root first.
+    ids = func.string_to_array(
+        func.rtrim(path, ACTIVITY_PATH_SEPARATOR), ACTIVITY_PATH_SEPARATOR, type_=ARRAY(String)
+    )
+    return ids.cast(ARRAY(BigInteger))
+
+
+def activity_subtree_clause(activity_id: int) -> ColumnElement[bool]:
+    # Paths consist of digits and "/", so every descendant of "1/4/" sorts
+    # inside ["1/4/", "1/4/:") under the "C" collation and the range is
+    # answered by ix_activities_path.
+    root = aliased(ActivityModel)
+    root_path = select(root.path).where(root.id == activity_id).scalar_subquery()
+    return (ActivityModel.path >= root_path) & (ActivityModel.path < root_path.concat(":"))
+
+
+@instrument_repository
 class ActivityRepository:
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, tree_cache: ActivityTreeCache) -> None:
         self._session = session
+        self._tree_cache = tree_cache
 
     def _to_entity(self, model: ActivityModel, include_children: bool = False) -> ActivityEntity:
         children = []
@@ -28,10 +66,12 @@ class ActivityRepository:
 
     async def create(self, dto: CreateActivityDTO) -> ActivityEntity:
         level = 1
+        parent_path = ""
         if dto.parent_id:
             parent = await self._session.get(ActivityModel, dto.parent_id)
             if parent:
                 level = parent.level + 1
+                parent_path = parent.path
                 if level > MAX_ACTIVITY_NESTING_LEVEL:
                     raise ValueError(f"Максимальный уровень вложенности: {MAX_ACTIVITY_NESTING_LEVEL}")
 
@@ -39,51 +79,34 @@ class ActivityRepository:
             name=dto.name,
             parent_id=dto.parent_id,
             level=level,
+            path=parent_path,
         )
         self._session.add(model)
         await self._session.flush()
+        model.path = build_activity_path(model.id, parent_path)
+        await self._session.flush()
         await self._session.refresh(model)
         return self._to_entity(model)
 
+    async def _load_tree(self) -> ActivityTree:
+        result = await self._session.execute(select(*ACTIVITY_COLUMNS))
+        return ActivityTree(ActivityEntity(*row) for row in result)
+
+    async def _get_tree(self) -> ActivityTree:
+        return await self._tree_cache.get(self._load_tree)
+
     async def get_by_id(self, activity_id: int) -> ActivityEntity | None:
-        stmt = (
-            select(ActivityModel)
-            .where(ActivityModel.id == activity_id)
-            .options(
-                selectinload(ActivityModel.children)
-                .selectinload(ActivityModel.children)
-                .selectinload(ActivityModel.children)
-            )
-        )
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return self._to_entity(model, include_children=True) if model else None
+        tree = await self._get_tree()
+        return tree.get(activity_id)
+
+    async def get_by_ids(self, activity_ids: list[int]) -> list[ActivityEntity]:
+        tree = await self._get_tree()
+        return [activity for activity in map(tree.get, activity_ids) if activity is not None]
 
     async def get_all(self) -> list[ActivityEntity]:
-        stmt = (
-            select(ActivityModel)
-            .where(ActivityModel.parent_id.is_(None))
-            .options(
-                selectinload(ActivityModel.children)
-                .selectinload(ActivityModel.children)
-                .selectinload(ActivityModel.children)
-            )
-        )
-        result = await self._session.execute(stmt)
-        return [
-            self._to_entity(activity_model, include_children=True)
-            for activity_model in result.scalars().all()
-        ]
+        tree = await self._get_tree()
+        return tree.roots()
 
     async def get_with_children_recursive(self, activity_id: int) -> list[int]:
-        ids = [activity_id]
-        await self._collect_children_ids(activity_id, ids)
-        return ids
-
-    async def _collect_children_ids(self, parent_id: int, ids: list[int]) -> None:
-        stmt = select(ActivityModel.id).where(ActivityModel.parent_id == parent_id)
-        result = await self._session.execute(stmt)
-        child_ids = result.scalars().all()
-        for cid in child_ids:
-            ids.append(cid)
-            await self._collect_children_ids(cid, ids)
+        tree = await self._get_tree()
+        return tree.descendant_ids(activity_id)
@@ -1,15 +1,125 @@
-from sqlalchemy import select
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from sqlalchemy import BigInteger, ColumnElement, Select, TableValuedAlias, and_, bindparam, func, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from secunda.application.dto import CreateBuildingDTO
-from secunda.application.entities import BuildingEntity
-from secunda.application.services import GeoService
+from secunda.application.dto import CreateBuildingDTO, GeoSearchDTO, PageDTO
+from secunda.application.entities import BuildingEntity, Page
+from secunda.application.services import BoundingBox, GeoService, GridSpatialIndex, MortonCode
+from secunda.infra.cache import BuildingIndexCache
+from secunda.infra.config import GeoBackend
+from secunda.infra.database.expressions import in_ids
+from secunda.infra.database.geo import haversine_km, in_box
 from secunda.infra.database.models import BuildingModel
+from secunda.infra.metrics import instrument_repository
+from secunda.infra.repositories.pagination import build_page_by_id, paginate_by_id, stream_row_batches
+
+# Same order as the BuildingEntity fields, so rows map with BuildingEntity(*row).
+BUILDING_COLUMNS = (
+    BuildingModel.id,
+    BuildingModel.address,
+    BuildingModel.latitude,
+    BuildingModel.longitude,
+    BuildingModel.created_at,
+)
+
+
+def _key_ranges(boxes: Sequence[BoundingBox]) -> TableValuedAlias:
+    # Covers of separate boxes may share cells; merged, so no building is joined twice.
+    merged: list[tuple[int, int]] = []
+    for low, high in sorted(key_range for box in boxes for key_range in MortonCode.ranges(box)):
+        if merged and low <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], high))
+        else:
+            merged.append((low, high))
+    lows, highs = zip(*merged)
+    return func.unnest(
+        bindparam(None, list(lows), type_=ARRAY(BigInteger)),
+        bindparam(None, list(highs), type_=ARRAY(BigInteger)),
+    ).table_valued("low", "high").render_derived(name="key_ranges")
+
+
+def buildings_in_boxes(
+    boxes: Sequence[BoundingBox],
+    geo_backend: GeoBackend,
+    columns: Sequence[ColumnElement[Any]] = (BuildingModel.id,),
+) -> Select:
+    # Buildings inside any of the boxes.
+    stmt = select(*columns)
+    if geo_backend == "morton":
+        # Each key range is one B-tree range scan; the ranges cover a superset of the boxes, which the
+        # coordinates trim. The ranges are an array parameter, so every area has the same statement.
+        ranges = _key_ranges(boxes)
+        return (
+            stmt.select_from(ranges)
+            .join(BuildingModel, BuildingModel.geo_key.between(ranges.c.low, ranges.c.high))
+            .where(
+                or_(
+                    *(
+                        and_(
+                            BuildingModel.latitude.between(box.min_lat, box.max_lat),
+                            BuildingModel.longitude.between(box.min_lon, box.max_lon),
+                        )
+                        for box in boxes
+                    )
+                )
+            )
+        )
+    return stmt.where(or_(*(in_box(BuildingModel.location, box) for box in boxes)))
+
+
+def buildings_in_radius(
+    lat: float,
+    lon: float,
+    radius_km: float,
+    geo_backend: GeoBackend,
+    columns: Sequence[ColumnElement[Any]] = (BuildingModel.id,),
+) -> Select:
+    # The boxes of the spherical cap, split at the antimeridian, narrow candidates through the
+    # index, the exact distance check runs on them. The distance is selected as the last column,
+    # distance_km, and orders the buildings nearest first.
+    boxes = GeoService.cap_boxes(lat, lon, radius_km)
+    distance = haversine_km(BuildingModel.latitude, BuildingModel.longitude, lat, lon)
+    return (
+        buildings_in_boxes(boxes, geo_backend, (*columns, distance.label("distance_km")))
+        .where(distance <= radius_km)
+        .order_by(distance, BuildingModel.id)
+    )
+
 
+def buildings_in_geo_area(dto: GeoSearchDTO, geo_backend: GeoBackend) -> Select | None:
+    if dto.radius_km is not None:
+        buildings = buildings_in_radius(dto.latitude, dto.longitude, dto.radius_km, geo_backend)
+        return buildings.with_only_columns(BuildingModel.id).order_by(None)
+    if dto.min_lat is None or dto.max_lat is None or dto.min_lon is None or dto.max_lon is None:
+        return None
+    return buildings_in_boxes([BoundingBox(dto.min_lat, dto.max_lat, dto.min_lon, dto.max_lon)], geo_backend)
 
+
+async def load_building_index(session: AsyncSession, cell_size_deg: float) -> GridSpatialIndex:
+    index = GridSpatialIndex(cell_size_deg)
+    stmt = select(BuildingModel.id, BuildingModel.latitude, BuildingModel.longitude)
+    result = await session.stream(stmt.execution_options(yield_per=10_000))
+    async for building_id, lat, lon in result:
+        index.add(building_id, lat, lon)
+    return index
+
+
+@instrument_repository
 class BuildingRepository:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        index_cache: BuildingIndexCache,
+        cell_size_deg: float,
+        geo_backend: GeoBackend = "memory",
+    ) -> None:
         self._session = session
+        self._index_cache = index_cache
+        self._cell_size_deg = cell_size_deg
+        self._geo_backend = geo_backend
 
     def _to_entity(self, model: BuildingModel) -> BuildingEntity:
         return BuildingEntity(
@@ -32,35 +142,53 @@ class BuildingRepository:
         return self._to_entity(model)
 
     async def get_by_id(self, building_id: int) -> BuildingEntity | None:
-        result = await self._session.get(BuildingModel, building_id)
-        return self._to_entity(result) if result else None
+        result = await self._session.execute(select(*BUILDING_COLUMNS).where(BuildingModel.id == building_id))
+        row = result.first()
+        return BuildingEntity(*row) if row else None
 
-    async def get_all(self) -> list[BuildingEntity]:
-        result = await self._session.execute(select(BuildingModel))
-        return [self._to_entity(building_model) for building_model in result.scalars().all()]
+    async def get_all(self, page: PageDTO) -> Page[BuildingEntity]:
+        stmt = paginate_by_id(select(*BUILDING_COLUMNS), BuildingModel.id, page)
+        result = await self._session.execute(stmt)
+        return build_page_by_id([BuildingEntity(*row) for row in result], page)
 
-    async def get_in_radius(self, lat: float, lon: float, radius_km: float) -> list[BuildingEntity]:
-        bounding_box = GeoService.calculate_bounding_box(lat, lon, radius_km)
+    async def stream_all(self) -> AsyncIterator[BuildingEntity]:
+        stmt = select(*BUILDING_COLUMNS).order_by(BuildingModel.id)
+        async for rows in stream_row_batches(self._session, stmt):
+            for row in rows:
+                yield BuildingEntity(*row)
 
-        stmt = select(BuildingModel).where(
-            BuildingModel.latitude.between(bounding_box.min_lat, bounding_box.max_lat),
-            BuildingModel.longitude.between(bounding_box.min_lon, bounding_box.max_lon),
+    async def _get_index(self) -> GridSpatialIndex:
+        return await self._index_cache.get(
+            lambda: load_building_index(self._session, self._cell_size_deg)
         )
+
+    async def get_by_ids(self, building_ids: list[int]) -> list[BuildingEntity]:
+        if not building_ids:
+            return []
+        stmt = select(*BUILDING_COLUMNS).where(in_ids(BuildingModel.id, building_ids))
         result = await self._session.execute(stmt)
-        buildings = result.scalars().all()
+        return [BuildingEntity(*row) for row in result]
+
+    async def _get_all(self, stmt: Select) -> list[BuildingEntity]:
+        result = await self._session.execute(stmt.order_by(BuildingModel.id))
+        return [BuildingEntity(*row) for row in result]
 
-        return [
-            self._to_entity(building)
-            for building in buildings
-            if GeoService.is_within_radius(lat, lon, building.latitude, building.longitude, radius_km)
-        ]
+    async def get_in_radius(self, lat: float, lon: float, radius_km: float) -> list[BuildingEntity]:
+        # Nearest first.
+        if self._geo_backend != "memory":
+            stmt = buildings_in_radius(lat, lon, radius_km, self._geo_backend, BUILDING_COLUMNS)
+            result = await self._session.execute(stmt)
+            return [BuildingEntity(*row[:-1]) for row in result]
+        index = await self._get_index()
+        building_ids = [building_id for building_id, _ in index.nearest_in_radius(lat, lon, radius_km)]
+        buildings = {building.id: building for building in await self.get_by_ids(building_ids)}
+        return [buildings[building_id] for building_id in building_ids if building_id in buildings]
 
     async def get_in_rectangle(
         self, min_lat: float, max_lat: float, min_lon: float, max_lon: float
     ) -> list[BuildingEntity]:
-        stmt = select(BuildingModel).where(
-            BuildingModel.latitude.between(min_lat, max_lat),
-            BuildingModel.longitude.between(min_lon, max_lon),
-        )
-        result = await self._session.execute(stmt)
-        return [self._to_entity(building_model) for building_model in result.scalars().all()]
+        if self._geo_backend != "memory":
+            box = BoundingBox(min_lat, max_lat, min_lon, max_lon)
+            return await self._get_all(buildings_in_boxes([box], self._geo_backend, BUILDING_COLUMNS))
+        index = await self._get_index()
+        return await self.get_by_ids(index.in_rectangle(min_lat, max_lat, min_lon, max_lon))
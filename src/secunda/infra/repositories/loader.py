@@ -0,0 +1,99 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from secunda.application.constants import MAX_PAGE_SIZE
+from secunda.application.dto import OrganizationLoadProfileDTO
+from secunda.application.entities import BuildingEntity, OrganizationEntity
+from secunda.infra.cache import BuildingIndexCache
+from secunda.infra.repositories.building import BuildingRepository
+from secunda.infra.repositories.organization import OrganizationRepository
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+OrganizationKey = tuple[int, OrganizationLoadProfileDTO]
+
+
+class BatchLoader(Generic[K, V]):
+    # Keys requested during one event loop iteration are fetched by a single
+    # load_many call, scheduled with call_soon after the first of them.
+    def __init__(
+        self, load_many: Callable[[list[K]], Awaitable[dict[K, V]]], max_batch_size: int = MAX_PAGE_SIZE
+    ) -> None:
+        self._load_many = load_many
+        self._max_batch_size = max_batch_size
+        self._pending: dict[K, asyncio.Future[V | None]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> V | None:
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = self._pending[key] = loop.create_future()
+        # A caller that is cancelled must not cancel the batch for the others waiting on it.
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        keys = list(pending)
+        for start in range(0, len(keys), self._max_batch_size):
+            batch = {key: pending[key] for key in keys[start:start + self._max_batch_size]}
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[K, asyncio.Future[V | None]]) -> None:
+        try:
+            values = await self._load_many(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
+
+
+class RepositoryLoaders:
+    # Shared by all requests, so every batch opens its own session instead of borrowing one.
+    def __init__(
+        self,
+        session_maker: Callable[[], AsyncSession],
+        index_cache: BuildingIndexCache,
+        cell_size_deg: float,
+    ) -> None:
+        self._session_maker = session_maker
+        self._index_cache = index_cache
+        self._cell_size_deg = cell_size_deg
+        self.buildings: BatchLoader[int, BuildingEntity] = BatchLoader(self._load_buildings)
+        self.organizations: BatchLoader[OrganizationKey, OrganizationEntity] = BatchLoader(
+            self._load_organizations
+        )
+
+    async def _load_buildings(self, building_ids: list[int]) -> dict[int, BuildingEntity]:
+        async with self._session_maker() as session:
+            repository = BuildingRepository(session, self._index_cache, self._cell_size_deg)
+            buildings = await repository.get_by_ids(building_ids)
+        return {building.id: building for building in buildings}
+
+    async def _load_organizations(
+        self, keys: list[OrganizationKey]
+    ) -> dict[OrganizationKey, OrganizationEntity]:
+        ids_by_profile: defaultdict[OrganizationLoadProfileDTO, list[int]] = defaultdict(list)
+        for organization_id, profile in keys:
+            ids_by_profile[profile].append(organization_id)
+
+        organizations: dict[OrganizationKey, OrganizationEntity] = {}
+        async with self._session_maker() as session:
+            repository = OrganizationRepository(session, self._index_cache, self._cell_size_deg)
+            for profile, organization_ids in ids_by_profile.items():
+                for organization in await repository.get_by_ids(organization_ids, profile):
+                    organizations[organization.id, profile] = organization
+        return organizations
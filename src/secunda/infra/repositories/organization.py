@@ -1,135 +1,312 @@
-from sqlalchemy import select
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import Any
+
+from sqlalchemy import BigInteger, ColumnElement, Float, Row, Select, and_, bindparam, exists, func, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from secunda.application.dto import CreateOrganizationDTO, GeoSearchDTO
-from secunda.application.entities import ActivityEntity, BuildingEntity, OrganizationEntity
-from secunda.application.services import GeoService
+from secunda.application.dto import (
+    CreateOrganizationDTO,
+    GeoSearchDTO,
+    NearestSearchDTO,
+    OrganizationLoadProfileDTO,
+    OrganizationSearchDTO,
+    PageDTO,
+)
+from secunda.application.entities import (
+    ActivityEntity,
+    ActivityFacetEntity,
+    BuildingEntity,
+    NearbyOrganizationEntity,
+    OrganizationEntity,
+    Page,
+)
+from secunda.application.services import CursorCodec, GridSpatialIndex, OrganizationNameNormalizer
+from secunda.infra.cache import BuildingIndexCache
+from secunda.infra.config import GeoBackend
+from secunda.infra.database.expressions import in_ids
+from secunda.infra.database.geo import haversine_km
 from secunda.infra.database.models import ActivityModel, BuildingModel, OrganizationModel, organization_activity
+from secunda.infra.metrics import instrument_repository
+from secunda.infra.repositories.activity import ACTIVITY_COLUMNS, activity_subtree_clause, path_activity_ids
+from secunda.infra.repositories.building import (
+    BUILDING_COLUMNS,
+    buildings_in_geo_area,
+    buildings_in_radius,
+    load_building_index,
+)
+from secunda.infra.repositories.pagination import build_page_by_id, page_limit, paginate_by_id, stream_row_batches
+
+FULL_PROFILE = OrganizationLoadProfileDTO()
+# Filters only: facet counts need organization ids, not their buildings or activities.
+ID_PROFILE = OrganizationLoadProfileDTO(building=False, activities=False)
+
+ORGANIZATION_COLUMNS = (
+    OrganizationModel.id,
+    OrganizationModel.name,
+    OrganizationModel.phones,
+    OrganizationModel.building_id,
+    OrganizationModel.created_at,
+)
+_BUILDING_OFFSET = len(ORGANIZATION_COLUMNS)
+_BUILDING_END = _BUILDING_OFFSET + len(BUILDING_COLUMNS)
 
+RowMapper = Callable[[Row[Any], OrganizationLoadProfileDTO], OrganizationEntity]
 
+# Buildings per nearest-search round trip; doubles each round up to the maximum, which also
+# bounds the id arrays bound into one statement.
+NEAREST_MIN_BUILDINGS = 16
+NEAREST_MAX_BUILDINGS = 4096
+
+
+@instrument_repository
 class OrganizationRepository:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        index_cache: BuildingIndexCache,
+        cell_size_deg: float,
+        geo_backend: GeoBackend = "memory",
+    ) -> None:
         self._session = session
+        self._index_cache = index_cache
+        self._cell_size_deg = cell_size_deg
+        self._geo_backend = geo_backend
 
-    def _to_entity(self, model: OrganizationModel) -> OrganizationEntity:
-        building = None
-        if model.building:
-            building = BuildingEntity(
-                id=model.building.id,
-                address=model.building.address,
-                latitude=model.building.latitude,
-                longitude=model.building.longitude,
-                created_at=model.building.created_at,
-            )
+    def _row_to_entity(self, row: Row[Any], profile: OrganizationLoadProfileDTO) -> OrganizationEntity:
+        return OrganizationEntity(
+            id=row[0],
+            name=row[1],
+            phones=row[2] or [],
+            building_id=row[3],
+            building=BuildingEntity(*row[_BUILDING_OFFSET:_BUILDING_END]) if profile.building else None,
+            created_at=row[4],
+        )
 
-        activities = []
-        if model.activities:
-            activities = [
-                ActivityEntity(
-                    id=activity.id,
-                    name=activity.name,
-                    level=activity.level,
-                    parent_id=activity.parent_id,
-                    created_at=activity.created_at,
-                )
-                for activity in model.activities
-            ]
+    def _row_to_nearby_entity(self, row: Row[Any], profile: OrganizationLoadProfileDTO) -> NearbyOrganizationEntity:
+        return NearbyOrganizationEntity(
+            id=row[0],
+            name=row[1],
+            phones=row[2] or [],
+            building_id=row[3],
+            building=BuildingEntity(*row[_BUILDING_OFFSET:_BUILDING_END]) if profile.building else None,
+            created_at=row[4],
+            distance_km=round(row[-1], 3),
+        )
 
-        return OrganizationEntity(
-            id=model.id,
-            name=model.name,
-            phones=model.phones or [],
-            building_id=model.building_id,
-            building=building,
-            activities=activities,
-            created_at=model.created_at,
+    async def _attach_activities(self, organizations: list[OrganizationEntity]) -> list[OrganizationEntity]:
+        if not organizations:
+            return organizations
+        by_id = {organization.id: organization for organization in organizations}
+        stmt = (
+            select(organization_activity.c.organization_id, *ACTIVITY_COLUMNS)
+            .join(ActivityModel, ActivityModel.id == organization_activity.c.activity_id)
+            .where(in_ids(organization_activity.c.organization_id, by_id))
+            .order_by(ActivityModel.id)
         )
+        result = await self._session.execute(stmt)
+        for row in result:
+            by_id[row[0]].activities.append(ActivityEntity(*row[1:]))
+        return organizations
+
+    async def _to_entities(
+        self, rows: Sequence[Row[Any]], profile: OrganizationLoadProfileDTO, to_entity: RowMapper | None = None
+    ) -> list[OrganizationEntity]:
+        to_entity = to_entity or self._row_to_entity
+        organizations = [to_entity(row, profile) for row in rows]
+        if profile.activities:
+            await self._attach_activities(organizations)
+        return organizations
 
     async def create(self, dto: CreateOrganizationDTO) -> OrganizationEntity:
+        activities = []
+        if dto.activity_ids:
+            stmt = select(ActivityModel).where(ActivityModel.id.in_(dto.activity_ids))
+            result = await self._session.execute(stmt)
+            activities = list(result.scalars().all())
+
+        # Assigning the collection after flush would lazy-load it outside the greenlet.
         model = OrganizationModel(
             name=dto.name,
             phones=dto.phones,
             building_id=dto.building_id,
+            activities=activities,
         )
         self._session.add(model)
         await self._session.flush()
+        return await self.get_by_id(model.id)  # type: ignore[return-value]
 
-        if dto.activity_ids:
-            stmt = select(ActivityModel).where(ActivityModel.id.in_(dto.activity_ids))
-            result = await self._session.execute(stmt)
-            activities = result.scalars().all()
-            model.activities = list(activities)
-            await self._session.flush()
+    def _select(self, profile: OrganizationLoadProfileDTO) -> Select:
+        # Plain column rows: no ORM instances, identity map or relationship loaders on reads.
+        # The building is joined only when the profile asks for it.
+        stmt = select(*ORGANIZATION_COLUMNS)
+        if profile.building:
+            stmt = stmt.add_columns(*BUILDING_COLUMNS).join(
+                BuildingModel, BuildingModel.id == OrganizationModel.building_id
+            )
+        return stmt
 
-        await self._session.refresh(model)
-        return self._to_entity(model)
+    async def _get_page(
+        self, stmt: Select, page: PageDTO, profile: OrganizationLoadProfileDTO
+    ) -> Page[OrganizationEntity]:
+        result = await self._session.execute(paginate_by_id(stmt, OrganizationModel.id, page))
+        organizations = build_page_by_id([self._row_to_entity(row, profile) for row in result], page)
+        if profile.activities:
+            await self._attach_activities(organizations.items)
+        return organizations
 
-    async def get_by_id(self, organization_id: int) -> OrganizationEntity | None:
-        stmt = (
-            select(OrganizationModel)
-            .where(OrganizationModel.id == organization_id)
-            .options(
-                selectinload(OrganizationModel.building),
-                selectinload(OrganizationModel.activities),
-            )
-        )
+    async def _stream_rows(
+        self, stmt: Select, profile: OrganizationLoadProfileDTO, to_entity: RowMapper | None = None
+    ) -> AsyncIterator[OrganizationEntity]:
+        async for rows in stream_row_batches(self._session, stmt):
+            for organization in await self._to_entities(rows, profile, to_entity):
+                yield organization
+
+    def _stream(self, stmt: Select, profile: OrganizationLoadProfileDTO) -> AsyncIterator[OrganizationEntity]:
+        return self._stream_rows(stmt.order_by(OrganizationModel.id), profile)
+
+    async def get_by_id(
+        self, organization_id: int, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> OrganizationEntity | None:
+        stmt = self._select(profile).where(OrganizationModel.id == organization_id)
         result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return self._to_entity(model) if model else None
+        row = result.first()
+        if row is None:
+            return None
+        (organization,) = await self._to_entities([row], profile)
+        return organization
 
-    async def get_by_building_id(self, building_id: int) -> list[OrganizationEntity]:
-        stmt = (
-            select(OrganizationModel)
-            .where(OrganizationModel.building_id == building_id)
-            .options(
-                selectinload(OrganizationModel.building),
-                selectinload(OrganizationModel.activities),
-            )
-        )
+    async def get_by_ids(
+        self, organization_ids: list[int], profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> list[OrganizationEntity]:
+        if not organization_ids:
+            return []
+        stmt = self._select(profile).where(in_ids(OrganizationModel.id, organization_ids))
         result = await self._session.execute(stmt)
-        return [self._to_entity(org_model) for org_model in result.scalars().all()]
+        return await self._to_entities(result.all(), profile)
 
-    async def get_by_activity_id(self, activity_id: int) -> list[OrganizationEntity]:
-        stmt = (
-            select(OrganizationModel)
+    def _by_building_stmt(self, building_id: int, profile: OrganizationLoadProfileDTO) -> Select:
+        return self._select(profile).where(OrganizationModel.building_id == building_id)
+
+    async def get_by_building_id(
+        self, building_id: int, page: PageDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> Page[OrganizationEntity]:
+        return await self._get_page(self._by_building_stmt(building_id, profile), page, profile)
+
+    def stream_by_building_id(
+        self, building_id: int, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> AsyncIterator[OrganizationEntity]:
+        return self._stream(self._by_building_stmt(building_id, profile), profile)
+
+    def _by_activity_stmt(self, activity_id: int, profile: OrganizationLoadProfileDTO) -> Select:
+        return (
+            self._select(profile)
             .join(organization_activity)
             .where(organization_activity.c.activity_id == activity_id)
-            .options(
-                selectinload(OrganizationModel.building),
-                selectinload(OrganizationModel.activities),
-            )
         )
-        result = await self._session.execute(stmt)
-        return [self._to_entity(org_model) for org_model in result.scalars().all()]
 
-    async def get_by_activity_ids(self, activity_ids: list[int]) -> list[OrganizationEntity]:
-        stmt = (
-            select(OrganizationModel)
+    async def get_by_activity_id(
+        self, activity_id: int, page: PageDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> Page[OrganizationEntity]:
+        return await self._get_page(self._by_activity_stmt(activity_id, profile), page, profile)
+
+    def stream_by_activity_id(
+        self, activity_id: int, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> AsyncIterator[OrganizationEntity]:
+        return self._stream(self._by_activity_stmt(activity_id, profile), profile)
+
+    def _by_activity_subtree_stmt(self, activity_id: int, profile: OrganizationLoadProfileDTO) -> Select:
+        return (
+            self._select(profile)
             .join(organization_activity)
-            .where(organization_activity.c.activity_id.in_(activity_ids))
+            .join(ActivityModel, ActivityModel.id == organization_activity.c.activity_id)
+            .where(activity_subtree_clause(activity_id))
             .distinct(OrganizationModel.id)
-            .options(
-                selectinload(OrganizationModel.building),
-                selectinload(OrganizationModel.activities),
-            )
         )
-        result = await self._session.execute(stmt)
-        return [self._to_entity(org_model) for org_model in result.scalars().all()]
 
-    async def search_by_name(self, name: str) -> list[OrganizationEntity]:
-        stmt = (
-            select(OrganizationModel)
-            .where(OrganizationModel.name.ilike(f"%{name}%"))
-            .options(
-                selectinload(OrganizationModel.building),
-                selectinload(OrganizationModel.activities),
+    async def get_by_activity_subtree(
+        self, activity_id: int, page: PageDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> Page[OrganizationEntity]:
+        return await self._get_page(self._by_activity_subtree_stmt(activity_id, profile), page, profile)
+
+    def stream_by_activity_subtree(
+        self, activity_id: int, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> AsyncIterator[OrganizationEntity]:
+        return self._stream(self._by_activity_subtree_stmt(activity_id, profile), profile)
+
+    def _name_score(self, search_key: str) -> ColumnElement[float]:
+        return func.word_similarity(search_key, OrganizationModel.search_name)
+
+    def _by_name_stmt(self, search_key: str, profile: OrganizationLoadProfileDTO) -> Select:
+        # Both predicates are served by the trigram GIN index on search_name.
+        return self._select(profile).where(
+            or_(
+                OrganizationModel.search_name.contains(search_key, autoescape=True),
+                OrganizationModel.search_name.op("%>")(search_key),
             )
         )
+
+    async def _get_keyset_page(
+        self,
+        stmt: Select,
+        key: ColumnElement[float],
+        page: PageDTO,
+        profile: OrganizationLoadProfileDTO,
+        descending: bool = False,
+        to_entity: RowMapper | None = None,
+    ) -> Page[OrganizationEntity]:
+        # Ordered by key, then id; the key is selected last and the cursor holds it with the id.
+        stmt = stmt.add_columns(key)
+        if page.cursor is not None:
+            after_key, after_id = CursorCodec.decode(page.cursor, 2)
+            if not isinstance(after_key, (int, float)) or not isinstance(after_id, int):
+                raise ValueError("Некорректный курсор")
+            stmt = stmt.where(
+                or_(
+                    key < after_key if descending else key > after_key,
+                    and_(key == after_key, OrganizationModel.id > after_id),
+                )
+            )
+        stmt = stmt.order_by(key.desc() if descending else key, OrganizationModel.id).limit(page_limit(page))
+
         result = await self._session.execute(stmt)
-        return [self._to_entity(org_model) for org_model in result.scalars().all()]
+        rows = result.all()
+        items = await self._to_entities(rows[: page.limit], profile, to_entity)
+        if len(rows) <= page.limit:
+            return Page(items=items)
+        last_row = rows[page.limit - 1]
+        return Page(items=items, next_cursor=CursorCodec.encode(last_row[-1], last_row[0]))
+
+    async def search_by_name(
+        self, name: str, page: PageDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> Page[OrganizationEntity]:
+        search_key = OrganizationNameNormalizer.normalize(name)
+        if not search_key:
+            return Page(items=[])
+        return await self._get_keyset_page(
+            self._by_name_stmt(search_key, profile), self._name_score(search_key), page, profile, descending=True
+        )
+
+    async def stream_by_name(
+        self, name: str, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> AsyncIterator[OrganizationEntity]:
+        search_key = OrganizationNameNormalizer.normalize(name)
+        if not search_key:
+            return
+        stmt = self._by_name_stmt(search_key, profile).order_by(
+            self._name_score(search_key).desc(), OrganizationModel.id
+        )
+        async for organization in self._stream_rows(stmt, profile):
+            yield organization
+
+    async def _where_in_geo_area(self, stmt: Select, dto: GeoSearchDTO) -> Select | None:
+        if self._geo_backend != "memory":
+            # One statement: a semi-join against the buildings selected through the geo index.
+            buildings = buildings_in_geo_area(dto, self._geo_backend)
+            if buildings is None:
+                return None
+            return stmt.where(OrganizationModel.building_id.in_(buildings))
 
-    async def get_in_geo_area(self, dto: GeoSearchDTO) -> list[OrganizationEntity]:
         if dto.radius_km is not None:
             building_ids = await self._get_building_ids_in_radius(
                 dto.latitude, dto.longitude, dto.radius_km
@@ -139,46 +316,247 @@ class OrganizationRepository:
                 dto.min_lat, dto.max_lat, dto.min_lon, dto.max_lon  # type: ignore
             )
         else:
-            return []
+            return None
 
         if not building_ids:
-            return []
+            return None
+        return stmt.where(in_ids(OrganizationModel.building_id, building_ids))
 
-        stmt = (
-            select(OrganizationModel)
-            .where(OrganizationModel.building_id.in_(building_ids))
-            .options(
-                selectinload(OrganizationModel.building),
-                selectinload(OrganizationModel.activities),
+    async def _in_geo_area_stmt(self, dto: GeoSearchDTO, profile: OrganizationLoadProfileDTO) -> Select | None:
+        return await self._where_in_geo_area(self._select(profile), dto)
+
+    async def get_in_geo_area(
+        self, dto: GeoSearchDTO, page: PageDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> Page[OrganizationEntity]:
+        stmt = await self._in_geo_area_stmt(dto, profile)
+        if stmt is None:
+            return Page(items=[])
+        return await self._get_page(stmt, page, profile)
+
+    async def stream_in_geo_area(
+        self, dto: GeoSearchDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> AsyncIterator[OrganizationEntity]:
+        stmt = await self._in_geo_area_stmt(dto, profile)
+        if stmt is None:
+            return
+        async for organization in self._stream(stmt, profile):
+            yield organization
+
+    async def _in_radius_stmt(
+        self, dto: GeoSearchDTO, profile: OrganizationLoadProfileDTO
+    ) -> tuple[Select, ColumnElement[float]] | None:
+        # Organizations joined to the buildings in the radius, which carry their distance_km.
+        if dto.radius_km is None:
+            return None
+        if self._geo_backend != "memory":
+            buildings = buildings_in_radius(dto.latitude, dto.longitude, dto.radius_km, self._geo_backend)
+        else:
+            building_ids = await self._get_building_ids_in_radius(dto.latitude, dto.longitude, dto.radius_km)
+            if not building_ids:
+                return None
+            distance = haversine_km(BuildingModel.latitude, BuildingModel.longitude, dto.latitude, dto.longitude)
+            buildings = select(BuildingModel.id, distance.label("distance_km")).where(
+                in_ids(BuildingModel.id, building_ids)
             )
+        nearby = buildings.order_by(None).subquery("nearby")
+        stmt = self._select(profile).join(nearby, nearby.c.id == OrganizationModel.building_id)
+        return stmt, nearby.c.distance_km
+
+    async def get_in_radius(
+        self, dto: GeoSearchDTO, page: PageDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> Page[NearbyOrganizationEntity]:
+        # Nearest first; the cursor holds the distance and id of the last organization.
+        in_radius = await self._in_radius_stmt(dto, profile)
+        if in_radius is None:
+            return Page(items=[])
+        stmt, distance = in_radius
+        return await self._get_keyset_page(  # type: ignore[return-value]
+            stmt, distance, page, profile, to_entity=self._row_to_nearby_entity
+        )
+
+    async def stream_in_radius(
+        self, dto: GeoSearchDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> AsyncIterator[NearbyOrganizationEntity]:
+        in_radius = await self._in_radius_stmt(dto, profile)
+        if in_radius is None:
+            return
+        stmt, distance = in_radius
+        stmt = stmt.add_columns(distance).order_by(distance, OrganizationModel.id)
+        async for organization in self._stream_rows(stmt, profile, self._row_to_nearby_entity):
+            yield organization  # type: ignore[misc]
+
+    async def _get_building_index(self) -> GridSpatialIndex:
+        return await self._index_cache.get(
+            lambda: load_building_index(self._session, self._cell_size_deg)
         )
-        result = await self._session.execute(stmt)
-        return [self._to_entity(org_model) for org_model in result.scalars().all()]
 
     async def _get_building_ids_in_radius(
         self, lat: float, lon: float, radius_km: float
     ) -> list[int]:
-        bounding_box = GeoService.calculate_bounding_box(lat, lon, radius_km)
+        index = await self._get_building_index()
+        return index.in_radius(lat, lon, radius_km)
 
-        stmt = select(BuildingModel).where(
-            BuildingModel.latitude.between(bounding_box.min_lat, bounding_box.max_lat),
-            BuildingModel.longitude.between(bounding_box.min_lon, bounding_box.max_lon),
+    async def _get_building_ids_in_rectangle(
+        self, min_lat: float, max_lat: float, min_lon: float, max_lon: float
+    ) -> list[int]:
+        index = await self._get_building_index()
+        return index.in_rectangle(min_lat, max_lat, min_lon, max_lon)
+
+    def _has_activity_in_subtree(self, activity_id: int) -> ColumnElement[bool]:
+        # EXISTS instead of a join: an organization with several matching activities stays one row.
+        return (
+            exists()
+            .where(organization_activity.c.organization_id == OrganizationModel.id)
+            .where(ActivityModel.id == organization_activity.c.activity_id)
+            .where(activity_subtree_clause(activity_id))
+        )
+
+    async def _search_stmt(
+        self, dto: OrganizationSearchDTO, profile: OrganizationLoadProfileDTO
+    ) -> tuple[Select, ColumnElement[float] | None] | None:
+        # Every filter lands in the WHERE clause of one statement, so Postgres picks the most
+        # selective index and only the requested page leaves the database.
+        stmt = self._select(profile)
+        score = None
+        if dto.name is not None:
+            search_key = OrganizationNameNormalizer.normalize(dto.name)
+            if not search_key:
+                return None
+            stmt = self._by_name_stmt(search_key, profile)
+            score = self._name_score(search_key)
+        if dto.activity_id is not None:
+            stmt = stmt.where(self._has_activity_in_subtree(dto.activity_id))
+        if dto.area is not None:
+            in_area = await self._where_in_geo_area(stmt, dto.area)
+            if in_area is None:
+                return None
+            stmt = in_area
+        return stmt, score
+
+    async def search(
+        self, dto: OrganizationSearchDTO, page: PageDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> Page[OrganizationEntity]:
+        # Ordered by name relevance when a name is given, by id otherwise; the cursor follows the order.
+        search = await self._search_stmt(dto, profile)
+        if search is None:
+            return Page(items=[])
+        stmt, score = search
+        if score is not None:
+            return await self._get_keyset_page(stmt, score, page, profile, descending=True)
+        return await self._get_page(stmt, page, profile)
+
+    async def stream_search(
+        self, dto: OrganizationSearchDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> AsyncIterator[OrganizationEntity]:
+        search = await self._search_stmt(dto, profile)
+        if search is None:
+            return
+        stmt, score = search
+        if score is not None:
+            stmt = stmt.order_by(score.desc())
+        async for organization in self._stream(stmt, profile):
+            yield organization
+
+    async def count_by_activity(self, dto: OrganizationSearchDTO) -> list[ActivityFacetEntity]:
+        # One grouped statement. The path of each linked activity lists its ancestors, so a link
+        # expands to (organization, ancestor) pairs without a join; the pairs are deduplicated
+        # first, so an organization counts once per activity even when linked to several of its descendants.
+        search = await self._search_stmt(dto, ID_PROFILE)
+        if search is None:
+            return []
+        organization_ids = search[0].with_only_columns(OrganizationModel.id)
+        pairs = (
+            select(
+                organization_activity.c.organization_id,
+                func.unnest(path_activity_ids(ActivityModel.path)).label("activity_id"),
+            )
+            .join(ActivityModel, ActivityModel.id == organization_activity.c.activity_id)
+            .where(organization_activity.c.organization_id.in_(organization_ids))
+            .distinct()
+            .subquery()
+        )
+        counts = (
+            select(pairs.c.activity_id, func.count().label("organizations_count"))
+            .group_by(pairs.c.activity_id)
+            .subquery()
+        )
+        stmt = (
+            select(
+                ActivityModel.id,
+                ActivityModel.name,
+                ActivityModel.level,
+                ActivityModel.parent_id,
+                counts.c.organizations_count,
+            )
+            .join(counts, counts.c.activity_id == ActivityModel.id)
+            .order_by(ActivityModel.path)
         )
         result = await self._session.execute(stmt)
-        buildings = result.scalars().all()
+        return [ActivityFacetEntity(*row) for row in result]
 
-        return [
-            building.id
-            for building in buildings
-            if GeoService.is_within_radius(lat, lon, building.latitude, building.longitude, radius_km)
-        ]
+    def _nearest_stmt(
+        self, distances: dict[int, float], dto: NearestSearchDTO, limit: int, profile: OrganizationLoadProfileDTO
+    ) -> Select:
+        buildings = func.unnest(
+            bindparam(None, list(distances), type_=ARRAY(BigInteger)),
+            bindparam(None, list(distances.values()), type_=ARRAY(Float)),
+        ).table_valued("building_id", "distance_km").render_derived(name="nearby")
+        stmt = (
+            self._select(profile)
+            .add_columns(buildings.c.distance_km)
+            .join(buildings, buildings.c.building_id == OrganizationModel.building_id)
+            .order_by(buildings.c.distance_km, OrganizationModel.id)
+            .limit(limit)
+        )
+        if dto.activity_id is not None:
+            stmt = stmt.where(self._has_activity_in_subtree(dto.activity_id))
+        return stmt
 
-    async def _get_building_ids_in_rectangle(
-        self, min_lat: float, max_lat: float, min_lon: float, max_lon: float
-    ) -> list[int]:
-        stmt = select(BuildingModel.id).where(
-            BuildingModel.latitude.between(min_lat, max_lat),
-            BuildingModel.longitude.between(min_lon, max_lon),
+    async def _buildings_with_activity(self, activity_id: int) -> list[int]:
+        stmt = (
+            select(OrganizationModel.building_id)
+            .where(self._has_activity_in_subtree(activity_id))
+            .distinct()
+            .limit(NEAREST_MAX_BUILDINGS + 1)
         )
         result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.scalars())
+
+    async def get_nearest(
+        self, dto: NearestSearchDTO, profile: OrganizationLoadProfileDTO = FULL_PROFILE
+    ) -> list[NearbyOrganizationEntity]:
+        # Buildings come from the index nearest first, up to max_distance_km; each round fetches the
+        # organizations of the next few buildings, which are all closer than any building left, so
+        # once `limit` organizations are found the rest of the index is never scanned.
+        only = None
+        if dto.activity_id is not None:
+            # An unknown activity or one without organizations costs one statement and no scan. A sparse
+            # one restricts the scan to its buildings, each holding a match, so one round is enough.
+            building_ids = await self._buildings_with_activity(dto.activity_id)
+            if not building_ids:
+                return []
+            if len(building_ids) <= NEAREST_MAX_BUILDINGS:
+                only = building_ids
+        index = await self._get_building_index()
+        nearest: list[NearbyOrganizationEntity] = []
+        # Batches come nearest first, so the buffer stays sorted across them.
+        buffered: list[tuple[int, float]] = []
+        round_size = max(dto.limit, NEAREST_MIN_BUILDINGS)
+        batches = index.iter_nearest(dto.latitude, dto.longitude, dto.max_distance_km, only)
+        exhausted = False
+        while len(nearest) < dto.limit:
+            while len(buffered) < round_size and not exhausted:
+                batch = next(batches, None)
+                exhausted = batch is None
+                buffered.extend(batch or [])
+            if not buffered:
+                break
+            distances = dict(buffered[:round_size])
+            buffered = buffered[round_size:]
+            stmt = self._nearest_stmt(distances, dto, dto.limit - len(nearest), profile)
+            result = await self._session.execute(stmt)
+            nearest.extend(self._row_to_nearby_entity(row, profile) for row in result)
+            round_size = min(round_size * 2, NEAREST_MAX_BUILDINGS)
+        if profile.activities:
+            await self._attach_activities(nearest)
+        return nearest
@@ -0,0 +1,44 @@
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, TypeVar
+
+from sqlalchemy import ColumnElement, Integer, Row, Select, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from secunda.application.dto import PageDTO
+from secunda.application.entities import Page
+from secunda.application.services import CursorCodec
+
+T = TypeVar("T")
+SelectT = TypeVar("SelectT", bound=Select[Any])
+
+STREAM_BATCH_SIZE = 1000
+
+
+def page_limit(page: PageDTO) -> ColumnElement[int]:
+    # One extra row tells whether another page exists without a COUNT query. The limit is inlined:
+    # a generic plan for a bound LIMIT assumes a tenth of the rows are fetched and tends to walk
+    # the id index past a selective filter instead of sorting its few matches.
+    return literal(page.limit + 1, Integer, literal_execute=True)
+
+
+def paginate_by_id(stmt: SelectT, id_column: ColumnElement[int], page: PageDTO) -> SelectT:
+    if page.cursor is not None:
+        (after_id,) = CursorCodec.decode(page.cursor, 1)
+        if not isinstance(after_id, int):
+            raise ValueError("Некорректный курсор")
+        stmt = stmt.where(id_column > after_id)
+    return stmt.order_by(id_column).limit(page_limit(page))
+
+
+def build_page_by_id(items: Sequence[T], page: PageDTO) -> Page[T]:
+    if len(items) <= page.limit:
+        return Page(items=list(items))
+    items = items[: page.limit]
+    return Page(items=list(items), next_cursor=CursorCodec.encode(items[-1].id))  # type: ignore[attr-defined]
+
+
+async def stream_row_batches(session: AsyncSession, stmt: Select[Any]) -> AsyncIterator[Sequence[Row[Any]]]:
+    # Column rows are not tracked by the identity map, so memory stays flat over the whole stream.
+    result = await session.stream(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+    async for rows in result.partitions():
+        yield rows
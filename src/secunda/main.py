@@ -1,33 +1,73 @@
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from dishka import make_async_container
-from dishka.integrations.fastapi import setup_dishka
+from dishka.integrations.fastapi import FastapiProvider, setup_dishka
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 
+from secunda.infra.cache import BuildingIndexCache
+from secunda.infra.config import AppSettings, PostgresSettings
+from secunda.infra.database import ReadYourWritesMiddleware
+from secunda.infra.metrics import MetricsMiddleware, SqlTraceMiddleware, metrics_endpoint
 from secunda.infra.ioc import (
+    READ_COMPONENT,
+    CacheProvider,
     ConfigProvider,
     DatabaseProvider,
     InteractorProvider,
+    ReadDatabaseProvider,
     RepositoryProvider,
 )
+from secunda.infra.repositories.building import load_building_index
 from secunda.presentation.routers import api_router
 
 
 container = make_async_container(
         ConfigProvider(),
         DatabaseProvider(),
+        ReadDatabaseProvider(),
+        CacheProvider(),
         RepositoryProvider(),
+        RepositoryProvider(component=READ_COMPONENT),
         InteractorProvider(),
+        FastapiProvider(),
     )
 
-def create_app() -> FastAPI:
 
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    session_maker = await container.get(async_sessionmaker[AsyncSession])
+    app_config = await container.get(AppSettings)
+    index_cache = await container.get(BuildingIndexCache)
+    async with session_maker() as session:
+        await index_cache.get(
+            lambda: load_building_index(session, app_config.building_index_cell_size_deg)
+        )
+    yield
+    await container.close()
+
+
+def create_app() -> FastAPI:
+    app_config = AppSettings()
     fastapi_app = FastAPI(
         title="Secunda API",
         description="REST API тестовое",
         version="1.0.0",
+        lifespan=lifespan,
     )
     setup_dishka(container=container, app=fastapi_app)
+    fastapi_app.add_middleware(
+        ReadYourWritesMiddleware, window_seconds=PostgresSettings().read_your_writes_seconds
+    )
+    if app_config.debug:
+        logging.basicConfig(level=logging.INFO)
+        fastapi_app.add_middleware(SqlTraceMiddleware, n_plus_one_threshold=app_config.n_plus_one_threshold)
+    fastapi_app.add_middleware(MetricsMiddleware)
+    fastapi_app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
     fastapi_app.include_router(api_router)
 
     return fastapi_app
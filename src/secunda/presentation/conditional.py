@@ -0,0 +1,56 @@
+import hashlib
+from collections.abc import Awaitable, Callable
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import HTTPException, Request, Response, status
+
+from secunda.application.constants import ACTIVITIES_CACHE_GROUP, BUILDINGS_CACHE_GROUP, ORGANIZATIONS_CACHE_GROUP
+from secunda.application.interfaces import TableVersionsProtocol
+from secunda.presentation.streaming import wants_ndjson
+
+# Clients may keep a copy but must revalidate it: with the tag that costs a 304 and no queries.
+CACHE_CONTROL = "no-cache"
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison, so W/ prefixes added by proxies still match.
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def entity_tag(*groups: str) -> Callable[..., Awaitable[str | None]]:
+    # The tag covers the table versions and the full request URL with its representation,
+    # so it is known before the interactor runs.
+    @inject
+    async def get_entity_tag(request: Request, versions: FromDishka[TableVersionsProtocol]) -> str | None:
+        version = await versions.current(*groups)
+        if version is None:
+            return None
+        representation = "ndjson" if wants_ndjson(request) else "json"
+        payload = f"{version}|{representation}|{request.url.path}?{request.url.query}"
+        etag = f'"{hashlib.blake2b(payload.encode(), digest_size=12).hexdigest()}"'
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _matches(if_none_match, etag):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept"},
+            )
+        return etag
+
+    return get_entity_tag
+
+
+def with_entity_tag(response: Response, etag: str | None) -> Response:
+    if etag is not None:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CACHE_CONTROL
+        response.headers["Vary"] = "Accept"
+    return response
+
+
+get_buildings_entity_tag = entity_tag(BUILDINGS_CACHE_GROUP)
+get_activities_entity_tag = entity_tag(ACTIVITIES_CACHE_GROUP)
+get_organizations_entity_tag = entity_tag(ORGANIZATIONS_CACHE_GROUP)
@@ -0,0 +1,107 @@
+from collections.abc import Callable
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+
+from secunda.application.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from secunda.application.dto import GeoSearchDTO, OrganizationSearchDTO, PageDTO
+from secunda.presentation.schemas import (
+    ActivityResponse,
+    BuildingResponse,
+    NearbyOrganizationResponse,
+    OrganizationResponse,
+)
+
+
+def get_page(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+) -> PageDTO:
+    return PageDTO(limit=limit, cursor=cursor)
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def get_organization_search(
+    activity_id: int | None = Query(None, description="Деятельность вместе с вложенными"),
+    name: str | None = Query(None, min_length=1, description="Часть названия"),
+    lat: float | None = Query(None, ge=-90, le=90, description="Центр радиуса"),
+    lon: float | None = Query(None, ge=-180, le=180, description="Центр радиуса"),
+    radius_km: float | None = Query(None, gt=0),
+    min_lat: float | None = Query(None, ge=-90, le=90),
+    max_lat: float | None = Query(None, ge=-90, le=90),
+    min_lon: float | None = Query(None, ge=-180, le=180),
+    max_lon: float | None = Query(None, ge=-180, le=180),
+) -> OrganizationSearchDTO:
+    radius = (lat, lon, radius_km)
+    rectangle = (min_lat, max_lat, min_lon, max_lon)
+    has_radius = any(value is not None for value in radius)
+    has_rectangle = any(value is not None for value in rectangle)
+    if has_radius and has_rectangle:
+        raise _bad_request("Укажите либо радиус, либо прямоугольник")
+    if has_radius and None in radius:
+        raise _bad_request("Для поиска в радиусе нужны lat, lon и radius_km")
+    if has_rectangle and None in rectangle:
+        raise _bad_request("Для поиска в прямоугольнике нужны min_lat, max_lat, min_lon и max_lon")
+
+    area = None
+    if has_radius:
+        area = GeoSearchDTO(latitude=lat, longitude=lon, radius_km=radius_km)  # type: ignore[arg-type]
+    elif has_rectangle:
+        area = GeoSearchDTO(
+            latitude=0, longitude=0, min_lat=min_lat, max_lat=max_lat, min_lon=min_lon, max_lon=max_lon
+        )
+    if activity_id is None and name is None and area is None:
+        raise _bad_request("Укажите хотя бы один фильтр: activity_id, name, радиус или прямоугольник")
+    return OrganizationSearchDTO(activity_id=activity_id, name=name, area=area)
+
+
+def _parse_ids(ids: str) -> list[int]:
+    try:
+        values = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Некорректный список id") from None
+    if not values:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Пустой список id")
+    if len(values) > MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Не больше {MAX_PAGE_SIZE} id за запрос"
+        )
+    # Duplicates are dropped, the requested order is kept.
+    return list(dict.fromkeys(values))
+
+
+def get_ids(ids: str | None = Query(None, description="id через запятую")) -> list[int] | None:
+    return _parse_ids(ids) if ids is not None else None
+
+
+def get_required_ids(ids: str = Query(..., description="id через запятую")) -> list[int]:
+    return _parse_ids(ids)
+
+
+def sparse_fields(schema: type[BaseModel]) -> Callable[..., set[str] | None]:
+    allowed = list(schema.model_fields)
+
+    def get_fields(
+        fields: str | None = Query(None, description=f"Поля ответа через запятую: {','.join(allowed)}"),
+    ) -> set[str] | None:
+        if fields is None:
+            return None
+        requested = {field.strip() for field in fields.split(",") if field.strip()}
+        unknown = requested.difference(allowed)
+        if not requested or unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Неизвестные поля: {','.join(sorted(unknown))}" if unknown else "Пустой список полей",
+            )
+        return requested
+
+    return get_fields
+
+
+get_building_fields = sparse_fields(BuildingResponse)
+get_activity_fields = sparse_fields(ActivityResponse)
+get_organization_fields = sparse_fields(OrganizationResponse)
+get_nearby_organization_fields = sparse_fields(NearbyOrganizationResponse)
@@ -1,44 +1,54 @@
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from secunda.application.dto import CreateActivityDTO
 from secunda.application.interactors import (
     CreateActivityInteractor,
+    GetActivitiesByIdsInteractor,
     GetActivitiesInteractor,
     GetActivityByIdInteractor,
 )
+from secunda.presentation.conditional import get_activities_entity_tag, with_entity_tag
+from secunda.presentation.dependencies import get_activity_fields, get_ids
 from secunda.presentation.schemas import ActivityCreate, ActivityResponse
+from secunda.presentation.serialization import activity_serializer
 
 router = APIRouter(prefix="/activities", tags=["activities"], route_class=DishkaRoute)
 
 
 @router.get("", response_model=list[ActivityResponse])
 async def get_activities(
-    interactor: FromDishka[GetActivitiesInteractor],
-) -> list[ActivityResponse]:
-    activities = await interactor()
-    return [ActivityResponse.model_validate(a) for a in activities]
+    fields: set[str] | None = Depends(get_activity_fields),
+    ids: list[int] | None = Depends(get_ids),
+    etag: str | None = Depends(get_activities_entity_tag),
+    interactor: FromDishka[GetActivitiesInteractor] = None,
+    by_ids_interactor: FromDishka[GetActivitiesByIdsInteractor] = None,
+) -> Response:
+    activities = await by_ids_interactor(ids) if ids is not None else await interactor()
+    return with_entity_tag(activity_serializer.list_response(activities, fields), etag)
 
 
 @router.get("/{activity_id}", response_model=ActivityResponse)
 async def get_activity(
     activity_id: int,
-    interactor: FromDishka[GetActivityByIdInteractor],
-) -> ActivityResponse:
+    fields: set[str] | None = Depends(get_activity_fields),
+    etag: str | None = Depends(get_activities_entity_tag),
+    interactor: FromDishka[GetActivityByIdInteractor] = None,
+) -> Response:
     activity = await interactor(activity_id)
     if not activity:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Activity not found")
-    return ActivityResponse.model_validate(activity)
+    return with_entity_tag(activity_serializer.response(activity, fields=fields), etag)
 
 
 @router.post("", response_model=ActivityResponse, status_code=status.HTTP_201_CREATED)
 async def create_activity(
     data: ActivityCreate,
     interactor: FromDishka[CreateActivityInteractor],
-) -> ActivityResponse:
+) -> Response:
     dto = CreateActivityDTO(name=data.name, parent_id=data.parent_id)
     try:
         activity = await interactor(dto)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    return ActivityResponse.model_validate(activity)
+    return activity_serializer.response(activity, status_code=status.HTTP_201_CREATED)
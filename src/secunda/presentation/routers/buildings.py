@@ -1,45 +1,68 @@
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from secunda.application.dto import CreateBuildingDTO
+from secunda.application.dto import CreateBuildingDTO, PageDTO
+from secunda.application.entities import Page
 from secunda.application.interactors import (
     CreateBuildingInteractor,
     GetBuildingByIdInteractor,
+    GetBuildingsByIdsInteractor,
     GetBuildingsInteractor,
 )
-from secunda.presentation.schemas import BuildingCreate, BuildingResponse
+from secunda.presentation.conditional import get_buildings_entity_tag, with_entity_tag
+from secunda.presentation.dependencies import get_building_fields, get_ids, get_page
+from secunda.presentation.schemas import BuildingCreate, BuildingResponse, PageResponse
+from secunda.presentation.serialization import building_serializer
+from secunda.presentation.streaming import NDJSON_RESPONSES, ndjson_response, wants_ndjson
 
 router = APIRouter(prefix="/buildings", tags=["buildings"], route_class=DishkaRoute)
 
 
-@router.get("", response_model=list[BuildingResponse])
+@router.get("", response_model=PageResponse[BuildingResponse], responses=NDJSON_RESPONSES)
 async def get_buildings(
-    interactor: FromDishka[GetBuildingsInteractor],
-) -> list[BuildingResponse]:
-    buildings = await interactor()
-    return [BuildingResponse.model_validate(b) for b in buildings]
+    request: Request,
+    page: PageDTO = Depends(get_page),
+    fields: set[str] | None = Depends(get_building_fields),
+    ids: list[int] | None = Depends(get_ids),
+    etag: str | None = Depends(get_buildings_entity_tag),
+    interactor: FromDishka[GetBuildingsInteractor] = None,
+    by_ids_interactor: FromDishka[GetBuildingsByIdsInteractor] = None,
+) -> Response:
+    if ids is not None:
+        # Found buildings in the requested order, as a single page.
+        buildings = Page(await by_ids_interactor(ids))
+        return with_entity_tag(building_serializer.page_response(buildings, fields), etag)
+    if wants_ndjson(request):
+        return with_entity_tag(ndjson_response(interactor.stream(), building_serializer, fields), etag)
+    try:
+        buildings = await interactor(page)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return with_entity_tag(building_serializer.page_response(buildings, fields), etag)
 
 
 @router.get("/{building_id}", response_model=BuildingResponse)
 async def get_building(
     building_id: int,
-    interactor: FromDishka[GetBuildingByIdInteractor],
-) -> BuildingResponse:
+    fields: set[str] | None = Depends(get_building_fields),
+    etag: str | None = Depends(get_buildings_entity_tag),
+    interactor: FromDishka[GetBuildingByIdInteractor] = None,
+) -> Response:
     building = await interactor(building_id)
     if not building:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Building not found")
-    return BuildingResponse.model_validate(building)
+    return with_entity_tag(building_serializer.response(building, fields=fields), etag)
 
 
 @router.post("", response_model=BuildingResponse, status_code=status.HTTP_201_CREATED)
 async def create_building(
     data: BuildingCreate,
     interactor: FromDishka[CreateBuildingInteractor],
-) -> BuildingResponse:
+) -> Response:
     dto = CreateBuildingDTO(
         address=data.address,
         latitude=data.latitude,
         longitude=data.longitude,
     )
     building = await interactor(dto)
-    return BuildingResponse.model_validate(building)
+    return building_serializer.response(building, status_code=status.HTTP_201_CREATED)
@@ -1,83 +1,263 @@
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
-from secunda.application.dto import CreateOrganizationDTO, GeoSearchDTO
+from secunda.application.constants import MAX_PAGE_SIZE, NEAREST_MAX_DISTANCE_KM
+from secunda.application.dto import (
+    CreateOrganizationDTO,
+    GeoSearchDTO,
+    NearestSearchDTO,
+    OrganizationLoadProfileDTO,
+    OrganizationSearchDTO,
+    PageDTO,
+)
 from secunda.application.interactors import (
     CreateOrganizationInteractor,
+    GetActivityFacetsInteractor,
     GetOrganizationByIdInteractor,
+    GetOrganizationsByIdsInteractor,
     GetOrganizationsByActivityInteractor,
     GetOrganizationsByBuildingInteractor,
+    GetNearestOrganizationsInteractor,
     GetOrganizationsInGeoAreaInteractor,
+    GetOrganizationsInRadiusInteractor,
     SearchOrganizationsByNameInteractor,
+    SearchOrganizationsInteractor,
+)
+from secunda.presentation.conditional import get_organizations_entity_tag, with_entity_tag
+from secunda.presentation.dependencies import (
+    get_nearby_organization_fields,
+    get_organization_fields,
+    get_organization_search,
+    get_page,
+    get_required_ids,
 )
 from secunda.presentation.schemas import (
+    ActivityFacetResponse,
     GeoRadiusSearch,
     GeoRectangleSearch,
+    NearbyOrganizationResponse,
     OrganizationCreate,
     OrganizationResponse,
+    PageResponse,
+)
+from secunda.presentation.serialization import (
+    activity_facet_serializer,
+    nearby_organization_serializer,
+    organization_serializer,
 )
+from secunda.presentation.streaming import NDJSON_RESPONSES, ndjson_response, wants_ndjson
 
 router = APIRouter(prefix="/organizations", tags=["organizations"], route_class=DishkaRoute)
 
 
+def _load_profile(fields: set[str] | None) -> OrganizationLoadProfileDTO:
+    if fields is None:
+        return OrganizationLoadProfileDTO()
+    return OrganizationLoadProfileDTO(building="building" in fields, activities="activities" in fields)
+
+
+@router.get("", response_model=list[OrganizationResponse])
+async def get_organizations_by_ids(
+    ids: list[int] = Depends(get_required_ids),
+    fields: set[str] | None = Depends(get_organization_fields),
+    etag: str | None = Depends(get_organizations_entity_tag),
+    interactor: FromDishka[GetOrganizationsByIdsInteractor] = None,
+) -> Response:
+    organizations = await interactor(ids, _load_profile(fields))
+    return with_entity_tag(organization_serializer.list_response(organizations, fields), etag)
+
+
+# Declared before /{organization_id}, which would otherwise capture "search".
+@router.get(
+    "/search",
+    response_model=PageResponse[OrganizationResponse],
+    responses=NDJSON_RESPONSES,
+)
+async def search_organizations(
+    request: Request,
+    dto: OrganizationSearchDTO = Depends(get_organization_search),
+    page: PageDTO = Depends(get_page),
+    fields: set[str] | None = Depends(get_organization_fields),
+    etag: str | None = Depends(get_organizations_entity_tag),
+    interactor: FromDishka[SearchOrganizationsInteractor] = None,
+) -> Response:
+    profile = _load_profile(fields)
+    if wants_ndjson(request):
+        response = ndjson_response(interactor.stream(dto, profile), organization_serializer, fields)
+        return with_entity_tag(response, etag)
+    try:
+        organizations = await interactor(dto, page, profile)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return with_entity_tag(organization_serializer.page_response(organizations, fields), etag)
+
+
 @router.get("/{organization_id}", response_model=OrganizationResponse)
 async def get_organization(
     organization_id: int,
-    interactor: FromDishka[GetOrganizationByIdInteractor],
-) -> OrganizationResponse:
-    organization = await interactor(organization_id)
+    fields: set[str] | None = Depends(get_organization_fields),
+    etag: str | None = Depends(get_organizations_entity_tag),
+    interactor: FromDishka[GetOrganizationByIdInteractor] = None,
+) -> Response:
+    organization = await interactor(organization_id, _load_profile(fields))
     if not organization:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found")
-    return OrganizationResponse.model_validate(organization)
+    return with_entity_tag(organization_serializer.response(organization, fields=fields), etag)
 
 
-@router.get("/building/{building_id}", response_model=list[OrganizationResponse])
+@router.get(
+    "/building/{building_id}",
+    response_model=PageResponse[OrganizationResponse],
+    responses=NDJSON_RESPONSES,
+)
 async def get_organizations_by_building(
     building_id: int,
-    interactor: FromDishka[GetOrganizationsByBuildingInteractor],
-) -> list[OrganizationResponse]:
-    organizations = await interactor(building_id)
-    return [OrganizationResponse.model_validate(o) for o in organizations]
+    request: Request,
+    page: PageDTO = Depends(get_page),
+    fields: set[str] | None = Depends(get_organization_fields),
+    etag: str | None = Depends(get_organizations_entity_tag),
+    interactor: FromDishka[GetOrganizationsByBuildingInteractor] = None,
+) -> Response:
+    profile = _load_profile(fields)
+    if wants_ndjson(request):
+        response = ndjson_response(interactor.stream(building_id, profile), organization_serializer, fields)
+        return with_entity_tag(response, etag)
+    try:
+        organizations = await interactor(building_id, page, profile)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return with_entity_tag(organization_serializer.page_response(organizations, fields), etag)
 
 
-@router.get("/activity/{activity_id}", response_model=list[OrganizationResponse])
+@router.get(
+    "/activity/{activity_id}",
+    response_model=PageResponse[OrganizationResponse],
+    responses=NDJSON_RESPONSES,
+)
 async def get_organizations_by_activity(
     activity_id: int,
+    request: Request,
     include_children: bool = Query(True, description="Include child activities"),
+    page: PageDTO = Depends(get_page),
+    fields: set[str] | None = Depends(get_organization_fields),
+    etag: str | None = Depends(get_organizations_entity_tag),
     interactor: FromDishka[GetOrganizationsByActivityInteractor] = None,
-) -> list[OrganizationResponse]:
-    organizations = await interactor(activity_id, include_children)
-    return [OrganizationResponse.model_validate(o) for o in organizations]
+) -> Response:
+    profile = _load_profile(fields)
+    if wants_ndjson(request):
+        response = ndjson_response(
+            interactor.stream(activity_id, include_children, profile), organization_serializer, fields
+        )
+        return with_entity_tag(response, etag)
+    try:
+        organizations = await interactor(activity_id, page, include_children, profile)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return with_entity_tag(organization_serializer.page_response(organizations, fields), etag)
 
 
-@router.get("/search/name", response_model=list[OrganizationResponse])
+@router.get(
+    "/search/name",
+    response_model=PageResponse[OrganizationResponse],
+    responses=NDJSON_RESPONSES,
+)
 async def search_organizations_by_name(
+    request: Request,
     name: str = Query(..., min_length=1),
+    page: PageDTO = Depends(get_page),
+    fields: set[str] | None = Depends(get_organization_fields),
+    etag: str | None = Depends(get_organizations_entity_tag),
     interactor: FromDishka[SearchOrganizationsByNameInteractor] = None,
-) -> list[OrganizationResponse]:
-    organizations = await interactor(name)
-    return [OrganizationResponse.model_validate(o) for o in organizations]
+) -> Response:
+    profile = _load_profile(fields)
+    if wants_ndjson(request):
+        response = ndjson_response(interactor.stream(name, profile), organization_serializer, fields)
+        return with_entity_tag(response, etag)
+    try:
+        organizations = await interactor(name, page, profile)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return with_entity_tag(organization_serializer.page_response(organizations, fields), etag)
+
+
+@router.get("/search/facets", response_model=list[ActivityFacetResponse])
+async def get_activity_facets(
+    dto: OrganizationSearchDTO = Depends(get_organization_search),
+    etag: str | None = Depends(get_organizations_entity_tag),
+    interactor: FromDishka[GetActivityFacetsInteractor] = None,
+) -> Response:
+    # Same filters as /search; activities without matching organizations are left out.
+    try:
+        facets = await interactor(dto)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return with_entity_tag(activity_facet_serializer.list_response(facets), etag)
 
 
-@router.post("/search/radius", response_model=list[OrganizationResponse])
+@router.get("/search/nearest", response_model=list[NearbyOrganizationResponse])
+async def get_nearest_organizations(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    k: int = Query(10, ge=1, le=MAX_PAGE_SIZE, description="Сколько ближайших организаций вернуть"),
+    activity_id: int | None = Query(None, description="Только с этой деятельностью или вложенными в нее"),
+    max_distance_km: float = Query(
+        NEAREST_MAX_DISTANCE_KM, gt=0, le=NEAREST_MAX_DISTANCE_KM, description="Дальше этого не искать"
+    ),
+    fields: set[str] | None = Depends(get_nearby_organization_fields),
+    etag: str | None = Depends(get_organizations_entity_tag),
+    interactor: FromDishka[GetNearestOrganizationsInteractor] = None,
+) -> Response:
+    dto = NearestSearchDTO(
+        latitude=lat, longitude=lon, limit=k, activity_id=activity_id, max_distance_km=max_distance_km
+    )
+    try:
+        organizations = await interactor(dto, _load_profile(fields))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return with_entity_tag(nearby_organization_serializer.list_response(organizations, fields), etag)
+
+
+@router.post(
+    "/search/radius",
+    response_model=PageResponse[NearbyOrganizationResponse],
+    responses=NDJSON_RESPONSES,
+)
 async def get_organizations_in_radius(
     data: GeoRadiusSearch,
-    interactor: FromDishka[GetOrganizationsInGeoAreaInteractor],
-) -> list[OrganizationResponse]:
+    request: Request,
+    page: PageDTO = Depends(get_page),
+    fields: set[str] | None = Depends(get_nearby_organization_fields),
+    interactor: FromDishka[GetOrganizationsInRadiusInteractor] = None,
+) -> Response:
+    # Nearest first, each organization with its distance_km.
+    profile = _load_profile(fields)
     dto = GeoSearchDTO(
         latitude=data.latitude,
         longitude=data.longitude,
         radius_km=data.radius_km,
     )
-    organizations = await interactor(dto)
-    return [OrganizationResponse.model_validate(o) for o in organizations]
+    if wants_ndjson(request):
+        return ndjson_response(interactor.stream(dto, profile), nearby_organization_serializer, fields)
+    try:
+        organizations = await interactor(dto, page, profile)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return nearby_organization_serializer.page_response(organizations, fields)
 
 
-@router.post("/search/rectangle", response_model=list[OrganizationResponse])
+@router.post(
+    "/search/rectangle",
+    response_model=PageResponse[OrganizationResponse],
+    responses=NDJSON_RESPONSES,
+)
 async def get_organizations_in_rectangle(
     data: GeoRectangleSearch,
-    interactor: FromDishka[GetOrganizationsInGeoAreaInteractor],
-) -> list[OrganizationResponse]:
+    request: Request,
+    page: PageDTO = Depends(get_page),
+    fields: set[str] | None = Depends(get_organization_fields),
+    interactor: FromDishka[GetOrganizationsInGeoAreaInteractor] = None,
+) -> Response:
+    profile = _load_profile(fields)
     dto = GeoSearchDTO(
         latitude=0,
         longitude=0,
@@ -86,15 +266,20 @@ async def get_organizations_in_rectangle(
         min_lon=data.min_lon,
         max_lon=data.max_lon,
     )
-    organizations = await interactor(dto)
-    return [OrganizationResponse.model_validate(o) for o in organizations]
+    if wants_ndjson(request):
+        return ndjson_response(interactor.stream(dto, profile), organization_serializer, fields)
+    try:
+        organizations = await interactor(dto, page, profile)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return organization_serializer.page_response(organizations, fields)
 
 
 @router.post("", response_model=OrganizationResponse, status_code=status.HTTP_201_CREATED)
 async def create_organization(
     data: OrganizationCreate,
     interactor: FromDishka[CreateOrganizationInteractor],
-) -> OrganizationResponse:
+) -> Response:
     dto = CreateOrganizationDTO(
         name=data.name,
         phones=data.phones,
@@ -102,4 +287,4 @@ async def create_organization(
         activity_ids=data.activity_ids,
     )
     organization = await interactor(dto)
-    return OrganizationResponse.model_validate(organization)
+    return organization_serializer.response(organization, status_code=status.HTTP_201_CREATED)
@@ -1,5 +1,9 @@
+from typing import Generic, TypeVar
+
 from pydantic import BaseModel, Field
 
+T = TypeVar("T")
+
 
 class BuildingBase(BaseModel):
     address: str = Field(..., max_length=500)
@@ -34,6 +38,13 @@ class ActivityResponse(ActivityBase):
     model_config = {"from_attributes": True}
 
 
+class ActivityFacetResponse(ActivityBase):
+    id: int
+    level: int
+    parent_id: int | None = None
+    organizations_count: int
+
+
 class OrganizationBase(BaseModel):
     name: str = Field(..., max_length=255)
     phones: list[str] = Field(default_factory=list)
@@ -53,6 +64,10 @@ class OrganizationResponse(OrganizationBase):
     model_config = {"from_attributes": True}
 
 
+class NearbyOrganizationResponse(OrganizationResponse):
+    distance_km: float
+
+
 class GeoRadiusSearch(BaseModel):
     latitude: float = Field(..., ge=-90, le=90)
     longitude: float = Field(..., ge=-180, le=180)
@@ -64,3 +79,8 @@ class GeoRectangleSearch(BaseModel):
     max_lat: float = Field(..., ge=-90, le=90)
     min_lon: float = Field(..., ge=-180, le=180)
     max_lon: float = Field(..., ge=-180, le=180)
+
+
+class PageResponse(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
@@ -0,0 +1,74 @@
+from collections.abc import Iterable
+from typing import Any, Generic, TypeVar
+
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+from secunda.application.constants import MAX_ACTIVITY_NESTING_LEVEL
+from secunda.application.entities import (
+    ActivityEntity,
+    ActivityFacetEntity,
+    BuildingEntity,
+    NearbyOrganizationEntity,
+    OrganizationEntity,
+    Page,
+)
+
+T = TypeVar("T")
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def _activity_exclude(depth: int = MAX_ACTIVITY_NESTING_LEVEL) -> dict[str, Any]:
+    exclude: dict[str, Any] = {"created_at": True}
+    if depth > 1:
+        exclude["children"] = {"__all__": _activity_exclude(depth - 1)}
+    return exclude
+
+
+# Entity fields that are not part of the response schemas in presentation.schemas.
+BUILDING_EXCLUDE: dict[str, Any] = {"created_at": True}
+ACTIVITY_EXCLUDE = _activity_exclude()
+ORGANIZATION_EXCLUDE: dict[str, Any] = {
+    "created_at": True,
+    "building": BUILDING_EXCLUDE,
+    "activities": {"__all__": ACTIVITY_EXCLUDE},
+}
+
+
+# Entities are dumped to JSON by adapters compiled once. Routes keep their
+# response_model for the OpenAPI schema, but return a ready Response, so
+# FastAPI does not validate the payload a second time.
+class EntitySerializer(Generic[T]):
+    def __init__(self, entity_type: type[T], exclude: dict[str, Any]) -> None:
+        self._adapter = TypeAdapter(entity_type)
+        self._list_adapter = TypeAdapter(list[entity_type])
+        self._page_adapter = TypeAdapter(Page[entity_type])
+        self._exclude = exclude
+        self._list_exclude = {"__all__": exclude}
+        self._page_exclude = {"items": {"__all__": exclude}}
+
+    def dump(self, entity: T, fields: set[str] | None = None) -> bytes:
+        return self._adapter.dump_json(entity, include=fields, exclude=self._exclude)
+
+    def response(
+        self, entity: T, status_code: int = status.HTTP_200_OK, fields: set[str] | None = None
+    ) -> Response:
+        return Response(self.dump(entity, fields), status_code=status_code, media_type=JSON_MEDIA_TYPE)
+
+    def list_response(self, entities: Iterable[T], fields: set[str] | None = None) -> Response:
+        include = {"__all__": fields} if fields is not None else None
+        content = self._list_adapter.dump_json(list(entities), include=include, exclude=self._list_exclude)
+        return Response(content, media_type=JSON_MEDIA_TYPE)
+
+    def page_response(self, page: Page[T], fields: set[str] | None = None) -> Response:
+        include = {"items": {"__all__": fields}, "next_cursor": True} if fields is not None else None
+        content = self._page_adapter.dump_json(page, include=include, exclude=self._page_exclude)
+        return Response(content, media_type=JSON_MEDIA_TYPE)
+
+
+building_serializer = EntitySerializer(BuildingEntity, BUILDING_EXCLUDE)
+activity_serializer = EntitySerializer(ActivityEntity, ACTIVITY_EXCLUDE)
+activity_facet_serializer = EntitySerializer(ActivityFacetEntity, {})
+organization_serializer = EntitySerializer(OrganizationEntity, ORGANIZATION_EXCLUDE)
+nearby_organization_serializer = EntitySerializer(NearbyOrganizationEntity, ORGANIZATION_EXCLUDE)
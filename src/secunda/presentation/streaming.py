@@ -0,0 +1,38 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from secunda.presentation.serialization import EntitySerializer
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_CHUNK_SIZE = 64 * 1024
+
+NDJSON_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "content": {NDJSON_MEDIA_TYPE: {}},
+        "description": f"С заголовком Accept: {NDJSON_MEDIA_TYPE} все результаты отдаются потоком, по объекту на строку",
+    },
+}
+
+
+def wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response(
+    entities: AsyncIterator[Any], serializer: EntitySerializer[Any], fields: set[str] | None = None
+) -> StreamingResponse:
+    async def lines() -> AsyncIterator[bytes]:
+        chunk = bytearray()
+        async for entity in entities:
+            chunk += serializer.dump(entity, fields)
+            chunk += b"\n"
+            if len(chunk) >= NDJSON_CHUNK_SIZE:
+                yield bytes(chunk)
+                chunk.clear()
+        if chunk:
+            yield bytes(chunk)
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from secunda.application.entities import ActivityEntity
+from secunda.application.services import ActivityTree
+from secunda.infra.cache import ActivityTreeCache, generations, snapshot
+
+ACTIVITIES = [
+    ActivityEntity(id=5, name="Грузовые", level=2, parent_id=2),
+    ActivityEntity(id=1, name="Еда", level=1),
+    ActivityEntity(id=3, name="Мясная продукция", level=2, parent_id=1),
+    ActivityEntity(id=2, name="Автомобили", level=1),
+    ActivityEntity(id=6, name="Запчасти", level=3, parent_id=4),
+    ActivityEntity(id=4, name="Легковые", level=2, parent_id=2),
+    ActivityEntity(id=7, name="Молочная продукция", level=2, parent_id=1),
+    ActivityEntity(id=8, name="Сироты", level=2, parent_id=99),
+]
+
+
+def test_descendant_ids_cover_subtree() -> None:
+    tree = ActivityTree(ACTIVITIES)
+
+    assert len(tree) == 8
+    assert tree.descendant_ids(1) == [1, 3, 7]
+    assert tree.descendant_ids(2) == [2, 4, 6, 5]
+    assert tree.descendant_ids(6) == [6]
+    assert tree.descendant_ids(42) == []
+
+
+def test_builds_children_without_touching_input() -> None:
+    tree = ActivityTree(ACTIVITIES)
+
+    assert [root.id for root in tree.roots()] == [1, 2, 8]
+    car = tree.get(2)
+    assert car is not None
+    assert [child.id for child in car.children] == [4, 5]
+    assert [child.id for child in car.children[0].children] == [6]
+    assert all(activity.children == [] for activity in ACTIVITIES)
+    assert tree.get(42) is None
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(snapshot, "time", clock)
+    monkeypatch.setattr(generations, "time", clock)
+    return clock
+
+
+class TreeLoader:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> ActivityTree:
+        self.calls += 1
+        return ActivityTree(ACTIVITIES[: self.calls])
+
+
+def test_snapshot_is_reloaded_after_ttl(clock: FakeClock) -> None:
+    cache = ActivityTreeCache(ttl_seconds=60.0)
+    loader = TreeLoader()
+
+    first = asyncio.run(cache.get(loader))
+    clock.now += 59.0
+    assert asyncio.run(cache.get(loader)) is first
+    clock.now += 1.0
+    assert len(asyncio.run(cache.get(loader))) == 2
+    assert loader.calls == 2
+
+
+def test_update_applies_to_kept_snapshot(clock: FakeClock) -> None:
+    cache = ActivityTreeCache()
+    loader = TreeLoader()
+    tree = asyncio.run(cache.get(loader))
+    applied: list[ActivityTree] = []
+
+    cache.update(applied.append)
+
+    assert applied == [tree]
+    assert asyncio.run(cache.get(loader)) is tree
+    cache.invalidate()
+    assert len(asyncio.run(cache.get(loader))) == 2
+
+
+def test_snapshot_racing_invalidate_is_not_kept(clock: FakeClock) -> None:
+    cache = ActivityTreeCache()
+    loader = TreeLoader()
+
+    async def racing() -> ActivityTree:
+        cache.invalidate()
+        return await loader()
+
+    assert len(asyncio.run(cache.get(racing))) == 1
+    assert len(asyncio.run(cache.get(loader))) == 2
+    assert len(asyncio.run(cache.get(loader))) == 2
+
+
+def test_snapshot_is_not_kept_while_replicas_settle(clock: FakeClock) -> None:
+    cache = ActivityTreeCache(settle_seconds=5.0)
+    loader = TreeLoader()
+
+    cache.invalidate()
+    assert len(asyncio.run(cache.get(loader))) == 1
+    assert len(asyncio.run(cache.get(loader))) == 2
+    clock.now += 5.0
+    assert len(asyncio.run(cache.get(loader))) == 3
+    assert len(asyncio.run(cache.get(loader))) == 3
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from secunda.infra.repositories.loader import BatchLoader
+
+
+class FakeSource:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.batches: list[list[int]] = []
+        self._error = error
+
+    async def load_many(self, keys: list[int]) -> dict[int, str]:
+        self.batches.append(keys)
+        await asyncio.sleep(0)
+        if self._error is not None:
+            raise self._error
+        return {key: f"value-{key}" for key in keys if key % 2 == 0}
+
+
+def test_coalesces_keys_of_one_iteration() -> None:
+    source = FakeSource()
+    loader = BatchLoader(source.load_many)
+
+    async def run() -> list[str | None]:
+        return await asyncio.gather(*(loader.load(key) for key in [2, 4, 2, 3]))
+
+    assert asyncio.run(run()) == ["value-2", "value-4", "value-2", None]
+    assert source.batches == [[2, 4, 3]]
+
+
+def test_later_iterations_get_new_batch() -> None:
+    source = FakeSource()
+    loader = BatchLoader(source.load_many)
+
+    async def run() -> None:
+        assert await loader.load(2) == "value-2"
+        assert await asyncio.gather(loader.load(2), loader.load(6)) == ["value-2", "value-6"]
+
+    asyncio.run(run())
+
+    assert source.batches == [[2], [2, 6]]
+
+
+def test_splits_by_max_batch_size() -> None:
+    source = FakeSource()
+    loader = BatchLoader(source.load_many, max_batch_size=2)
+
+    async def run() -> list[str | None]:
+        return await asyncio.gather(*(loader.load(key) for key in range(5)))
+
+    assert asyncio.run(run()) == ["value-0", None, "value-2", None, "value-4"]
+    assert source.batches == [[0, 1], [2, 3], [4]]
+
+
+def test_error_reaches_every_waiter() -> None:
+    error = RuntimeError("database is down")
+    loader = BatchLoader(FakeSource(error).load_many)
+
+    async def run() -> list[object]:
+        return await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), return_exceptions=True)
+
+    assert asyncio.run(run()) == [error, error, error]
+
+
+def test_cancelled_caller_does_not_cancel_batch() -> None:
+    source = FakeSource()
+    loader = BatchLoader(source.load_many)
+
+    async def run() -> str | None:
+        cancelled = asyncio.create_task(loader.load(2))
+        other = asyncio.create_task(loader.load(2))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        return await other
+
+    assert asyncio.run(run()) == "value-2"
+    assert source.batches == [[2]]
@@ -0,0 +1,141 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from secunda.infra.bulk.loader import organization_records, resolve_activities
+from secunda.infra.bulk.readers import batched, parse_optional_int, parse_phones, read_records
+
+
+def test_resolve_activities_assigns_level_and_path() -> None:
+    records = [
+        {"id": "9", "name": "Запчасти", "parent_id": "4"},
+        {"id": "1", "name": "Еда", "parent_id": ""},
+        {"id": "4", "name": "Легковые", "parent_id": "2"},
+        {"id": "2", "name": "Автомобили", "parent_id": None},
+        {"id": "3", "name": "Мясная продукция", "parent_id": "1"},
+    ]
+
+    rows = resolve_activities(records, existing={})
+
+    assert {row[0]: row for row in rows} == {
+        1: (1, "Еда", None, 1, "1/"),
+        2: (2, "Автомобили", None, 1, "2/"),
+        3: (3, "Мясная продукция", 1, 2, "1/3/"),
+        4: (4, "Легковые", 2, 2, "2/4/"),
+        9: (9, "Запчасти", 4, 3, "2/4/9/"),
+    }
+    levels = [row[3] for row in rows]
+    assert levels == sorted(levels)
+
+
+def test_resolve_activities_attaches_to_existing_parents() -> None:
+    rows = resolve_activities([{"id": 7, "name": "Шины", "parent_id": 4}], existing={4: (2, "2/4/")})
+
+    assert rows == [(7, "Шины", 4, 3, "2/4/7/")]
+
+
+@pytest.mark.parametrize(
+    "records",
+    [
+        [{"id": 1, "name": "A", "parent_id": 1}],
+        [{"id": 1, "name": "A", "parent_id": 2}, {"id": 2, "name": "B", "parent_id": 1}],
+        [
+            {"id": 1, "name": "A", "parent_id": 3},
+            {"id": 2, "name": "B", "parent_id": 1},
+            {"id": 3, "name": "C", "parent_id": 2},
+        ],
+    ],
+)
+def test_resolve_activities_rejects_cycles(records: list[dict]) -> None:
+    with pytest.raises(ValueError, match="Цикл в дереве деятельностей"):
+        resolve_activities(records, existing={})
+
+
+def test_resolve_activities_rejects_unknown_parent() -> None:
+    records = [{"id": 1, "name": "A", "parent_id": ""}, {"id": 2, "name": "B", "parent_id": 42}]
+
+    with pytest.raises(ValueError, match="Неизвестная родительская деятельность: 42"):
+        resolve_activities(records, existing={1: (1, "1/")})
+
+
+@pytest.mark.parametrize(
+    ("records", "existing"),
+    [
+        (
+            [
+                {"id": 1, "name": "A", "parent_id": None},
+                {"id": 2, "name": "B", "parent_id": 1},
+                {"id": 3, "name": "C", "parent_id": 2},
+                {"id": 4, "name": "D", "parent_id": 3},
+            ],
+            {},
+        ),
+        ([{"id": 4, "name": "D", "parent_id": 3}], {3: (3, "1/2/3/")}),
+    ],
+)
+def test_resolve_activities_enforces_depth_limit(records: list[dict], existing: dict) -> None:
+    with pytest.raises(ValueError, match="Максимальный уровень вложенности: 3"):
+        resolve_activities(records, existing)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, []),
+        ("", []),
+        ('["8-800-555-35-35", "8-495-000-00-00"]', ["8-800-555-35-35", "8-495-000-00-00"]),
+        ("  [\"1\"] ", ["1"]),
+        ("8-800-555-35-35; 8-495-000-00-00;", ["8-800-555-35-35", "8-495-000-00-00"]),
+        ("8-800-555-35-35", ["8-800-555-35-35"]),
+        (["8-800", 123], ["8-800", "123"]),
+        (79991234567, ["79991234567"]),
+    ],
+)
+def test_parse_phones(value: object, expected: list[str]) -> None:
+    assert parse_phones(value) == expected
+
+
+@pytest.mark.parametrize(("value", "expected"), [(None, None), ("", None), ("12", 12), (7, 7)])
+def test_parse_optional_int(value: object, expected: int | None) -> None:
+    assert parse_optional_int(value) == expected
+
+
+def test_read_records_csv(tmp_path: Path) -> None:
+    path = tmp_path / "organizations.csv"
+    path.write_text(
+        'id,name,phones,building_id\n1,"ООО ""Рога""",8-800;8-495,3\n2,ИП Иванов,,3\n', encoding="utf-8"
+    )
+
+    rows = list(organization_records(read_records(path)))
+
+    assert rows == [
+        (1, 'ООО "Рога"', '["8-800", "8-495"]', 3),
+        (2, "ИП Иванов", "[]", 3),
+    ]
+
+
+def test_read_records_ndjson(tmp_path: Path) -> None:
+    path = tmp_path / "organizations.JSONL"
+    records = [
+        {"id": 1, "name": "Рога", "phones": ["8-800"], "building_id": 3},
+        {"id": 2, "name": "Копыта", "building_id": 4},
+    ]
+    path.write_text("\n".join(json.dumps(record, ensure_ascii=False) for record in records) + "\n\n", encoding="utf-8")
+
+    rows = list(organization_records(read_records(path)))
+
+    assert rows == [(1, "Рога", '["8-800"]', 3), (2, "Копыта", "[]", 4)]
+
+
+def test_read_records_rejects_unknown_format(tmp_path: Path) -> None:
+    path = tmp_path / "organizations.json"
+    path.write_text("[]", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Неподдерживаемый формат файла"):
+        list(read_records(path))
+
+
+def test_batched() -> None:
+    assert list(batched(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(batched(iter([]), 2)) == []
@@ -0,0 +1,112 @@
+from collections.abc import Iterator
+
+import pytest
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+
+from secunda.application.constants import BUILDINGS_CACHE_GROUP
+from secunda.application.interfaces import TableVersionsProtocol
+from secunda.infra.cache import InMemoryResponseCache
+from secunda.presentation.conditional import get_buildings_entity_tag, with_entity_tag
+
+
+class FakeTableVersions:
+    def __init__(self) -> None:
+        self.version: str | None = "1"
+
+    async def current(self, *groups: str) -> str | None:
+        return self.version
+
+
+@pytest.fixture
+def versions() -> FakeTableVersions:
+    return FakeTableVersions()
+
+
+def _app(versions: TableVersionsProtocol) -> FastAPI:
+    provider = Provider(scope=Scope.APP)
+    provider.provide(lambda: versions, provides=TableVersionsProtocol)
+    app = FastAPI()
+
+    @app.get("/buildings")
+    async def get_buildings(etag: str | None = Depends(get_buildings_entity_tag)) -> Response:
+        return with_entity_tag(Response(content="[]", media_type="application/json"), etag)
+
+    setup_dishka(make_async_container(provider), app)
+    return app
+
+
+@pytest.fixture
+def client(versions: FakeTableVersions) -> Iterator[TestClient]:
+    with TestClient(_app(versions)) as client:
+        yield client
+
+
+def test_response_carries_entity_tag(client: TestClient) -> None:
+    response = client.get("/buildings")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"].startswith('"')
+    assert response.headers["Cache-Control"] == "no-cache"
+    assert response.headers["Vary"] == "Accept"
+
+
+@pytest.mark.parametrize("if_none_match", ["{etag}", "W/{etag}", '"other", {etag}', "*"])
+def test_matching_tag_returns_not_modified(client: TestClient, if_none_match: str) -> None:
+    etag = client.get("/buildings").headers["ETag"]
+
+    response = client.get("/buildings", headers={"If-None-Match": if_none_match.format(etag=etag)})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert response.headers["Cache-Control"] == "no-cache"
+
+
+def test_stale_tag_returns_body(client: TestClient) -> None:
+    response = client.get("/buildings", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.text == "[]"
+
+
+def test_version_bump_changes_tag(client: TestClient, versions: FakeTableVersions) -> None:
+    etag = client.get("/buildings").headers["ETag"]
+    versions.version = "2"
+
+    response = client.get("/buildings", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_tag_depends_on_query_and_representation(client: TestClient) -> None:
+    etag = client.get("/buildings").headers["ETag"]
+
+    assert client.get("/buildings?limit=5").headers["ETag"] != etag
+    assert client.get("/buildings", headers={"Accept": "application/x-ndjson"}).headers["ETag"] != etag
+
+
+def test_no_tag_without_shared_versions(client: TestClient, versions: FakeTableVersions) -> None:
+    versions.version = None
+
+    response = client.get("/buildings", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    assert "Cache-Control" not in response.headers
+
+
+@pytest.mark.parametrize("single_process", [True, False])
+def test_local_versions_tag_single_worker(single_process: bool) -> None:
+    cache = InMemoryResponseCache(ttl_seconds=30.0, max_entries=10, single_process=single_process)
+
+    with TestClient(_app(cache)) as client:
+        etag = client.get("/buildings").headers.get("ETag")
+        assert (etag is not None) == single_process
+        if single_process:
+            assert client.get("/buildings", headers={"If-None-Match": etag}).status_code == 304
+            client.portal.call(cache.invalidate, BUILDINGS_CACHE_GROUP)
+            assert client.get("/buildings", headers={"If-None-Match": etag}).status_code == 200
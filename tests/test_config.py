@@ -0,0 +1,50 @@
+import pytest
+
+from secunda.infra.config import PostgresSettings
+
+
+def _settings(**values: object) -> PostgresSettings:
+    return PostgresSettings(_env_file=None, **values)  # type: ignore[call-arg]
+
+
+def test_pool_limits_default_to_pool_settings() -> None:
+    settings = _settings(pool_size=10, max_overflow=5, workers=4)
+
+    assert settings.pool_limits() == (10, 5)
+    assert settings.pool_pre_ping is False
+
+
+@pytest.mark.parametrize(
+    ("values", "limits"),
+    [
+        ({"max_connections": 100, "workers": 4}, (12, 13)),
+        ({"max_connections": 100, "workers": 1}, (50, 50)),
+        ({"max_connections": 40, "workers": 3, "pool_size": 10, "max_overflow": 0}, (13, 0)),
+        ({"max_connections": 3, "workers": 8}, (1, 0)),
+    ],
+)
+def test_pool_limits_split_budget_between_workers(values: dict[str, int], limits: tuple[int, int]) -> None:
+    assert _settings(**values).pool_limits() == limits
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 5, 8, 16])
+@pytest.mark.parametrize("max_connections", [16, 50, 97, 200])
+def test_pool_limits_stay_within_budget(workers: int, max_connections: int) -> None:
+    pool_size, max_overflow = _settings(max_connections=max_connections, workers=workers).pool_limits()
+
+    assert pool_size >= 1 and max_overflow >= 0
+    assert (pool_size + max_overflow) * workers <= max_connections
+
+
+def test_workers_read_from_web_concurrency(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+    monkeypatch.setenv("POSTGRES_MAX_CONNECTIONS", "40")
+
+    assert _settings().pool_limits() == (5, 5)
+
+
+def test_replica_lag_only_with_replicas() -> None:
+    replica_urls = ["postgresql+asyncpg://replica/secunda"]
+
+    assert _settings(read_your_writes_seconds=3.0).replica_lag_seconds() == 0.0
+    assert _settings(read_your_writes_seconds=3.0, replica_urls=replica_urls).replica_lag_seconds() == 3.0
@@ -0,0 +1,62 @@
+import base64
+import json
+
+import pytest
+from sqlalchemy import select
+
+from secunda.application.dto import PageDTO
+from secunda.application.services import CursorCodec
+from secunda.infra.database.models import BuildingModel
+from secunda.infra.repositories.pagination import paginate_by_id
+
+
+def _raw(payload: str) -> str:
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("values", [(1,), (0.875, 42), ("ул. Ленина", 7), (None, -1)])
+def test_round_trip(values: tuple) -> None:
+    cursor = CursorCodec.encode(*values)
+
+    assert "=" not in cursor
+    assert CursorCodec.decode(cursor, len(values)) == list(values)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "!!!",
+        "abc",
+        _raw("not json"),
+        _raw('{"id": 1}'),
+        _raw("17"),
+        _raw("[1, 2]"),
+        _raw("[]"),
+        base64.urlsafe_b64encode(b"\xff\xfe[1]").decode(),
+    ],
+)
+def test_rejects_tampered_cursor(cursor: str) -> None:
+    with pytest.raises(ValueError, match="Некорректный курсор"):
+        CursorCodec.decode(cursor, 1)
+
+
+def test_rejects_wrong_size() -> None:
+    with pytest.raises(ValueError, match="Некорректный курсор"):
+        CursorCodec.decode(CursorCodec.encode(0.5, 3), 1)
+
+
+@pytest.mark.parametrize("after_id", ["5", 1.5, None, [1]])
+def test_paginate_rejects_non_integer_id(after_id: object) -> None:
+    page = PageDTO(limit=10, cursor=_raw(json.dumps([after_id])))
+
+    with pytest.raises(ValueError, match="Некорректный курсор"):
+        paginate_by_id(select(BuildingModel), BuildingModel.id, page)
+
+
+def test_paginate_continues_after_cursor() -> None:
+    page = PageDTO(limit=10, cursor=CursorCodec.encode(41))
+
+    stmt = paginate_by_id(select(BuildingModel), BuildingModel.id, page)
+
+    assert stmt.compile().params["id_1"] == 41
@@ -0,0 +1,44 @@
+import math
+import random
+
+import pytest
+
+from secunda.application.services import BoundingBox, GeoService
+
+
+def _destination(lat: float, lon: float, distance_km: float, bearing: float) -> tuple[float, float]:
+    angle = distance_km / GeoService.EARTH_RADIUS_KM
+    phi, lam = math.radians(lat), math.radians(lon)
+    phi2 = math.asin(math.sin(phi) * math.cos(angle) + math.cos(phi) * math.sin(angle) * math.cos(bearing))
+    lam2 = lam + math.atan2(
+        math.sin(bearing) * math.sin(angle) * math.cos(phi), math.cos(angle) - math.sin(phi) * math.sin(phi2)
+    )
+    return math.degrees(phi2), (math.degrees(lam2) + 540.0) % 360.0 - 180.0
+
+
+def _inside(box: BoundingBox, lat: float, lon: float) -> bool:
+    return box.min_lat <= lat <= box.max_lat and box.min_lon <= lon <= box.max_lon
+
+
+@pytest.mark.parametrize(
+    ("lat", "lon", "radius_km", "boxes"),
+    [
+        (55.75, 37.6, 10.0, 1),
+        (89.9, 10.0, 50.0, 1),
+        (-89.95, 170.0, 30.0, 1),
+        (0.5, 179.95, 100.0, 2),
+        (-1.0, -179.99, 60.0, 2),
+        (60.0, 0.0, 25_000.0, 1),
+    ],
+)
+def test_cap_boxes_cover_circle(lat: float, lon: float, radius_km: float, boxes: int) -> None:
+    cap = GeoService.cap_boxes(lat, lon, radius_km)
+
+    assert len(cap) == boxes
+    assert all(-90.0 <= box.min_lat <= box.max_lat <= 90.0 for box in cap)
+    assert all(-180.0 <= box.min_lon <= box.max_lon <= 180.0 for box in cap)
+    rng = random.Random(0)
+    for _ in range(5000):
+        distance = radius_km * (1.0 - rng.random() ** 4)
+        point_lat, point_lon = _destination(lat, lon, distance, rng.uniform(0.0, 2 * math.pi))
+        assert any(_inside(box, point_lat, point_lon) for box in cap), (point_lat, point_lon)
@@ -0,0 +1,96 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from secunda.infra.metrics import MetricsMiddleware, instrument_repository, metrics_endpoint
+from secunda.infra.metrics.collectors import PoolCollector, _count_statement
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict[str, int]:
+        for _ in range(3):
+            _count_statement()
+        return {"id": item_id}
+
+    app.add_route("/metrics", metrics_endpoint)
+    app.add_middleware(MetricsMiddleware)
+    return app
+
+
+def test_requests_are_labelled_by_route_template() -> None:
+    route = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    requests = _sample("secunda_http_request_duration_seconds_count", **route)
+    statements = _sample("secunda_sql_statements_per_request_sum", route="/items/{item_id}")
+    unmatched = _sample("secunda_http_request_duration_seconds_count", method="GET", route="unmatched", status="404")
+
+    with TestClient(_app()) as client:
+        assert client.get("/items/1").status_code == 200
+        assert client.get("/items/2").status_code == 200
+        assert client.get("/missing").status_code == 404
+        body = client.get("/metrics").text
+
+    assert _sample("secunda_http_request_duration_seconds_count", **route) == requests + 2
+    assert _sample("secunda_sql_statements_per_request_sum", route="/items/{item_id}") == statements + 6
+    assert (
+        _sample("secunda_http_request_duration_seconds_count", method="GET", route="unmatched", status="404")
+        == unmatched + 1
+    )
+    assert 'route="/items/{item_id}"' in body
+    assert "/items/1" not in body
+
+
+@instrument_repository
+class FakeRepository:
+    async def get_by_id(self, item_id: int) -> int:
+        return item_id
+
+    async def _load(self) -> None:
+        return None
+
+    def stream(self) -> list[int]:
+        return []
+
+
+def test_instrument_repository_times_public_coroutines() -> None:
+    labels = {"repository": "FakeRepository", "method": "get_by_id"}
+    calls = _sample("secunda_repository_call_duration_seconds_count", **labels)
+    repository = FakeRepository()
+
+    assert asyncio.run(repository.get_by_id(7)) == 7
+    assert _sample("secunda_repository_call_duration_seconds_count", **labels) == calls + 1
+    assert FakeRepository.get_by_id.__name__ == "get_by_id"
+    assert not hasattr(FakeRepository._load, "__wrapped__")
+    assert not hasattr(FakeRepository.stream, "__wrapped__")
+
+
+class FakePool:
+    def size(self) -> int:
+        return 5
+
+    def checkedout(self) -> int:
+        return 7
+
+    def overflow(self) -> int:
+        return -3
+
+
+def test_pool_collector_reads_pools_on_scrape() -> None:
+    collector = PoolCollector()
+    collector.add("primary", FakePool())  # type: ignore[arg-type]
+
+    samples = {metric.name: metric.samples[0].value for metric in collector.collect()}
+
+    assert samples == {
+        "secunda_db_pool_size": 5,
+        "secunda_db_pool_connections_in_use": 7,
+        "secunda_db_pool_overflow_connections": 0,
+    }
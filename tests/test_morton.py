@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from secunda.application.services import BoundingBox, MortonCode
+
+
+def _boxes(seed: int) -> list[BoundingBox]:
+    rng = random.Random(seed)
+    boxes = []
+    for size in (0.0001, 0.01, 0.5, 10.0, 90.0):
+        for _ in range(20):
+            min_lat, min_lon = rng.uniform(-90.0, 90.0 - size), rng.uniform(-180.0, 180.0 - size)
+            lat_size, lon_size = rng.uniform(0.0, size), rng.uniform(0.0, size)
+            boxes.append(BoundingBox(min_lat, min_lat + lat_size, min_lon, min_lon + lon_size))
+    boxes.append(BoundingBox(-90.0, 90.0, -180.0, 180.0))
+    boxes.append(BoundingBox(55.75, 55.75, 37.6, 37.6))
+    return boxes
+
+
+def _inside(box: BoundingBox, rng: random.Random) -> list[tuple[float, float]]:
+    corners = [(lat, lon) for lat in (box.min_lat, box.max_lat) for lon in (box.min_lon, box.max_lon)]
+    return corners + [
+        (rng.uniform(box.min_lat, box.max_lat), rng.uniform(box.min_lon, box.max_lon)) for _ in range(200)
+    ]
+
+
+@pytest.mark.parametrize("box", _boxes(0))
+def test_ranges_cover_box(box: BoundingBox) -> None:
+    ranges = MortonCode.ranges(box)
+
+    assert 1 <= len(ranges) <= MortonCode.MAX_RANGES
+    assert all(low <= high for low, high in ranges)
+    assert all(previous[1] + 1 < low for previous, (low, _) in zip(ranges, ranges[1:]))
+    for lat, lon in _inside(box, random.Random(1)):
+        key = MortonCode.encode(lat, lon)
+        assert any(low <= key <= high for low, high in ranges), (lat, lon)
+
+
+def test_ranges_tighten_small_box() -> None:
+    ranges = MortonCode.ranges(BoundingBox(55.7, 55.8, 37.5, 37.7))
+
+    covered = sum(high - low + 1 for low, high in ranges)
+    assert covered < MortonCode.encode(90.0, 180.0) // 1_000_000
+
+
+def test_encode_orders_quadrants() -> None:
+    assert MortonCode.encode(-90.0, -180.0) == 0
+    assert MortonCode.encode(90.0, 180.0) == (1 << 2 * MortonCode.BITS) - 1
+    assert MortonCode.encode(-1.0, -1.0) < MortonCode.encode(1.0, -1.0) < MortonCode.encode(-1.0, 1.0)
@@ -0,0 +1,63 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from secunda.application.services import OrganizationNameNormalizer
+from secunda.application.services.name_normalizer import LEGAL_FORMS
+from secunda.infra.database.models import SEARCH_NAME_SQL
+
+MIGRATIONS = Path(__file__).parents[1] / "src/secunda/infra/migrations/alembic/versions"
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ('ООО "Рога и Копыта"', "рога и копыта"),
+        ("ООО «Рога и Копыта»", "рога и копыта"),
+        ("Рога и Копыта, ООО", "рога и копыта,"),
+        ("ИП. Иванов", "иванов"),
+        ("ЗАО „Молоко“", "молоко"),
+        ("ПАО 'Банк'", "банк"),
+        ("ФГУП «Почта»", "почта"),
+        ("АО `Ёлка`", "елка"),
+        ("Тсж-12", "-12"),
+    ],
+)
+def test_drops_legal_forms_and_quotes(name: str, expected: str) -> None:
+    assert OrganizationNameNormalizer.normalize(name) == expected
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Каоо", "каоо"),
+        ("Иполит", "иполит"),
+        ("Зоопарк ао2", "зоопарк ао2"),
+        ("ООО_Мир", "ооо_мир"),
+        ("Aoo", "aoo"),
+    ],
+)
+def test_keeps_legal_forms_inside_words(name: str, expected: str) -> None:
+    assert OrganizationNameNormalizer.normalize(name) == expected
+
+
+def test_collapses_whitespace() -> None:
+    assert OrganizationNameNormalizer.normalize("  Молочный \t  «  Мир »\n") == "молочный мир"
+
+
+def test_same_key_for_spelling_variants() -> None:
+    variants = ['ООО "Ёжик"', "ежик", "«ЁЖИК» ооо.", "  Ежик  "]
+
+    assert {OrganizationNameNormalizer.normalize(name) for name in variants} == {"ежик"}
+
+
+def test_search_name_column_matches_normalizer() -> None:
+    # Migrations cannot import the application, so they carry their own copy of the expression.
+    spec = importlib.util.spec_from_file_location("search_name", MIGRATIONS / "004_organization_search_name.py")
+    assert spec is not None and spec.loader is not None
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    assert migration.LEGAL_FORMS.split("|") == list(LEGAL_FORMS)
+    assert "".join(migration.SEARCH_NAME_SQL.split()) == "".join(SEARCH_NAME_SQL.split())
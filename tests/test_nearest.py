@@ -0,0 +1,109 @@
+import asyncio
+import random
+from typing import Any
+
+import pytest
+from sqlalchemy import Select
+
+from secunda.application.dto import NearestSearchDTO, OrganizationLoadProfileDTO
+from secunda.application.services import GeoService, GridSpatialIndex
+from secunda.infra.cache import BuildingIndexCache
+from secunda.infra.repositories.organization import OrganizationRepository
+
+ID_PROFILE = OrganizationLoadProfileDTO(building=False, activities=False)
+
+
+def _buildings(seed: int) -> dict[int, tuple[float, float]]:
+    rng = random.Random(seed)
+    return {building_id: (rng.uniform(55.5, 56.0), rng.uniform(37.3, 37.9)) for building_id in range(1, 2001)}
+
+
+BUILDINGS = _buildings(0)
+# Most buildings hold no organization, so a search needs several rounds.
+ORGANIZATIONS = {
+    building_id: [building_id * 10 + offset for offset in range(building_id % 3 + 1)]
+    for building_id in BUILDINGS
+    if building_id % 7 == 0
+}
+
+
+class FakeResult(list):
+    pass
+
+
+class FakeSession:
+    # Answers the nearest statement the way Postgres would: organizations of the bound buildings,
+    # ordered by distance and id, up to the limit.
+    def __init__(self) -> None:
+        self.rounds: list[int] = []
+
+    async def execute(self, stmt: Select) -> FakeResult:
+        params = stmt.compile().params
+        building_ids, distances = [value for value in params.values() if isinstance(value, list)]
+        [limit] = [value for value in params.values() if isinstance(value, int)]
+        self.rounds.append(len(building_ids))
+        rows = [
+            (organization_id, "name", [], building_id, None, distance)
+            for building_id, distance in zip(building_ids, distances)
+            for organization_id in ORGANIZATIONS.get(building_id, [])
+        ]
+        rows.sort(key=lambda row: (row[-1], row[0]))
+        return FakeResult(rows[:limit])
+
+
+def _repository(session: FakeSession) -> OrganizationRepository:
+    async def load() -> GridSpatialIndex:
+        index = GridSpatialIndex(cell_size_deg=0.05)
+        for building_id, (lat, lon) in BUILDINGS.items():
+            index.add(building_id, lat, lon)
+        return index
+
+    cache = BuildingIndexCache()
+    asyncio.run(cache.get(load))
+    return OrganizationRepository(session, cache, 0.05)  # type: ignore[arg-type]
+
+
+def _brute_force(lat: float, lon: float, max_distance_km: float) -> list[int]:
+    found = []
+    for building_id, organization_ids in ORGANIZATIONS.items():
+        distance = GeoService.haversine_distance(lat, lon, *BUILDINGS[building_id])
+        if distance <= max_distance_km:
+            found.extend((distance, organization_id) for organization_id in organization_ids)
+    return [organization_id for _, organization_id in sorted(found)]
+
+
+@pytest.mark.parametrize(("limit", "max_distance_km"), [(1, 100.0), (40, 100.0), (150, 100.0), (500, 5.0)])
+def test_nearest_matches_brute_force_across_rounds(limit: int, max_distance_km: float) -> None:
+    session = FakeSession()
+    dto = NearestSearchDTO(latitude=55.75, longitude=37.6, limit=limit, max_distance_km=max_distance_km)
+
+    nearest = asyncio.run(_repository(session).get_nearest(dto, ID_PROFILE))
+
+    assert [organization.id for organization in nearest] == _brute_force(55.75, 37.6, max_distance_km)[:limit]
+    distances = [organization.distance_km for organization in nearest]
+    assert distances == sorted(distances)
+
+
+def test_nearest_rounds_double() -> None:
+    session = FakeSession()
+    dto = NearestSearchDTO(latitude=55.75, longitude=37.6, limit=40)
+
+    asyncio.run(_repository(session).get_nearest(dto, ID_PROFILE))
+
+    assert session.rounds == [40, 80, 160]
+
+
+def test_nearest_stops_once_limit_is_found() -> None:
+    session = FakeSession()
+    dto = NearestSearchDTO(latitude=55.75, longitude=37.6, limit=5)
+
+    assert len(asyncio.run(_repository(session).get_nearest(dto, ID_PROFILE))) == 5
+    assert session.rounds == [16]
+
+
+def test_nearest_far_from_buildings_is_empty() -> None:
+    session = FakeSession()
+    dto = NearestSearchDTO(latitude=10.0, longitude=10.0, limit=5, max_distance_km=50.0)
+
+    assert asyncio.run(_repository(session).get_nearest(dto, ID_PROFILE)) == []
+    assert session.rounds == []
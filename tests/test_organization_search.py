@@ -0,0 +1,101 @@
+import asyncio
+from typing import Any
+
+import pytest
+from sqlalchemy import Select
+from sqlalchemy.dialects import postgresql
+
+from secunda.application.dto import GeoSearchDTO, OrganizationLoadProfileDTO, OrganizationSearchDTO, PageDTO
+from secunda.application.services import GridSpatialIndex
+from secunda.infra.cache import BuildingIndexCache
+from secunda.infra.repositories.organization import OrganizationRepository
+
+ID_PROFILE = OrganizationLoadProfileDTO(building=False, activities=False)
+RADIUS = GeoSearchDTO(latitude=55.75, longitude=37.6, radius_km=5.0)
+
+
+class FakeResult(list):
+    def all(self) -> list[Any]:
+        return list(self)
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.statements: list[Select] = []
+
+    async def execute(self, stmt: Select) -> FakeResult:
+        self.statements.append(stmt)
+        return FakeResult()
+
+
+def _sql(stmt: Select) -> str:
+    return " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+
+
+def _index_cache() -> BuildingIndexCache:
+    async def load() -> GridSpatialIndex:
+        index = GridSpatialIndex(cell_size_deg=0.05)
+        index.add(3, 55.75, 37.6)
+        index.add(4, 55.76, 37.61)
+        index.add(9, 10.0, 10.0)
+        return index
+
+    cache = BuildingIndexCache()
+    asyncio.run(cache.get(load))
+    return cache
+
+
+def _search(geo_backend: str, dto: OrganizationSearchDTO) -> tuple[FakeSession, Any]:
+    session = FakeSession()
+    repository = OrganizationRepository(session, _index_cache(), 0.05, geo_backend)  # type: ignore[arg-type]
+    page = asyncio.run(repository.search(dto, PageDTO(limit=10), ID_PROFILE))
+    return session, page
+
+
+@pytest.mark.parametrize("geo_backend", ["gist", "morton"])
+def test_all_filters_in_one_statement(geo_backend: str) -> None:
+    session, page = _search(geo_backend, OrganizationSearchDTO(activity_id=2, name='ООО "Рога"', area=RADIUS))
+
+    assert page.items == []
+    [stmt] = session.statements
+    sql = _sql(stmt)
+    assert "EXISTS (SELECT" in sql
+    assert "organizations.search_name %%>" in sql
+    assert "organizations.building_id IN (SELECT buildings.id" in sql
+    assert "ORDER BY word_similarity(" in sql and "DESC, organizations.id" in sql
+    assert "LIMIT" in sql
+    assert "JOIN buildings" not in sql.split("WHERE")[0]
+
+
+def test_memory_backend_binds_building_ids() -> None:
+    session, _ = _search("memory", OrganizationSearchDTO(activity_id=2, area=RADIUS))
+
+    [stmt] = session.statements
+    sql = _sql(stmt)
+    assert "organizations.building_id = ANY (" in sql
+    assert "word_similarity" not in sql
+    assert "ORDER BY organizations.id" in sql
+    assert sorted(stmt.compile().params.values(), key=str)[-1] == [3, 4]
+
+
+def test_full_profile_joins_building() -> None:
+    session = FakeSession()
+    repository = OrganizationRepository(session, _index_cache(), 0.05, "gist")  # type: ignore[arg-type]
+
+    asyncio.run(repository.search(OrganizationSearchDTO(activity_id=2), PageDTO(limit=10)))
+
+    assert "JOIN buildings ON buildings.id = organizations.building_id" in _sql(session.statements[0])
+
+
+@pytest.mark.parametrize(
+    "dto",
+    [
+        OrganizationSearchDTO(name="ООО"),
+        OrganizationSearchDTO(activity_id=2, area=GeoSearchDTO(latitude=0.0, longitude=0.0, radius_km=1.0)),
+    ],
+)
+def test_empty_search_skips_database(dto: OrganizationSearchDTO) -> None:
+    session, page = _search("memory", dto)
+
+    assert page.items == []
+    assert session.statements == []
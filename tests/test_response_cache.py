@@ -0,0 +1,121 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from secunda.infra.cache import InMemoryResponseCache, generations, response
+
+GROUP = "buildings"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(response, "time", clock)
+    monkeypatch.setattr(generations, "time", clock)
+    return clock
+
+
+class CountingLoader:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> list[int]:
+        self.calls += 1
+        return [self.calls]
+
+
+def _load(cache: InMemoryResponseCache, key: str, loader: Callable[[], Awaitable[list[int]]]) -> list[int]:
+    return asyncio.run(cache.get_or_load(GROUP, key, list[int], loader))
+
+
+def test_serves_cached_value_until_ttl(clock: FakeClock) -> None:
+    cache = InMemoryResponseCache(ttl_seconds=30.0, max_entries=10)
+    loader = CountingLoader()
+
+    assert _load(cache, "key", loader) == [1]
+    clock.now += 29.0
+    assert _load(cache, "key", loader) == [1]
+    clock.now += 2.0
+    assert _load(cache, "key", loader) == [2]
+    assert loader.calls == 2
+
+
+def test_evicts_least_recently_used(clock: FakeClock) -> None:
+    cache = InMemoryResponseCache(ttl_seconds=30.0, max_entries=2)
+    loader = CountingLoader()
+
+    _load(cache, "a", loader)
+    _load(cache, "b", loader)
+    _load(cache, "a", loader)
+    _load(cache, "c", loader)
+
+    assert len(cache) == 2
+    assert _load(cache, "a", loader) == [1]
+    assert _load(cache, "b", loader) == [4]
+
+
+def test_invalidate_hides_entries_of_group(clock: FakeClock) -> None:
+    cache = InMemoryResponseCache(ttl_seconds=30.0, max_entries=10)
+    loader = CountingLoader()
+
+    async def run() -> None:
+        assert await cache.get_or_load(GROUP, "key", list[int], loader) == [1]
+        assert await cache.get_or_load("activities", "key", list[int], loader) == [2]
+        await cache.invalidate(GROUP)
+        assert await cache.get_or_load(GROUP, "key", list[int], loader) == [3]
+        assert await cache.get_or_load("activities", "key", list[int], loader) == [2]
+
+    asyncio.run(run())
+
+
+def test_load_racing_invalidate_is_not_kept(clock: FakeClock) -> None:
+    cache = InMemoryResponseCache(ttl_seconds=30.0, max_entries=10)
+    loader = CountingLoader()
+
+    async def racing() -> list[int]:
+        await cache.invalidate(GROUP)
+        return await loader()
+
+    async def run() -> None:
+        assert await cache.get_or_load(GROUP, "key", list[int], racing) == [1]
+        assert len(cache) == 0
+        assert await cache.get_or_load(GROUP, "key", list[int], loader) == [2]
+        assert await cache.get_or_load(GROUP, "key", list[int], loader) == [2]
+
+    asyncio.run(run())
+
+
+def test_loads_are_not_kept_while_replicas_settle(clock: FakeClock) -> None:
+    cache = InMemoryResponseCache(ttl_seconds=30.0, max_entries=10, settle_seconds=5.0)
+    loader = CountingLoader()
+
+    asyncio.run(cache.invalidate(GROUP))
+    assert _load(cache, "key", loader) == [1]
+    assert _load(cache, "key", loader) == [2]
+    assert len(cache) == 0
+    clock.now += 5.0
+    assert _load(cache, "key", loader) == [3]
+    assert _load(cache, "key", loader) == [3]
+
+
+def test_versions_skip_settling_groups(clock: FakeClock) -> None:
+    cache = InMemoryResponseCache(ttl_seconds=30.0, max_entries=10, settle_seconds=5.0, single_process=True)
+
+    async def run() -> None:
+        version = await cache.current(GROUP)
+        assert version is not None
+        await cache.invalidate(GROUP)
+        assert await cache.current(GROUP) is None
+        clock.now += 5.0
+        assert await cache.current(GROUP) not in (None, version)
+
+    asyncio.run(run())
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from secunda.infra.cache import NullResponseCache, SingleFlightResponseCache
+
+GROUP = "organizations"
+
+
+class FakeLoader:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> list[int]:
+        self.calls += 1
+        call = self.calls
+        await self.release.wait()
+        return [call]
+
+
+def test_followers_share_leader_load() -> None:
+    cache = SingleFlightResponseCache(NullResponseCache())
+
+    async def run() -> None:
+        loader = FakeLoader()
+        tasks = [asyncio.create_task(cache.get_or_load(GROUP, "key", list[int], loader)) for _ in range(3)]
+        other = asyncio.create_task(cache.get_or_load(GROUP, "other", list[int], loader))
+        await asyncio.sleep(0)
+        loader.release.set()
+
+        assert await asyncio.gather(*tasks) == [[1], [1], [1]]
+        assert await other == [2]
+        assert loader.calls == 2
+        assert len(cache) == 0
+
+    asyncio.run(run())
+
+
+def test_follower_restarts_load_of_cancelled_leader() -> None:
+    cache = SingleFlightResponseCache(NullResponseCache())
+
+    async def run() -> None:
+        loader = FakeLoader()
+        leader = asyncio.create_task(cache.get_or_load(GROUP, "key", list[int], loader))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.get_or_load(GROUP, "key", list[int], loader))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        loader.release.set()
+
+        assert await follower == [2]
+        assert loader.calls == 2
+
+    asyncio.run(run())
+
+
+def test_cancelled_follower_leaves_leader_running() -> None:
+    cache = SingleFlightResponseCache(NullResponseCache())
+
+    async def run() -> None:
+        loader = FakeLoader()
+        leader = asyncio.create_task(cache.get_or_load(GROUP, "key", list[int], loader))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.get_or_load(GROUP, "key", list[int], loader))
+        await asyncio.sleep(0)
+        follower.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        loader.release.set()
+
+        assert await leader == [1]
+        assert loader.calls == 1
+
+    asyncio.run(run())
+
+
+def test_invalidate_detaches_in_flight_loads() -> None:
+    cache = SingleFlightResponseCache(NullResponseCache())
+
+    async def run() -> None:
+        loader = FakeLoader()
+        before = asyncio.create_task(cache.get_or_load(GROUP, "key", list[int], loader))
+        await asyncio.sleep(0)
+        await cache.invalidate(GROUP)
+        after = asyncio.create_task(cache.get_or_load(GROUP, "key", list[int], loader))
+        await asyncio.sleep(0)
+        loader.release.set()
+
+        assert await before == [1]
+        assert await after == [2]
+        assert len(cache) == 0
+
+    asyncio.run(run())
+
+
+def test_leader_error_reaches_followers() -> None:
+    cache = SingleFlightResponseCache(NullResponseCache())
+    release = asyncio.Event()
+
+    async def failing() -> list[int]:
+        await release.wait()
+        raise RuntimeError("database is down")
+
+    async def run() -> list[object]:
+        tasks = [asyncio.create_task(cache.get_or_load(GROUP, "key", list[int], failing)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    errors = asyncio.run(run())
+
+    assert [type(error) for error in errors] == [RuntimeError, RuntimeError]
+    assert len(cache) == 0
@@ -0,0 +1,76 @@
+import json
+from collections.abc import Iterator
+
+import pytest
+from fastapi import Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+
+from secunda.application.dto import OrganizationLoadProfileDTO
+from secunda.application.entities import ActivityEntity, BuildingEntity, OrganizationEntity, Page
+from secunda.presentation.dependencies import get_organization_fields
+from secunda.presentation.routers.organizations import _load_profile
+from secunda.presentation.serialization import organization_serializer
+
+ORGANIZATION = OrganizationEntity(
+    id=1,
+    name="Рога и Копыта",
+    phones=["8-800-555-35-35"],
+    building_id=3,
+    building=BuildingEntity(id=3, address="Ленина, 1", latitude=55.75, longitude=37.6),
+    activities=[ActivityEntity(id=2, name="Еда", level=1)],
+)
+
+
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    app = FastAPI()
+
+    @app.get("/organizations")
+    async def get_organizations(fields: set[str] | None = Depends(get_organization_fields)) -> Response:
+        return organization_serializer.page_response(Page([ORGANIZATION], "next"), fields)
+
+    with TestClient(app) as client:
+        yield client
+
+
+def test_all_fields_by_default(client: TestClient) -> None:
+    body = client.get("/organizations").json()
+
+    assert set(body["items"][0]) == {"id", "name", "phones", "building_id", "building", "activities"}
+    assert body["next_cursor"] == "next"
+
+
+def test_only_requested_fields(client: TestClient) -> None:
+    response = client.get("/organizations", params={"fields": " name, id ,,"})
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {"items": [{"id": 1, "name": "Рога и Копыта"}], "next_cursor": "next"}
+
+
+@pytest.mark.parametrize(
+    ("fields", "detail"),
+    [
+        ("name,created_at,secret", "Неизвестные поля: created_at,secret"),
+        (" , ", "Пустой список полей"),
+    ],
+)
+def test_rejects_unknown_or_empty_fields(client: TestClient, fields: str, detail: str) -> None:
+    response = client.get("/organizations", params={"fields": fields})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": detail}
+
+
+@pytest.mark.parametrize(
+    ("fields", "profile"),
+    [
+        (None, OrganizationLoadProfileDTO(building=True, activities=True)),
+        ({"id", "name"}, OrganizationLoadProfileDTO(building=False, activities=False)),
+        ({"id", "building"}, OrganizationLoadProfileDTO(building=True, activities=False)),
+        ({"activities"}, OrganizationLoadProfileDTO(building=False, activities=True)),
+    ],
+)
+def test_load_profile_skips_unrequested_relations(
+    fields: set[str] | None, profile: OrganizationLoadProfileDTO
+) -> None:
+    assert _load_profile(fields) == profile
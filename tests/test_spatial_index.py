@@ -0,0 +1,136 @@
+import math
+import random
+
+import pytest
+
+from secunda.application.services import GeoService, GridSpatialIndex
+
+
+def _points(seed: int) -> dict[int, tuple[float, float]]:
+    rng = random.Random(seed)
+    points = {}
+    for building_id in range(4000):
+        if building_id < 1000:
+            lat, lon = rng.uniform(88.0, 90.0), rng.uniform(-180.0, 180.0)
+        elif building_id < 1500:
+            lat, lon = rng.uniform(-90.0, -88.0), rng.uniform(-180.0, 180.0)
+        elif building_id < 2000:
+            lat, lon = rng.uniform(-3.0, 3.0), rng.choice([rng.uniform(179.0, 180.0), rng.uniform(-180.0, -179.0)])
+        else:
+            lat, lon = rng.uniform(55.5, 56.0), rng.uniform(37.3, 37.9)
+        points[building_id] = (lat, lon)
+    return points
+
+
+@pytest.fixture(scope="module")
+def points() -> dict[int, tuple[float, float]]:
+    return _points(0)
+
+
+@pytest.fixture(scope="module")
+def index(points: dict[int, tuple[float, float]]) -> GridSpatialIndex:
+    index = GridSpatialIndex(cell_size_deg=0.05)
+    for building_id, (lat, lon) in points.items():
+        index.add(building_id, lat, lon)
+    return index
+
+
+def _distances(points: dict[int, tuple[float, float]], lat: float, lon: float) -> list[tuple[float, int]]:
+    return sorted(
+        (GeoService.haversine_distance(lat, lon, point_lat, point_lon), building_id)
+        for building_id, (point_lat, point_lon) in points.items()
+    )
+
+
+QUERIES = [
+    (55.75, 37.6, 1.0),
+    (55.75, 37.6, 10.0),
+    (55.9, 37.4, 0.2),
+    (89.9, 10.0, 50.0),
+    (89.2, -120.0, 200.0),
+    (-89.95, 170.0, 30.0),
+    (0.5, 179.95, 100.0),
+    (-1.0, -179.99, 60.0),
+    (10.0, 10.0, 100.0),
+]
+
+
+@pytest.mark.parametrize(("lat", "lon", "radius_km"), QUERIES)
+def test_in_radius_matches_brute_force(
+    index: GridSpatialIndex, points: dict[int, tuple[float, float]], lat: float, lon: float, radius_km: float
+) -> None:
+    found = index.in_radius(lat, lon, radius_km)
+
+    expected = [building_id for distance, building_id in _distances(points, lat, lon) if distance <= radius_km]
+    assert len(found) == len(set(found))
+    assert sorted(found) == sorted(expected)
+
+
+@pytest.mark.parametrize(("lat", "lon", "radius_km"), QUERIES)
+def test_nearest_in_radius_orders_by_distance(
+    index: GridSpatialIndex, points: dict[int, tuple[float, float]], lat: float, lon: float, radius_km: float
+) -> None:
+    found = index.nearest_in_radius(lat, lon, radius_km)
+
+    expected = [pair for pair in _distances(points, lat, lon) if pair[0] <= radius_km]
+    assert [building_id for building_id, _ in found] == [building_id for _, building_id in expected]
+    assert [distance for _, distance in found] == pytest.approx([distance for distance, _ in expected])
+
+
+def test_in_rectangle_matches_brute_force(index: GridSpatialIndex, points: dict[int, tuple[float, float]]) -> None:
+    found = index.in_rectangle(55.6, 55.8, 37.4, 37.7)
+
+    expected = [
+        building_id
+        for building_id, (lat, lon) in points.items()
+        if 55.6 <= lat <= 55.8 and 37.4 <= lon <= 37.7
+    ]
+    assert sorted(found) == sorted(expected)
+
+
+@pytest.mark.parametrize(("lat", "lon", "max_distance_km"), [(*query[:2], math.inf) for query in QUERIES] + QUERIES)
+def test_iter_nearest_yields_brute_force_order(
+    index: GridSpatialIndex,
+    points: dict[int, tuple[float, float]],
+    lat: float,
+    lon: float,
+    max_distance_km: float,
+) -> None:
+    found = [pair for batch in index.iter_nearest(lat, lon, max_distance_km) for pair in batch]
+
+    expected = [pair for pair in _distances(points, lat, lon) if pair[0] <= max_distance_km]
+    assert sorted(building_id for building_id, _ in found) == sorted(building_id for _, building_id in expected)
+    distances = [distance for _, distance in found]
+    assert distances == sorted(distances)
+    assert distances == pytest.approx([distance for distance, _ in expected])
+
+
+def test_iter_nearest_stops_early(index: GridSpatialIndex) -> None:
+    batches = index.iter_nearest(55.75, 37.6)
+
+    first = next(batches)
+
+    assert first
+    assert len(first) < len(index)
+
+
+def test_iter_nearest_only_restricts_candidates(
+    index: GridSpatialIndex, points: dict[int, tuple[float, float]]
+) -> None:
+    only = [2100, 2500, 3999, 10]
+
+    found = [building_id for batch in index.iter_nearest(55.75, 37.6, only=only) for building_id, _ in batch]
+
+    expected = [building_id for _, building_id in _distances(points, 55.75, 37.6) if building_id in only]
+    assert found == expected
+
+
+def test_iter_nearest_far_from_data_is_empty(index: GridSpatialIndex) -> None:
+    assert list(index.iter_nearest(30.0, 60.0, max_distance_km=100.0)) == []
+
+
+def test_empty_index() -> None:
+    index = GridSpatialIndex()
+
+    assert index.in_radius(55.75, 37.6, 10.0) == []
+    assert list(index.iter_nearest(55.75, 37.6)) == []
@@ -0,0 +1,67 @@
+import json
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from secunda.infra.metrics import SqlTraceMiddleware
+from secunda.infra.metrics.tracing import SqlTrace, sql_trace, statement_shape
+
+
+@pytest.mark.parametrize(
+    ("statement", "shape"),
+    [
+        ("SELECT * FROM buildings WHERE id = $1", "SELECT * FROM buildings WHERE id = ?"),
+        ("SELECT *\n  FROM   buildings\tWHERE id = 42  ", "SELECT * FROM buildings WHERE id = ?"),
+        ("SELECT * FROM buildings WHERE id = %(id_1)s::BIGINT", "SELECT * FROM buildings WHERE id = ?::BIGINT"),
+        ("SELECT * FROM activities_1 WHERE level < 3.5", "SELECT * FROM activities_1 WHERE level < ?"),
+        ("SELECT * FROM t WHERE name = 'O''Brien' OR name = ''", "SELECT * FROM t WHERE name = ? OR name = ?"),
+        ("SELECT * FROM t WHERE id IN ($1, $2,$3)", "SELECT * FROM t WHERE id IN (?, ...)"),
+        ("SELECT * FROM t WHERE id IN (1, 2, 3, 4)", "SELECT * FROM t WHERE id IN (?, ...)"),
+    ],
+)
+def test_statement_shape(statement: str, shape: str) -> None:
+    assert statement_shape(statement) == shape
+
+
+def test_same_query_with_other_ids_has_one_shape() -> None:
+    trace = SqlTrace()
+    for building_id in range(5):
+        trace.record(f"SELECT * FROM organizations WHERE building_id = {building_id}", 0.001)
+    trace.record("SELECT * FROM buildings WHERE id IN (1, 2)", 0.002)
+    trace.record("SELECT * FROM buildings WHERE id IN (3, 4, 5)", 0.002)
+
+    assert trace.repeated_shapes(2) == [("SELECT * FROM organizations WHERE building_id = ?", 5)]
+    assert trace.repeated_shapes(5) == []
+    assert trace.duration == pytest.approx(0.009)
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/organizations")
+    async def get_organizations() -> list[int]:
+        trace = sql_trace.get()
+        assert trace is not None
+        for building_id in range(4):
+            trace.record(f"SELECT id FROM organizations WHERE building_id = {building_id}", 0.0005)
+        return []
+
+    app.add_middleware(SqlTraceMiddleware, n_plus_one_threshold=3)
+    return app
+
+
+def test_middleware_reports_statements_and_flags_repeats(caplog: pytest.LogCaptureFixture) -> None:
+    with TestClient(_app()) as client, caplog.at_level(logging.INFO, "secunda.infra.metrics.tracing"):
+        response = client.get("/organizations")
+
+    assert response.headers["X-SQL-Statements"] == "4"
+    assert float(response.headers["X-SQL-Duration-Ms"]) == pytest.approx(2.0)
+    [log] = caplog.records
+    assert log.levelno == logging.WARNING
+    record = json.loads(log.getMessage())
+    assert record["route"] == "/organizations"
+    assert record["statements"] == 4
+    assert record["n_plus_one"] == [{"statement": "SELECT id FROM organizations WHERE building_id = ?", "count": 4}]
+    assert sql_trace.get() is None